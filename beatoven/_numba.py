@@ -0,0 +1,18 @@
+"""
+Optional Numba: njit/prange when installed, plain-Python stand-ins otherwise.
+
+Kernels decorated with this njit run unchanged (just slower) without Numba.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels still run as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,29 @@
+"""
+Canonical JSON bytes for hashing (frame provenance, job ids).
+
+One serializer everywhere, stdlib json only, so a digest never depends on
+which optional packages a deployment has installed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+
+
+def _to_builtin(obj: Any) -> Any:
+    """json default=: numpy scalars and arrays as their Python values."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def stable_json(obj: Any) -> bytes:
+    """Sorted-key, compact, UTF-8 JSON; the byte form hashed across the package."""
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_to_builtin
+    ).encode("utf-8")
@@ -111,16 +111,7 @@ async def analyze_media(
             confidence=media_frame.confidence,
             perceived_era=media_frame.perceived_era,
             era_confidence=media_frame.era_confidence,
-            resonance_metrics={
-                "complexity": resonance_frame.metrics.complexity,
-                "emotional_intensity": resonance_frame.metrics.emotional_intensity,
-                "groove": resonance_frame.metrics.groove,
-                "energy": resonance_frame.metrics.energy,
-                "density": resonance_frame.metrics.density,
-                "swing": resonance_frame.metrics.swing,
-                "brightness": resonance_frame.metrics.brightness,
-                "tension": resonance_frame.metrics.tension,
-            } if resonance_frame.metrics else {},
+            resonance_metrics=resonance_frame.metrics.to_dict() if resonance_frame.metrics else {},
             provider_status=sem_engine.capabilities()["providers"] if enable_semantic else [],
         )
     finally:
@@ -7,14 +7,32 @@ Exports WAV/FLAC with ONNX mel-spectrogram and provenance hash.
 
 import hashlib
 import struct
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from pathlib import Path
 import io
 
 
+@lru_cache(maxsize=8)
+def _hann(n_fft: int) -> np.ndarray:
+    """Symmetric float32 Hann window, cached per n_fft (treat as read-only)."""
+    return np.hanning(n_fft).astype(np.float32)
+
+
+@lru_cache(maxsize=4)
+def _time_base(n_samples: int, sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only (t, 2*pi*t) vectors for a stem length, cached per length and rate."""
+    t = np.arange(n_samples) * (1.0 / sample_rate)
+    two_pi_t = 2 * np.pi * t
+    t.flags.writeable = False
+    two_pi_t.flags.writeable = False
+    return t, two_pi_t
+
+
 class StemType(Enum):
     """Stem categories."""
     DRUMS = "drums"
@@ -133,13 +151,39 @@ class StemGenerator:
         self,
         sample_rate: int = 44100,
         bit_depth: int = 16,
-        seed: int = 0
+        seed: int = 0,
+        backend: Optional[str] = None
     ):
         self.sample_rate = sample_rate
         self.bit_depth = bit_depth
         self.seed = seed
         self._rng = np.random.default_rng(seed)
 
+        # Spectrogram backend: "torch" when CUDA is available, else "numpy"
+        self._torch = None
+        self._torch_device = "cpu"
+        self._mel_mat_torch: Dict[Tuple[int, int, int], Any] = {}
+        self._backend = "numpy"
+        self._init_backend(backend)
+
+    def _init_backend(self, backend: Optional[str]):
+        """Select the spectrogram backend, falling back to NumPy."""
+        if backend == "numpy":
+            return
+        try:
+            import torch
+        except ImportError:
+            return
+
+        if backend == "torch":
+            self._torch = torch
+            self._torch_device = "cuda" if torch.cuda.is_available() else "cpu"
+            self._backend = "torch"
+        elif backend is None and torch.cuda.is_available():
+            self._torch = torch
+            self._torch_device = "cuda"
+            self._backend = "torch"
+
     def generate_stems(
         self,
         rhythm_events: Optional[List[Dict]] = None,
@@ -165,19 +209,28 @@ class StemGenerator:
             stem_types = list(StemType)
 
         n_samples = int(duration * self.sample_rate)
+        t, two_pi_t = _time_base(n_samples, self.sample_rate)
         stems = {}
 
         for stem_type in stem_types:
             if stem_type == StemType.DRUMS:
                 samples = self._generate_drum_stem(rhythm_events, n_samples)
             elif stem_type == StemType.BASS:
-                samples = self._generate_bass_stem(harmonic_events, n_samples)
+                samples = self._generate_bass_stem(
+                    harmonic_events, n_samples, t, two_pi_t
+                )
             elif stem_type == StemType.LEADS:
-                samples = self._generate_lead_stem(harmonic_events, n_samples)
+                samples = self._generate_lead_stem(
+                    harmonic_events, n_samples, t, two_pi_t
+                )
             elif stem_type == StemType.MIDS:
-                samples = self._generate_mid_stem(harmonic_events, n_samples)
+                samples = self._generate_mid_stem(
+                    harmonic_events, n_samples, two_pi_t
+                )
             elif stem_type == StemType.PADS:
-                samples = self._generate_pad_stem(harmonic_events, n_samples)
+                samples = self._generate_pad_stem(
+                    harmonic_events, n_samples, t, two_pi_t
+                )
             elif stem_type == StemType.ATMOS:
                 samples = self._generate_atmos_stem(n_samples)
             elif stem_type == StemType.FULL_MIX:
@@ -248,15 +301,16 @@ class StemGenerator:
     def _generate_bass_stem(
         self,
         events: Optional[List[Dict]],
-        n_samples: int
+        n_samples: int,
+        t: np.ndarray,
+        two_pi_t: np.ndarray
     ) -> np.ndarray:
         """Generate bass stem."""
         samples = np.zeros(n_samples * 2, dtype=np.float32)
-        t = np.arange(n_samples) / self.sample_rate
 
         # Simple bass line
         freq = 55  # A1
-        bass = np.sin(2 * np.pi * freq * t) * 0.3
+        bass = np.sin(freq * two_pi_t) * 0.3
 
         # Apply envelope
         env = np.minimum(t * 10, 1) * np.exp(-t * 0.5)
@@ -272,16 +326,17 @@ class StemGenerator:
     def _generate_lead_stem(
         self,
         events: Optional[List[Dict]],
-        n_samples: int
+        n_samples: int,
+        t: np.ndarray,
+        two_pi_t: np.ndarray
     ) -> np.ndarray:
         """Generate lead stem."""
         samples = np.zeros(n_samples * 2, dtype=np.float32)
-        t = np.arange(n_samples) / self.sample_rate
 
         # Simple lead
         freq = 440
-        lead = np.sin(2 * np.pi * freq * t) * 0.2
-        lead += np.sin(2 * np.pi * freq * 2 * t) * 0.1
+        lead = np.sin(freq * two_pi_t) * 0.2
+        lead += np.sin(freq * 2 * two_pi_t) * 0.1
 
         env = np.exp(-t * 0.3)
         lead *= env
@@ -295,15 +350,15 @@ class StemGenerator:
     def _generate_mid_stem(
         self,
         events: Optional[List[Dict]],
-        n_samples: int
+        n_samples: int,
+        two_pi_t: np.ndarray
     ) -> np.ndarray:
         """Generate mid-frequency stem."""
         samples = np.zeros(n_samples * 2, dtype=np.float32)
-        t = np.arange(n_samples) / self.sample_rate
 
         # Chord stab
         freqs = [261.63, 329.63, 392.0]  # C major
-        mid = sum(np.sin(2 * np.pi * f * t) for f in freqs) * 0.15 / len(freqs)
+        mid = sum(np.sin(f * two_pi_t) for f in freqs) * 0.15 / len(freqs)
 
         for i, s in enumerate(mid):
             samples[i * 2] = s
@@ -314,15 +369,16 @@ class StemGenerator:
     def _generate_pad_stem(
         self,
         events: Optional[List[Dict]],
-        n_samples: int
+        n_samples: int,
+        t: np.ndarray,
+        two_pi_t: np.ndarray
     ) -> np.ndarray:
         """Generate pad stem."""
         samples = np.zeros(n_samples * 2, dtype=np.float32)
-        t = np.arange(n_samples) / self.sample_rate
 
         # Soft pad
         freqs = [130.81, 164.81, 196.0, 261.63]  # C major 7
-        pad = sum(np.sin(2 * np.pi * f * t) for f in freqs) * 0.1 / len(freqs)
+        pad = sum(np.sin(f * two_pi_t) for f in freqs) * 0.1 / len(freqs)
 
         # Slow attack
         env = 1 - np.exp(-t * 0.5)
@@ -387,46 +443,74 @@ class StemGenerator:
         """Export stem to WAV file."""
         path = Path(path)
         samples = (stem.samples * 32767).astype(np.int16)
+        data_size = len(samples) * 2
+
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16,                     # Chunk size
+            1,                               # Audio format (PCM)
+            stem.channels,
+            stem.sample_rate,
+            stem.sample_rate * stem.channels * 2,
+            stem.channels * 2,
+            16,                              # Bits per sample
+            b'data', data_size
+        )
 
-        with open(path, 'wb') as f:
-            # RIFF header
-            f.write(b'RIFF')
-            data_size = len(samples) * 2
-            f.write(struct.pack('<I', 36 + data_size))
-            f.write(b'WAVE')
-
-            # fmt chunk
-            f.write(b'fmt ')
-            f.write(struct.pack('<I', 16))  # Chunk size
-            f.write(struct.pack('<H', 1))   # Audio format (PCM)
-            f.write(struct.pack('<H', stem.channels))
-            f.write(struct.pack('<I', stem.sample_rate))
-            f.write(struct.pack('<I', stem.sample_rate * stem.channels * 2))
-            f.write(struct.pack('<H', stem.channels * 2))
-            f.write(struct.pack('<H', 16))  # Bits per sample
-
-            # data chunk
-            f.write(b'data')
-            f.write(struct.pack('<I', data_size))
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(header)
             f.write(samples.tobytes())
 
         return stem.metadata.provenance_hash if stem.metadata else ""
 
+    def export_flac(self, stem: Stem, path: Path) -> str:
+        """Export stem to 16-bit FLAC file (requires soundfile)."""
+        try:
+            import soundfile as sf
+        except ImportError:
+            raise ImportError("soundfile required for FLAC export")
+
+        path = Path(path)
+        sf.write(
+            str(path),
+            stem.samples.reshape(-1, stem.channels),
+            stem.sample_rate,
+            subtype='PCM_16',
+            format='FLAC'
+        )
+
+        return stem.metadata.provenance_hash if stem.metadata else ""
+
     def export_all(
         self,
         stems: Dict[StemType, Stem],
         output_dir: Path,
-        prefix: str = "stem"
+        prefix: str = "stem",
+        fmt: ExportFormat = ExportFormat.WAV
     ) -> Dict[StemType, str]:
-        """Export all stems to directory."""
+        """Export all stems to directory, writing files in parallel."""
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        provenance_hashes = {}
-        for stem_type, stem in stems.items():
-            filename = f"{prefix}_{stem_type.value}.wav"
-            path = output_dir / filename
-            provenance_hashes[stem_type] = self.export_wav(stem, path)
+        if not stems:
+            return {}
+
+        export = self.export_flac if fmt == ExportFormat.FLAC else self.export_wav
+
+        # File writes and libsndfile encoding release the GIL
+        with ThreadPoolExecutor(max_workers=min(4, len(stems))) as pool:
+            futures = {
+                stem_type: pool.submit(
+                    export, stem,
+                    output_dir / f"{prefix}_{stem_type.value}.{fmt.value}"
+                )
+                for stem_type, stem in stems.items()
+            }
+            provenance_hashes = {
+                stem_type: future.result()
+                for stem_type, future in futures.items()
+            }
 
         return provenance_hashes
 
@@ -441,30 +525,36 @@ class StemGenerator:
         # Simple mel spectrogram computation
         samples = stem.samples[::2] if stem.channels == 2 else stem.samples
 
-        # Pad to frame boundary
-        pad_length = n_fft - (len(samples) % hop_length)
-        samples = np.pad(samples, (0, pad_length))
-
-        # Compute STFT
-        n_frames = (len(samples) - n_fft) // hop_length + 1
-        stft = np.zeros((n_fft // 2 + 1, n_frames), dtype=np.complex128)
-
-        window = np.hanning(n_fft)
-        for i in range(n_frames):
-            start = i * hop_length
-            frame = samples[start:start + n_fft] * window
-            stft[:, i] = np.fft.rfft(frame)
-
-        # Convert to power spectrum
-        power = np.abs(stft) ** 2
-
-        # Create mel filterbank
-        mel_filters = self._create_mel_filterbank(
-            stem.sample_rate, n_fft, n_mels
-        )
+        # Pad so the last hop still gets a complete n_fft frame
+        n_in = len(samples)
+        n_frames = max(1, (n_in + hop_length - 1) // hop_length)
+        needed = (n_frames - 1) * hop_length + n_fft
+        padded = np.empty(max(n_in, needed), dtype=np.float32)
+        padded[:n_in] = samples
+        padded[n_in:] = 0
+
+        if self._backend == "torch":
+            mel_spec = self._mel_torch(
+                padded, stem.sample_rate, n_mels, n_fft, hop_length, n_frames
+            )
+        else:
+            # Compute STFT over strided frame views (frames x n_fft)
+            frames = np.lib.stride_tricks.sliding_window_view(
+                padded, n_fft
+            )[::hop_length][:n_frames]
+            window = _hann(n_fft)
+            stft = np.fft.rfft(frames * window, axis=1).T
+
+            # Convert to power spectrum
+            power = np.abs(stft) ** 2
+
+            # Create mel filterbank
+            mel_filters = self._create_mel_filterbank(
+                stem.sample_rate, n_fft, n_mels
+            )
 
-        # Apply mel filterbank
-        mel_spec = np.dot(mel_filters, power)
+            # Apply mel filterbank
+            mel_spec = np.dot(mel_filters, power)
 
         # Convert to dB
         mel_spec = 10 * np.log10(mel_spec + 1e-10)
@@ -477,6 +567,42 @@ class StemGenerator:
             n_fft=n_fft
         )
 
+    def _mel_torch(
+        self,
+        padded: np.ndarray,
+        sample_rate: int,
+        n_mels: int,
+        n_fft: int,
+        hop_length: int,
+        n_frames: int
+    ) -> np.ndarray:
+        """Compute the mel power spectrum with torch.stft on the backend device."""
+        torch = self._torch
+        device = self._torch_device
+
+        key = (sample_rate, n_fft, n_mels)
+        mel_mat = self._mel_mat_torch.get(key)
+        if mel_mat is None:
+            filters = self._create_mel_filterbank(sample_rate, n_fft, n_mels)
+            mel_mat = torch.from_numpy(filters.astype(np.float32)).to(device)
+            self._mel_mat_torch[key] = mel_mat
+
+        with torch.no_grad():
+            x = torch.from_numpy(padded).to(device)
+            window = torch.hann_window(n_fft, periodic=False, device=device)
+            stft = torch.stft(
+                x,
+                n_fft=n_fft,
+                hop_length=hop_length,
+                window=window,
+                center=False,
+                return_complex=True
+            )[:, :n_frames]
+            power = stft.real ** 2 + stft.imag ** 2
+            mel_spec = mel_mat @ power
+
+        return mel_spec.cpu().numpy()
+
     def _create_mel_filterbank(
         self,
         sample_rate: int,
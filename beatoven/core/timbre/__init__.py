@@ -6,7 +6,7 @@ Includes FX chain with filters, reverbs, delays, and spectral warping.
 Patchable via PatchBay system.
 """
 
-import hashlib
+from hashlib import sha256 as _sha256
 import math
 import numpy as np
 from dataclasses import dataclass, field
@@ -14,6 +14,177 @@ from typing import List, Dict, Any, Optional, Callable, Tuple
 from enum import Enum
 from abc import ABC, abstractmethod
 
+from beatoven._numba import HAS_NUMBA as _HAS_NUMBA, njit, prange
+
+try:
+    from scipy.signal import lfilter as _lfilter
+except ImportError:
+    _lfilter = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+@njit(cache=True, fastmath=True)
+def _biquad_df2t(x, b0, b1, b2, a1, a2, z1, z2):
+    """Transposed direct-form II biquad. Returns (output, z1, z2)."""
+    out = np.empty(x.shape[0], dtype=np.float32)
+    for i in range(x.shape[0]):
+        xi = x[i]
+        y = b0 * xi + z1
+        z1 = b1 * xi - a1 * y + z2
+        z2 = b2 * xi - a2 * y
+        out[i] = y
+    return out, z1, z2
+
+
+def _run_biquad(
+    x: np.ndarray,
+    coefs: Tuple[float, float, float, float, float],
+    zi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Filter each row of x (channels, n) with per-row state zi (channels, 2).
+
+    Backend order: the Numba kernel when Numba is installed; otherwise
+    scipy.signal.lfilter (same transposed form and state layout); the
+    kernel as plain Python if neither is available.
+    """
+    b0, b1, b2, a1, a2 = coefs
+    if not _HAS_NUMBA and _lfilter is not None:
+        out, zf = _lfilter([b0, b1, b2], [1.0, a1, a2], x, axis=-1, zi=zi)
+        return out.astype(np.float32), zf
+
+    out = np.empty_like(x)
+    zf = np.empty_like(zi)
+    for ch in range(x.shape[0]):
+        out[ch], zf[ch, 0], zf[ch, 1] = _biquad_df2t(
+            x[ch], b0, b1, b2, a1, a2, zi[ch, 0], zi[ch, 1]
+        )
+    return out, zf
+
+
+@njit(cache=True, fastmath=True)
+def _fastsin(x):
+    """Pade approximant of sin(x), accurate to ~1e-5 on [-pi, pi]."""
+    x2 = x * x
+    num = -x * (-11511339840.0 + x2 * (1640635920.0 + x2 * (-52785432.0 + x2 * 479249.0)))
+    den = 11511339840.0 + x2 * (277920720.0 + x2 * (3177720.0 + x2 * 18361.0))
+    return num / den
+
+
+@njit(cache=True, fastmath=True)
+def _wrap_phase(p):
+    """p reduced to [0, 2*pi); handles negative and multi-turn steps."""
+    two_pi = 2.0 * np.pi
+    return p - two_pi * np.floor(p / two_pi)
+
+
+@njit(cache=True, fastmath=True)
+def _osc_sine(n, dphase, amp, phase):
+    """Fused phase accumulator + sine. Returns (output, next_phase)."""
+    two_pi = 2.0 * np.pi
+    out = np.empty(n, dtype=np.float32)
+    p = _wrap_phase(phase)
+    for i in range(n):
+        x = p - two_pi if p > np.pi else p
+        out[i] = amp * _fastsin(x)
+        p += dphase
+        if p >= two_pi or p < 0.0:
+            p = _wrap_phase(p)
+    return out, p
+
+
+@njit(cache=True, fastmath=True)
+def _fused_sine_lp(n, dphase, amp, phase, b0, b1, b2, a1, a2,
+                   attack, decay, release, sustain_level):
+    """
+    Sine oscillator -> biquad -> attack/decay/release envelope in one pass.
+
+    Mirrors Oscillator + Filter + TimbreEngine._create_envelope sample for
+    sample without materializing any intermediate buffer.
+    """
+    two_pi = 2.0 * np.pi
+    out = np.empty(n, dtype=np.float32)
+    release_start = n - release
+    p = _wrap_phase(phase)
+    z1 = 0.0
+    z2 = 0.0
+    for i in range(n):
+        x = p - two_pi if p > np.pi else p
+        xi = amp * _fastsin(x)
+        p += dphase
+        if p >= two_pi or p < 0.0:
+            p = _wrap_phase(p)
+
+        y = b0 * xi + z1
+        z1 = b1 * xi - a1 * y + z2
+        z2 = b2 * xi - a2 * y
+
+        if i >= release_start:
+            k = i - release_start
+            env = sustain_level - sustain_level * k / (release - 1) if release > 1 else sustain_level
+        elif i < attack:
+            env = i / (attack - 1) if attack > 1 else 0.0
+        elif i < attack + decay:
+            k = i - attack
+            env = 1.0 + (sustain_level - 1.0) * k / (decay - 1) if decay > 1 else 1.0
+        else:
+            env = 1.0
+        out[i] = y * env
+    return out
+
+
+# Fixed partial-buffer count for the parallel grain scatter, so summation
+# order (and therefore output) does not depend on the machine's thread count
+_GRAIN_CHUNKS = 8
+
+
+@njit(parallel=True, cache=True)
+def _granular_scatter(source, window, starts, src_starts, counts, n_out):
+    """Overlap-add windowed grains via per-chunk partial outputs."""
+    n_grains = starts.shape[0]
+    partial = np.zeros((_GRAIN_CHUNKS, n_out), dtype=np.float32)
+    per_chunk = (n_grains + _GRAIN_CHUNKS - 1) // _GRAIN_CHUNKS
+    for c in prange(_GRAIN_CHUNKS):
+        lo = c * per_chunk
+        hi = min(lo + per_chunk, n_grains)
+        for g in range(lo, hi):
+            start = starts[g]
+            src_start = src_starts[g]
+            for j in range(counts[g]):
+                partial[c, start + j] += source[src_start + j] * window[j]
+    return partial.sum(axis=0)
+
+
+_PHASE_ONE = 1 << 32  # one full cycle of the uint32 phase accumulator
+
+
+@njit(cache=True)
+def _osc_wave_u32(shape_code, n, delta, amp, acc, pulse_threshold):
+    """
+    Saw/square/triangle/pulse from a wrapping uint32 phase accumulator.
+
+    The phase is held in an int64 and masked to 32 bits, so wrapping needs
+    no float modulo. Returns (output, next_acc).
+    """
+    out = np.empty(n, dtype=np.float32)
+    scale = 1.0 / 2147483648.0  # 2 / 2**32
+    for i in range(n):
+        if shape_code == 1:  # saw
+            v = acc * scale - 1.0
+        elif shape_code == 2:  # square
+            v = 1.0 if acc < 0x80000000 else -1.0
+        elif shape_code == 3:  # triangle
+            v = 2.0 * abs(acc * scale - 1.0) - 1.0
+        else:  # pulse
+            v = 1.0 if acc < pulse_threshold else -1.0
+        out[i] = amp * v
+        acc = (acc + delta) & 0xFFFFFFFF
+    return out, acc
+
 
 class WaveShape(Enum):
     """Basic waveform shapes."""
@@ -36,27 +207,62 @@ class FilterType(Enum):
     HIGHSHELF = "highshelf"
 
 
-@dataclass
 class AudioBuffer:
-    """Audio buffer container."""
-    samples: np.ndarray
-    sample_rate: int = 44100
-    channels: int = 1
+    """
+    Audio buffer container.
+
+    Samples are always contiguous float32: shape (n,) for mono and
+    (channels, n) for multichannel, so each channel is a contiguous row.
+    A plain __slots__ class because one is allocated per process() call.
+    """
+
+    __slots__ = ("samples", "sample_rate", "channels")
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int = 44100,
+        channels: int = 1
+    ):
+        self.samples = np.ascontiguousarray(samples, dtype=np.float32)
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    def __repr__(self) -> str:
+        return (
+            f"AudioBuffer(shape={self.samples.shape}, "
+            f"sample_rate={self.sample_rate}, channels={self.channels})"
+        )
 
     @property
     def duration(self) -> float:
-        return len(self.samples) / self.sample_rate
+        return self.samples.shape[-1] / self.sample_rate
 
     def to_stereo(self) -> "AudioBuffer":
         if self.channels == 2:
             return self
-        stereo = np.column_stack([self.samples, self.samples])
+        stereo = np.stack([self.samples, self.samples], axis=0)
         return AudioBuffer(stereo, self.sample_rate, 2)
 
 
+# Kernel shape codes for _osc_sine / _osc_wave_u32 (noise stays in NumPy)
+_OSC_SHAPE_CODES = {
+    WaveShape.SINE: 0,
+    WaveShape.SAW: 1,
+    WaveShape.SQUARE: 2,
+    WaveShape.TRIANGLE: 3,
+    WaveShape.PULSE: 4,
+}
+
+
 class SynthModule(ABC):
     """Abstract base for synthesis modules."""
 
+    # Per-sample-rate constants, refreshed only when the rate changes
+    _sample_rate: Optional[int] = None
+    _inv_sr: float = 0.0
+    _two_pi_over_sr: float = 0.0
+
     @abstractmethod
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         pass
@@ -65,6 +271,14 @@ class SynthModule(ABC):
     def get_params(self) -> Dict[str, Any]:
         pass
 
+    def _rate_constants(self, sample_rate: int) -> Tuple[float, float]:
+        """Get cached (1 / sample_rate, 2 * pi / sample_rate)."""
+        if sample_rate != self._sample_rate:
+            self._sample_rate = sample_rate
+            self._inv_sr = 1.0 / sample_rate
+            self._two_pi_over_sr = 2 * np.pi / sample_rate
+        return self._inv_sr, self._two_pi_over_sr
+
 
 class Oscillator(SynthModule):
     """Multi-waveform oscillator."""
@@ -75,7 +289,8 @@ class Oscillator(SynthModule):
         frequency: float = 440.0,
         amplitude: float = 1.0,
         phase: float = 0.0,
-        pulse_width: float = 0.5
+        pulse_width: float = 0.5,
+        sample_rate: Optional[int] = None
     ):
         self.shape = shape
         self.frequency = frequency
@@ -83,14 +298,57 @@ class Oscillator(SynthModule):
         self.phase = phase
         self.pulse_width = pulse_width
         self._phase_acc = phase
+        # Exact integer phase carried between saw/square/triangle/pulse kernel
+        # blocks; None when a float path last advanced the phase (_phase_acc
+        # is then the source of truth and the integer phase is re-derived).
+        self._phase_u32: Optional[int] = None
+        if sample_rate is not None:
+            self._rate_constants(sample_rate)
 
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         freq = params.get("frequency", self.frequency)
         amp = params.get("amplitude", self.amplitude)
 
-        n_samples = len(buffer.samples)
-        t = np.arange(n_samples) / buffer.sample_rate
-        phase = 2 * np.pi * freq * t + self._phase_acc
+        n_samples = buffer.samples.shape[-1]
+        inv_sr, two_pi_over_sr = self._rate_constants(buffer.sample_rate)
+        dphase = freq * two_pi_over_sr
+
+        shape_code = _OSC_SHAPE_CODES.get(self.shape)
+        if _HAS_NUMBA and shape_code is not None:
+            if shape_code == 0:
+                samples, self._phase_acc = _osc_sine(
+                    n_samples, dphase, float(amp), float(self._phase_acc)
+                )
+                self._phase_u32 = None
+            else:
+                delta = int(round(freq * inv_sr * _PHASE_ONE)) % _PHASE_ONE
+                acc = self._phase_u32
+                if acc is None:
+                    acc = int(self._phase_acc % (2 * np.pi) / (2 * np.pi) * _PHASE_ONE) % _PHASE_ONE
+                threshold = int(min(max(self.pulse_width, 0.0), 1.0) * _PHASE_ONE)
+                samples, acc = _osc_wave_u32(
+                    shape_code, n_samples, delta, float(amp), acc, threshold
+                )
+                self._phase_u32 = int(acc)
+                self._phase_acc = self._phase_u32 / _PHASE_ONE * 2 * np.pi
+            return AudioBuffer(samples=samples, sample_rate=buffer.sample_rate)
+
+        # Constant frequency: the phase is an arithmetic progression
+        phase = np.linspace(
+            self._phase_acc, self._phase_acc + n_samples * dphase,
+            n_samples, endpoint=False
+        )
+
+        if self.shape == WaveShape.SINE and ne is not None:
+            # Fused sin * amp, written back over the phase array
+            samples = ne.evaluate(
+                "sin(phase) * amp",
+                local_dict={"phase": phase, "amp": amp},
+                out=phase
+            )
+            self._phase_acc = (self._phase_acc + n_samples * dphase) % (2 * np.pi)
+            self._phase_u32 = None
+            return AudioBuffer(samples=samples, sample_rate=buffer.sample_rate)
 
         if self.shape == WaveShape.SINE:
             samples = np.sin(phase)
@@ -108,7 +366,8 @@ class Oscillator(SynthModule):
         else:
             samples = np.sin(phase)
 
-        self._phase_acc = phase[-1] if len(phase) > 0 else self._phase_acc
+        self._phase_acc = (self._phase_acc + n_samples * dphase) % (2 * np.pi)
+        self._phase_u32 = None
 
         return AudioBuffer(
             samples=(samples * amp).astype(np.float32),
@@ -133,21 +392,51 @@ class Filter(SynthModule):
         filter_type: FilterType = FilterType.LOWPASS,
         cutoff: float = 1000.0,
         resonance: float = 0.707,
-        gain_db: float = 0.0
+        gain_db: float = 0.0,
+        sample_rate: Optional[int] = None
     ):
         self.filter_type = filter_type
         self.cutoff = cutoff
         self.resonance = resonance
         self.gain_db = gain_db
-        self._z1 = 0.0
-        self._z2 = 0.0
+        if sample_rate is not None:
+            self._rate_constants(sample_rate)
+        self._zi = np.zeros((1, 2))  # lfilter-style (z1, z2) state per channel
+        self._coef_key: tuple = ()
+        self._coefs: Tuple[float, float, float, float, float] = (1.0, 0.0, 0.0, 0.0, 0.0)
 
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         cutoff = params.get("cutoff", self.cutoff)
         q = params.get("resonance", self.resonance)
 
-        # Calculate coefficients
-        omega = 2 * np.pi * cutoff / buffer.sample_rate
+        # Reuse coefficients while cutoff/resonance/rate/type are unchanged
+        key = (cutoff, q, buffer.sample_rate, self.filter_type)
+        if key != self._coef_key or params.get("force_recompute", False):
+            self._coefs = self._compute_coefficients(cutoff, q, buffer.sample_rate)
+            self._coef_key = key
+        coefs = self._coefs
+
+        # Process samples, one contiguous row per channel
+        samples = buffer.samples.reshape(-1, buffer.samples.shape[-1])
+        if self._zi.shape[0] != samples.shape[0]:
+            self._zi = np.zeros((samples.shape[0], 2))
+
+        output, self._zi = _run_biquad(samples, coefs, self._zi)
+
+        return AudioBuffer(
+            output.reshape(buffer.samples.shape),
+            buffer.sample_rate,
+            buffer.channels
+        )
+
+    def _compute_coefficients(
+        self,
+        cutoff: float,
+        q: float,
+        sample_rate: int
+    ) -> Tuple[float, float, float, float, float]:
+        """Compute normalized biquad coefficients (b0, b1, b2, a1, a2)."""
+        omega = cutoff * self._rate_constants(sample_rate)[1]
         sin_omega = np.sin(omega)
         cos_omega = np.cos(omega)
         alpha = sin_omega / (2 * q)
@@ -181,19 +470,7 @@ class Filter(SynthModule):
         b0, b1, b2 = b0/a0, b1/a0, b2/a0
         a1, a2 = a1/a0, a2/a0
 
-        # Process samples
-        output = np.zeros_like(buffer.samples)
-        z1, z2 = self._z1, self._z2
-
-        for i, x in enumerate(buffer.samples):
-            y = b0 * x + z1
-            z1 = b1 * x - a1 * y + z2
-            z2 = b2 * x - a2 * y
-            output[i] = y
-
-        self._z1, self._z2 = z1, z2
-
-        return AudioBuffer(output.astype(np.float32), buffer.sample_rate)
+        return (float(b0), float(b1), float(b2), float(a1), float(a2))
 
     def get_params(self) -> Dict[str, Any]:
         return {
@@ -221,11 +498,20 @@ class GranularSynth(SynthModule):
         self.pitch_shift = pitch_shift
         self.randomness = randomness
         self._source_buffer: Optional[np.ndarray] = None
+        self._windows: Dict[int, np.ndarray] = {}
 
     def set_source(self, source: np.ndarray):
         """Set source audio for granular processing."""
         self._source_buffer = source
 
+    def _grain_window(self, length: int) -> np.ndarray:
+        """Get a cached float32 Hann window of the given length."""
+        window = self._windows.get(length)
+        if window is None:
+            window = np.hanning(length).astype(np.float32)
+            self._windows[length] = window
+        return window
+
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         if self._source_buffer is None:
             # Generate sine grain as default
@@ -233,38 +519,44 @@ class GranularSynth(SynthModule):
             self._source_buffer = np.sin(2 * np.pi * 440 * t).astype(np.float32)
 
         grain_samples = int(self.grain_size_ms * buffer.sample_rate / 1000)
-        output = np.zeros(len(buffer.samples), dtype=np.float32)
+        output = np.zeros(buffer.samples.shape[-1], dtype=np.float32)
 
         rng = np.random.default_rng(42)
         n_grains = int(self.grain_density * buffer.duration)
+        source = self._source_buffer
+        n_out = len(output)
+
+        # Draw every grain's placement up front as arrays
+        starts = rng.integers(0, max(1, n_out - grain_samples), size=n_grains)
+        jitters = rng.uniform(-self.randomness, self.randomness, size=n_grains)
+        src_positions = np.clip(self.position + jitters, 0.0, 1.0)
+        src_starts = np.maximum(
+            0, (src_positions * (len(source) - grain_samples)).astype(np.int64)
+        )
+        grain_lens = np.minimum(src_starts + grain_samples, len(source)) - src_starts
+        ns = np.minimum(starts + grain_lens, n_out) - starts
+
+        if _HAS_NUMBA and n_grains > 0 and np.all(grain_lens == grain_samples):
+            # Every grain uses the same window: scatter them in parallel
+            output = _granular_scatter(
+                np.ascontiguousarray(source, dtype=np.float32),
+                self._grain_window(grain_samples),
+                starts, src_starts, ns, n_out
+            )
+        else:
+            for start, src_start, grain_len, n in zip(
+                starts.tolist(), src_starts.tolist(), grain_lens.tolist(), ns.tolist()
+            ):
+                # Window the grain straight from the source view into the output
+                window = self._grain_window(grain_len)
+                output[start:start + n] += source[src_start:src_start + n] * window[:n]
 
-        for _ in range(n_grains):
-            # Random start position in output
-            start = rng.integers(0, max(1, len(output) - grain_samples))
-
-            # Random position in source with jitter
-            src_pos = self.position + rng.uniform(-self.randomness, self.randomness)
-            src_pos = max(0, min(1, src_pos))
-            src_start = int(src_pos * (len(self._source_buffer) - grain_samples))
-            src_start = max(0, src_start)
-
-            # Extract grain
-            grain_end = min(src_start + grain_samples, len(self._source_buffer))
-            grain = self._source_buffer[src_start:grain_end].copy()
-
-            # Apply window
-            window = np.hanning(len(grain))
-            grain = grain * window
-
-            # Add to output
-            end = min(start + len(grain), len(output))
-            output[start:end] += grain[:end-start]
-
-        # Normalize
-        if output.max() > 0:
-            output = output / output.max() * 0.8
+        # Normalize to 0.8 of the absolute peak, in place
+        peak = float(np.max(np.abs(output))) if len(output) > 0 else 0.0
+        if peak > 0:
+            output *= np.float32(0.8 / peak)
 
-        return AudioBuffer(output.astype(np.float32), buffer.sample_rate)
+        return AudioBuffer(output, buffer.sample_rate)
 
     def get_params(self) -> Dict[str, Any]:
         return {
@@ -284,12 +576,15 @@ class FMSynth(SynthModule):
         carrier_freq: float = 440.0,
         mod_freq: float = 440.0,
         mod_index: float = 1.0,
-        amplitude: float = 1.0
+        amplitude: float = 1.0,
+        sample_rate: Optional[int] = None
     ):
         self.carrier_freq = carrier_freq
         self.mod_freq = mod_freq
         self.mod_index = mod_index
         self.amplitude = amplitude
+        if sample_rate is not None:
+            self._rate_constants(sample_rate)
 
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         carrier = params.get("carrier_freq", self.carrier_freq)
@@ -297,9 +592,19 @@ class FMSynth(SynthModule):
         index = params.get("mod_index", self.mod_index)
         amp = params.get("amplitude", self.amplitude)
 
-        t = np.arange(len(buffer.samples)) / buffer.sample_rate
-        modulator = np.sin(2 * np.pi * mod * t)
-        samples = np.sin(2 * np.pi * carrier * t + index * modulator) * amp
+        inv_sr, _ = self._rate_constants(buffer.sample_rate)
+        t = np.arange(buffer.samples.shape[-1]) * inv_sr
+        if ne is not None:
+            samples = ne.evaluate(
+                "sin(two_pi * carrier * t + index * sin(two_pi * mod * t)) * amp",
+                local_dict={
+                    "two_pi": 2 * np.pi, "carrier": carrier, "mod": mod,
+                    "index": index, "t": t, "amp": amp
+                }
+            )
+        else:
+            modulator = np.sin(2 * np.pi * mod * t)
+            samples = np.sin(2 * np.pi * carrier * t + index * modulator) * amp
 
         return AudioBuffer(samples.astype(np.float32), buffer.sample_rate)
 
@@ -320,12 +625,27 @@ class Reverb(SynthModule):
         room_size: float = 0.5,
         damping: float = 0.5,
         wet: float = 0.3,
-        dry: float = 0.7
+        dry: float = 0.7,
+        sample_rate: Optional[int] = None
     ):
         self.room_size = room_size
         self.damping = damping
         self.wet = wet
         self.dry = dry
+        self._delays_key: tuple = ()
+        self._delays: List[int] = []
+        if sample_rate is not None:
+            self._tap_delays(room_size, sample_rate)
+
+    def _tap_delays(self, room: float, sample_rate: int) -> List[int]:
+        """Get tap delays in samples, cached per (room_size, sample_rate)."""
+        key = (room, sample_rate)
+        if key != self._delays_key:
+            self._delays = [
+                int(room * d * sample_rate) for d in [0.029, 0.037, 0.041, 0.043]
+            ]
+            self._delays_key = key
+        return self._delays
 
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         wet = params.get("wet", self.wet)
@@ -333,22 +653,24 @@ class Reverb(SynthModule):
         room = params.get("room_size", self.room_size)
 
         # Simple delay-based reverb
-        delays = [int(room * d * buffer.sample_rate) for d in [0.029, 0.037, 0.041, 0.043]]
+        delays = self._tap_delays(room, buffer.sample_rate)
         decay = 0.5 + 0.4 * room
 
-        output = buffer.samples.copy().astype(np.float64)
-        reverb = np.zeros_like(output)
+        samples = buffer.samples
+        n_samples = samples.shape[-1]
 
+        # Accumulate each tap straight into one buffer; the 1/len(delays)
+        # average is folded into the tap gain
+        tap_gain = np.float32(decay / len(delays))
+        output = np.zeros_like(samples)
         for delay in delays:
-            delayed = np.zeros_like(output)
-            if delay < len(output):
-                delayed[delay:] = output[:-delay] * decay
-            reverb += delayed
+            if delay < n_samples:
+                output[..., delay:] += samples[..., :n_samples - delay] * tap_gain
 
-        reverb = reverb / len(delays)
-        output = dry * buffer.samples + wet * reverb
+        output *= np.float32(wet)
+        output += samples * np.float32(dry)
 
-        return AudioBuffer(output.astype(np.float32), buffer.sample_rate)
+        return AudioBuffer(output, buffer.sample_rate, buffer.channels)
 
     def get_params(self) -> Dict[str, Any]:
         return {
@@ -372,24 +694,38 @@ class Delay(SynthModule):
         self.feedback = feedback
         self.wet = wet
         self._buffer: Optional[np.ndarray] = None
+        self._wpos = 0
 
     def process(self, buffer: AudioBuffer, **params) -> AudioBuffer:
         time = params.get("time_ms", self.time_ms)
         feedback = params.get("feedback", self.feedback)
         wet = params.get("wet", self.wet)
 
-        delay_samples = int(time * buffer.sample_rate / 1000)
-        output = buffer.samples.copy().astype(np.float64)
-
-        if self._buffer is None or len(self._buffer) != delay_samples:
-            self._buffer = np.zeros(delay_samples, dtype=np.float64)
-
-        for i in range(len(output)):
-            delayed = self._buffer[i % delay_samples]
-            self._buffer[i % delay_samples] = output[i] + delayed * feedback
-            output[i] = output[i] * (1 - wet) + delayed * wet
-
-        return AudioBuffer(output.astype(np.float32), buffer.sample_rate)
+        delay_samples = max(1, int(time * buffer.sample_rate / 1000))
+        samples = buffer.samples
+        n_samples = samples.shape[-1]
+        output = np.empty_like(samples)
+
+        line_shape = samples.shape[:-1] + (delay_samples,)
+        if self._buffer is None or self._buffer.shape != line_shape:
+            self._buffer = np.zeros(line_shape, dtype=np.float32)
+            self._wpos = 0
+
+        # Each block is at most one delay line long, so every slot is read
+        # before it is overwritten and the block can be vectorized
+        start = 0
+        wpos = self._wpos
+        while start < n_samples:
+            n = min(delay_samples - wpos, n_samples - start)
+            dry = samples[..., start:start + n]
+            delayed = self._buffer[..., wpos:wpos + n]
+            output[..., start:start + n] = dry * (1 - wet) + delayed * wet
+            self._buffer[..., wpos:wpos + n] = dry + delayed * feedback
+            start += n
+            wpos = (wpos + n) % delay_samples
+        self._wpos = wpos
+
+        return AudioBuffer(output, buffer.sample_rate, buffer.channels)
 
     def get_params(self) -> Dict[str, Any]:
         return {
@@ -503,22 +839,28 @@ class TimbreEngine:
         else:
             osc = Oscillator(WaveShape.SQUARE, frequency)
 
-        # Generate base
-        output = osc.process(buffer)
-
-        # Add filter based on tension
+        # Filter cutoff based on tension
         cutoff = 500 + (1 - tension) * 8000
         filt = Filter(FilterType.LOWPASS, cutoff, 0.5 + resonance)
-        output = filt.process(output)
 
-        # Add effects based on resonance
-        if resonance > 0.5:
-            rev = Reverb(room_size=resonance * 0.8, wet=resonance * 0.4)
-            output = rev.process(output)
+        if _HAS_NUMBA and density < 0.3 and resonance <= 0.5:
+            # Sine patch without reverb: one fused kernel
+            output = self._fast_sine_path(osc, filt, n_samples, tension)
+        else:
+            # Generate base
+            output = osc.process(buffer)
+
+            # Add filter based on tension
+            output = filt.process(output)
+
+            # Add effects based on resonance
+            if resonance > 0.5:
+                rev = Reverb(room_size=resonance * 0.8, wet=resonance * 0.4)
+                output = rev.process(output)
 
-        # Apply envelope
-        envelope = self._create_envelope(n_samples, tension)
-        output.samples = output.samples * envelope
+            # Apply envelope
+            envelope = self._create_envelope(n_samples, tension)
+            output.samples = output.samples * envelope
 
         # Build patch descriptor
         patch = TimbrePatch(
@@ -533,6 +875,30 @@ class TimbreEngine:
 
         return output, patch
 
+    def _fast_sine_path(
+        self,
+        osc: Oscillator,
+        filt: Filter,
+        n_samples: int,
+        tension: float
+    ) -> AudioBuffer:
+        """Render sine -> lowpass -> envelope with the fused Numba kernel."""
+        b0, b1, b2, a1, a2 = filt._compute_coefficients(
+            filt.cutoff, filt.resonance, self.sample_rate
+        )
+        samples = _fused_sine_lp(
+            n_samples,
+            osc.frequency * osc._rate_constants(self.sample_rate)[1],
+            float(osc.amplitude),
+            float(osc.phase),
+            b0, b1, b2, a1, a2,
+            int(0.01 * n_samples),
+            int(0.1 * n_samples),
+            int(0.2 * n_samples),
+            0.7 - tension * 0.3
+        )
+        return AudioBuffer(samples, self.sample_rate)
+
     def _create_envelope(self, n_samples: int, tension: float) -> np.ndarray:
         """Create amplitude envelope."""
         attack = int(0.01 * n_samples)
@@ -542,15 +908,26 @@ class TimbreEngine:
 
         envelope = np.ones(n_samples, dtype=np.float32)
 
+        # One shared index ramp; each segment is scaled into its slice in place
+        ramp = np.arange(max(attack, decay, release), dtype=np.float32)
+
+        def segment(out: np.ndarray, start: float, stop: float):
+            n = len(out)
+            if n == 0:
+                return
+            step = (stop - start) / (n - 1) if n > 1 else 0.0
+            np.multiply(ramp[:n], np.float32(step), out=out)
+            out += np.float32(start)
+
         # Attack
-        envelope[:attack] = np.linspace(0, 1, attack)
+        segment(envelope[:attack], 0.0, 1.0)
 
         # Decay
-        envelope[attack:attack+decay] = np.linspace(1, sustain_level, decay)
+        segment(envelope[attack:attack+decay], 1.0, sustain_level)
 
         # Release
         release_start = n_samples - release
-        envelope[release_start:] = np.linspace(sustain_level, 0, release)
+        segment(envelope[release_start:], sustain_level, 0.0)
 
         return envelope
 
@@ -564,7 +941,7 @@ class TimbreEngine:
     ) -> str:
         """Compute provenance hash."""
         data = f"{self.seed}:{resonance}:{density}:{tension}:{frequency}:{duration}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        return _sha256(data.encode()).hexdigest()
 
 
 __all__ = [
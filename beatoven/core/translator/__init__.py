@@ -5,12 +5,20 @@ Converts input symbolic vectors into ABX-Runes semantic fields:
 resonance, density, drift, tension, contrast.
 """
 
-import hashlib
+from hashlib import sha256 as _sha256
+import threading
 import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 
+def _field_array(data: Dict[str, Any], key: str, size: int) -> np.ndarray:
+    """Load an extended field vector, allocating zeros only when it is missing."""
+    if key in data:
+        return np.asarray(data[key], dtype=np.float32)
+    return np.zeros(size, dtype=np.float32)
+
+
 @dataclass
 class ABXRunesFields:
     """
@@ -86,11 +94,11 @@ class ABXRunesFields:
             drift=data["drift"],
             tension=data["tension"],
             contrast=data["contrast"],
-            resonance_spectrum=np.array(data.get("resonance_spectrum", np.zeros(16)), dtype=np.float32),
-            density_layers=np.array(data.get("density_layers", np.zeros(8)), dtype=np.float32),
-            drift_curves=np.array(data.get("drift_curves", np.zeros(8)), dtype=np.float32),
-            tension_harmonics=np.array(data.get("tension_harmonics", np.zeros(12)), dtype=np.float32),
-            contrast_dynamics=np.array(data.get("contrast_dynamics", np.zeros(8)), dtype=np.float32),
+            resonance_spectrum=_field_array(data, "resonance_spectrum", 16),
+            density_layers=_field_array(data, "density_layers", 8),
+            drift_curves=_field_array(data, "drift_curves", 8),
+            tension_harmonics=_field_array(data, "tension_harmonics", 12),
+            contrast_dynamics=_field_array(data, "contrast_dynamics", 8),
             provenance_hash=data.get("provenance_hash", "")
         )
 
@@ -113,6 +121,10 @@ class SymbolicTranslator:
         self.compression_factor = max(0.0, min(1.0, compression_factor))
         self._init_projection_matrices()
 
+        # Reused input buffer: intent(128) + mood(32) + rune(64) + style(18)
+        self._combined = np.zeros(242, dtype=np.float32)
+        self._combined_lock = threading.Lock()
+
     def _init_projection_matrices(self):
         """Initialize deterministic projection matrices."""
         # Use fixed seed for deterministic projections
@@ -135,6 +147,36 @@ class SymbolicTranslator:
         self._tension_harmonics_proj = rng.standard_normal((input_dim, 12)).astype(np.float32) / np.sqrt(input_dim)
         self._contrast_dynamics_proj = rng.standard_normal((input_dim, 8)).astype(np.float32) / np.sqrt(input_dim)
 
+        # Stack projections so translate() needs one matmul per activation;
+        # the per-field attributes stay available as views into the stacks
+        self._primary_proj = np.concatenate([
+            self._resonance_proj,
+            self._density_proj,
+            self._drift_proj,
+            self._tension_proj,
+            self._contrast_proj
+        ], axis=1)
+        self._extended_proj = np.concatenate([
+            self._resonance_spectrum_proj,
+            self._density_layers_proj,
+            self._drift_curves_proj,
+            self._tension_harmonics_proj,
+            self._contrast_dynamics_proj
+        ], axis=1)
+        self._extended_splits = [16, 24, 32, 44]
+
+        self._resonance_proj = self._primary_proj[:, 0:1]
+        self._density_proj = self._primary_proj[:, 1:2]
+        self._drift_proj = self._primary_proj[:, 2:3]
+        self._tension_proj = self._primary_proj[:, 3:4]
+        self._contrast_proj = self._primary_proj[:, 4:5]
+
+        self._resonance_spectrum_proj = self._extended_proj[:, 0:16]
+        self._density_layers_proj = self._extended_proj[:, 16:24]
+        self._drift_curves_proj = self._extended_proj[:, 24:32]
+        self._tension_harmonics_proj = self._extended_proj[:, 32:44]
+        self._contrast_dynamics_proj = self._extended_proj[:, 44:52]
+
     def translate(
         self,
         intent_embedding: np.ndarray,
@@ -156,37 +198,40 @@ class SymbolicTranslator:
         Returns:
             ABXRunesFields containing all semantic fields
         """
-        # Concatenate all inputs
-        combined = np.concatenate([
-            intent_embedding.flatten(),
-            mood_vector.flatten(),
-            rune_vector.flatten(),
-            style_vector.flatten()
-        ]).astype(np.float32)
-
-        # Pad or truncate to expected dimension
-        expected_dim = 242
-        if len(combined) < expected_dim:
-            combined = np.pad(combined, (0, expected_dim - len(combined)))
-        elif len(combined) > expected_dim:
-            combined = combined[:expected_dim]
-
-        # Apply ABX-Core entropy compression
-        combined = self._apply_compression(combined)
-
-        # Project to primary fields (sigmoid activation for 0-1 range)
-        resonance = float(self._sigmoid(combined @ self._resonance_proj))
-        density = float(self._sigmoid(combined @ self._density_proj))
-        drift = float(self._sigmoid(combined @ self._drift_proj))
-        tension = float(self._sigmoid(combined @ self._tension_proj))
-        contrast = float(self._sigmoid(combined @ self._contrast_proj))
-
-        # Project to extended fields (tanh activation for -1 to 1)
-        resonance_spectrum = np.tanh(combined @ self._resonance_spectrum_proj).astype(np.float32)
-        density_layers = np.tanh(combined @ self._density_layers_proj).astype(np.float32)
-        drift_curves = np.tanh(combined @ self._drift_curves_proj).astype(np.float32)
-        tension_harmonics = np.tanh(combined @ self._tension_harmonics_proj).astype(np.float32)
-        contrast_dynamics = np.tanh(combined @ self._contrast_dynamics_proj).astype(np.float32)
+        with self._combined_lock:
+            # Concatenate all inputs into the reused buffer, truncating or
+            # zero-padding to the expected dimension
+            combined = self._combined
+            expected_dim = len(combined)
+            offset = 0
+            for vector in (intent_embedding, mood_vector, rune_vector, style_vector):
+                flat = np.ravel(vector)
+                n = min(len(flat), expected_dim - offset)
+                combined[offset:offset + n] = flat[:n]
+                offset += n
+            combined[offset:] = 0.0
+
+            # Apply ABX-Core entropy compression
+            self._apply_compression(combined)
+
+            # Project to primary fields (sigmoid activation for 0-1 range)
+            primary_logits = combined @ self._primary_proj
+
+            # Project to extended fields (tanh activation for -1 to 1)
+            extended_logits = combined @ self._extended_proj
+
+        primary = self._sigmoid(primary_logits)
+        resonance, density, drift, tension, contrast = (
+            float(v) for v in primary
+        )
+        extended = np.tanh(extended_logits).astype(np.float32)
+        (
+            resonance_spectrum,
+            density_layers,
+            drift_curves,
+            tension_harmonics,
+            contrast_dynamics
+        ) = np.split(extended, self._extended_splits)
 
         # Compute provenance hash
         provenance_hash = self._compute_provenance(
@@ -207,20 +252,17 @@ class SymbolicTranslator:
             provenance_hash=provenance_hash
         )
 
-    def _apply_compression(self, vector: np.ndarray) -> np.ndarray:
-        """Apply ABX-Core entropy compression."""
+    def _apply_compression(self, vector: np.ndarray) -> None:
+        """Apply ABX-Core entropy compression in place."""
         # Soft compression toward mean
-        mean = np.mean(vector)
-        compressed = mean + self.compression_factor * (vector - mean)
-        return compressed
+        mean = vector.mean()
+        vector -= mean
+        vector *= self.compression_factor
+        vector += mean
 
     def _sigmoid(self, x: np.ndarray) -> np.ndarray:
-        """Numerically stable sigmoid."""
-        return np.where(
-            x >= 0,
-            1 / (1 + np.exp(-x)),
-            np.exp(x) / (1 + np.exp(x))
-        )
+        """Numerically stable, branchless sigmoid via tanh."""
+        return 0.5 * (1.0 + np.tanh(0.5 * x))
 
     def _compute_provenance(
         self,
@@ -233,7 +275,7 @@ class SymbolicTranslator:
     ) -> str:
         """Compute provenance hash for translation output."""
         data = f"{resonance:.6f}:{density:.6f}:{drift:.6f}:{tension:.6f}:{contrast:.6f}:{input_provenance}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        return _sha256(data.encode()).hexdigest()
 
 
 __all__ = ["SymbolicTranslator", "ABXRunesFields"]
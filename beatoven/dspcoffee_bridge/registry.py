@@ -1,27 +1,107 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import asdict
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
-from .schema import PresetBank
+import numpy as np
+
+from .schema import PresetBank, ResonanceFrame
+from .scoring import PresetTable, frame_gate_keys, score_all
+
+class _Snapshot:
+    """
+    Immutable preset tuple plus the scoring caches derived from it.
+    Replaced wholesale on add(); caches fill lazily and only ever describe
+    their own `presets`, so a reader holding a snapshot stays consistent.
+    """
+    __slots__ = ("presets", "generation", "genres", "table", "buckets")
+
+    def __init__(self, presets: Tuple[PresetBank, ...], generation: int) -> None:
+        self.presets = presets
+        self.generation = generation
+        self.genres: FrozenSet[str] = frozenset(
+            p.selector.genre_key for p in presets if p.selector.genre_key
+        )
+        self.table: Optional[PresetTable] = None
+        # lowercased genre -> presets + table; "" holds the genre-agnostic
+        # presets used for genres no selector names.
+        self.buckets: Dict[str, Tuple[Tuple[PresetBank, ...], PresetTable]] = {}
+
+    def full_table(self) -> PresetTable:
+        if self.table is None:
+            self.table = PresetTable.from_presets(self.presets)
+        return self.table
+
+    def bucket(self, key: str) -> Tuple[Tuple[PresetBank, ...], PresetTable]:
+        """Candidates for a lowercased genre."""
+        if key not in self.genres:
+            key = ""
+        b = self.buckets.get(key)
+        if b is None:
+            presets = tuple(
+                p for p in self.presets
+                if not p.selector.genre_key or p.selector.genre_key == key
+            )
+            b = self.buckets[key] = (presets, PresetTable.from_presets(presets))
+        return b
 
 class PresetRegistry:
+    """
+    Writers serialize on a lock and publish a new snapshot; readers (the
+    per-frame scoring path) take `self._snap` once and never lock, relying
+    on reference assignment being atomic.
+    """
+
     def __init__(self, presets: Optional[Iterable[PresetBank]] = None) -> None:
         self._by_id: Dict[str, PresetBank] = {}
+        self._lock = threading.Lock()
+        self._snap = _Snapshot((), 0)
         if presets:
             for p in presets:
                 self.add(p)
 
     def add(self, preset: PresetBank) -> None:
-        if preset.preset_id in self._by_id:
-            raise ValueError(f"Duplicate preset_id: {preset.preset_id}")
-        self._by_id[preset.preset_id] = preset
+        with self._lock:
+            if preset.preset_id in self._by_id:
+                raise ValueError(f"Duplicate preset_id: {preset.preset_id}")
+            self._by_id[preset.preset_id] = preset
+            old = self._snap
+            self._snap = _Snapshot(old.presets + (preset,), old.generation + 1)
+
+    @property
+    def generation(self) -> int:
+        """Bumped on every change so callers can key caches on registry contents."""
+        return self._snap.generation
 
     def get(self, preset_id: str) -> PresetBank:
         return self._by_id[preset_id]
 
-    def all(self) -> List[PresetBank]:
-        return list(self._by_id.values())
+    def all(self) -> Tuple[PresetBank, ...]:
+        return self._snap.presets
+
+    def table(self) -> PresetTable:
+        return self._snap.full_table()
+
+    def score_all(self, frame: ResonanceFrame) -> np.ndarray:
+        """Fit scores for every preset, aligned with all()."""
+        return score_all(frame, self._snap.full_table())
+
+    def candidates_for(self, genre: Optional[str]) -> Tuple[PresetBank, ...]:
+        """Presets whose genre gate can pass for `genre`, in registration order."""
+        snap = self._snap
+        if not genre:
+            return snap.presets
+        return snap.bucket(genre.lower())[0]
+
+    def score_candidates(self, frame: ResonanceFrame) -> Tuple[Tuple[PresetBank, ...], np.ndarray]:
+        """Score only candidates_for(frame.genre); returns (presets, scores)."""
+        snap = self._snap
+        keys = frame_gate_keys(frame)
+        if keys[0] is None:
+            return snap.presets, score_all(frame, snap.full_table(), keys)
+        presets, table = snap.bucket(keys[0])
+        return presets, score_all(frame, table, keys)
 
     def to_jsonable(self) -> List[dict]:
         return [asdict(p) for p in self.all()]
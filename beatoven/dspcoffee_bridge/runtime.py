@@ -1,33 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
 
 from .schema import FrameDelta, MacroUpdate, OpsCommand, PresetBank, ResonanceFrame, ResonanceMetrics
 from .registry import PresetRegistry
-from .scoring import choose_action, score_preset_fit
+from .scoring import choose_action
 from .transport_udp import UdpRealtimeLane
 from .transport_serial import SerialOpsLane
 
-def _safe01(x: float) -> float:
-    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else float(x)
-
-def _metrics_to_macros(m: ResonanceMetrics) -> Dict[str, float]:
+# Macro name for each ResonanceMetrics.KEYS column, in the same order.
+MACRO_NAMES: Tuple[str, ...] = (
+    "complexity",
+    "intensity",
+    "groove",
+    "energy",
+    "density",
+    "swing",
+    "brightness",
+    "tension",
+)
+
+def _metrics_to_macros(m: ResonanceMetrics) -> np.ndarray:
     """
     Default mapping. You will tune this once your dsp.coffee macro table exists.
-    Kept deterministic and explicit.
+    Kept deterministic and explicit: values aligned with MACRO_NAMES, clipped to [0, 1].
     """
-    m = m.clamp01()
-    return {
-        "complexity": m.complexity,
-        "intensity": m.emotional_intensity,
-        "groove": m.groove,
-        "energy": m.energy,
-        "density": m.density,
-        "swing": m.swing,
-        "brightness": m.brightness,
-        "tension": m.tension,
-    }
+    return np.clip(m.as_ndarray(), 0.0, 1.0)
+
+# Bounded LRU of preset-selection results; see BridgeRuntime._best_preset.
+_SCORE_CACHE_SIZE = 256
 
 class BridgeRuntime:
     """
@@ -39,6 +43,11 @@ class BridgeRuntime:
         rt.on_delta(...)
         rt.on_frame(...)
     from your existing ingestion code.
+
+    Deltas are debounced: a burst arriving faster than min_process_interval_ms
+    is merged into the cached frame and processed once, unless it changes the
+    genre, carries rhythm, or moves a metric by more than 0.05. Call flush()
+    when a stream goes idle to process any held-back state.
     """
 
     def __init__(
@@ -47,52 +56,111 @@ class BridgeRuntime:
         realtime_lane: UdpRealtimeLane,
         ops_lane: SerialOpsLane,
         score_thresholds: Tuple[float, float] = (0.72, 0.88),
+        min_process_interval_ms: int = 20,
     ) -> None:
         self.presets = presets
         self.rt = realtime_lane
         self.ops = ops_lane
         self.score_thresholds = score_thresholds
+        self.min_process_interval_ms = min_process_interval_ms
 
         self._cache: Optional[ResonanceFrame] = None
         self._current_preset_id: Optional[str] = None
+        self._score_cache: OrderedDict[Hashable, Tuple[Optional[PresetBank], float]] = OrderedDict()
+        self._last_processed: Optional[ResonanceFrame] = None
+        self._pending = False
+        self._last_content_hash: Optional[str] = None
+        self._macro_selections: Dict[str, Tuple[Tuple[str, ...], np.ndarray]] = {}
 
     def _merge_delta(self, base: ResonanceFrame, d: FrameDelta) -> ResonanceFrame:
-        merged = base
+        fields = dict(base.__dict__)
         if d.genre is not None:
-            merged = replace(merged, genre=d.genre)
+            fields["genre"] = d.genre
         if d.subgenre is not None:
-            merged = replace(merged, subgenre=d.subgenre)
+            fields["subgenre"] = d.subgenre
         if d.metrics is not None:
-            merged = replace(merged, metrics=d.metrics)
+            fields["metrics"] = d.metrics
         if d.rhythm is not None:
-            merged = replace(merged, rhythm=d.rhythm)
+            fields["rhythm"] = d.rhythm
         if d.extras is not None:
-            merged = replace(merged, extras={**merged.extras, **d.extras})
-        merged = replace(merged, ts_ms=d.ts_ms)
-        return merged.with_provenance_hash()
+            fields["extras"] = {**base.extras, **d.extras}
+        fields["ts_ms"] = d.ts_ms
+        fields["provenance_hash"] = None  # hashed in place below
+        return ResonanceFrame(**fields).with_provenance_hash()
 
     def _best_preset(self, frame: ResonanceFrame) -> Tuple[Optional[PresetBank], float]:
-        best: Optional[PresetBank] = None
-        best_s = 0.0
-        for p in self.presets.all():
-            s = score_preset_fit(frame, p)
-            if s > best_s:
-                best_s = s
-                best = p
-        return best, best_s
+        # Scores depend only on genre/subgenre/metrics (and the registry), so
+        # key on those rather than provenance_hash, which changes with ts_ms.
+        key = (self.presets.generation, frame.genre, frame.subgenre, frame.metrics)
+        hit = self._score_cache.get(key)
+        if hit is not None:
+            self._score_cache.move_to_end(key)
+            return hit
+
+        result = self._score_presets(frame)
+        self._score_cache[key] = result
+        if len(self._score_cache) > _SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+        return result
+
+    def _score_presets(self, frame: ResonanceFrame) -> Tuple[Optional[PresetBank], float]:
+        presets, scores = self.presets.score_candidates(frame)
+        if not presets:
+            return None, 0.0
+        idx = int(scores.argmax())
+        best_s = float(scores[idx])
+        if best_s <= 0.0:
+            return None, 0.0
+        return presets[idx], best_s
 
     def on_delta(self, delta: FrameDelta) -> None:
         if self._cache is None:
             # Convert first delta into a minimal frame; BeatOven should ideally send a full frame first.
             self._cache = ResonanceFrame.new(source="abraxas_stream", ts_ms=delta.ts_ms)
         self._cache = self._merge_delta(self._cache, delta)
-        self._process(self._cache)
+        if self._should_process(delta, self._cache):
+            self._process(self._cache)
+        else:
+            self._pending = True
 
     def on_frame(self, frame: ResonanceFrame) -> None:
         self._cache = frame.with_provenance_hash()
         self._process(self._cache)
 
+    def flush(self) -> None:
+        """Process the cached frame if deltas were held back by the debounce."""
+        if self._pending and self._cache is not None:
+            self._process(self._cache)
+
+    def _should_process(self, delta: FrameDelta, merged: ResonanceFrame) -> bool:
+        last = self._last_processed
+        if last is None:
+            return True
+        if merged.ts_ms - last.ts_ms >= self.min_process_interval_ms:
+            return True
+        if delta.rhythm is not None:
+            return True
+        if merged.genre != last.genre or merged.subgenre != last.subgenre:
+            return True
+        return self._metric_delta_large(last.metrics, merged.metrics)
+
+    @staticmethod
+    def _metric_delta_large(
+        old: Optional[ResonanceMetrics],
+        new: Optional[ResonanceMetrics],
+        threshold: float = 0.05,
+    ) -> bool:
+        if old is None or new is None:
+            return old is not new
+        return float(np.abs(new.as_ndarray() - old.as_ndarray()).max()) > threshold
+
     def _process(self, frame: ResonanceFrame) -> None:
+        self._last_processed = frame
+        self._pending = False
+        # Nothing but timing changed since the last frame we acted on.
+        if frame.content_hash is not None and frame.content_hash == self._last_content_hash:
+            return
+        self._last_content_hash = frame.content_hash
         best, best_score = self._best_preset(frame)
         best_id = None if best is None else best.preset_id
 
@@ -118,11 +186,16 @@ class BridgeRuntime:
             })
             if ok:
                 self._current_preset_id = best.preset_id
+            # A scene change sends no macros/pattern, so the same content
+            # still needs its follow-up action on the next frame.
+            self._last_content_hash = None
             return
 
         # Ensure we have a current preset loaded, otherwise stage it safely first.
+        # STAGE_NEXT and COMMIT_PATTERN are pipelined and acked together.
+        stage_nonce: Optional[int] = None
         if self._current_preset_id != best.preset_id:
-            ok = self.ops.send("STAGE_NEXT", {
+            stage_nonce = self.ops.send_async("STAGE_NEXT", {
                 "preset_id": best.preset_id,
                 "patch_graph_id": best.patch_graph_id,
                 "kit_id": best.kit_id,
@@ -130,10 +203,9 @@ class BridgeRuntime:
                 "crossfade_ms": best.crossfade_ms,
                 "provenance_hash": frame.provenance_hash,
             })
-            if ok:
-                self._current_preset_id = best.preset_id
 
-        if action == "PATTERN_INJECT" and frame.rhythm is not None:
+        inject = action == "PATTERN_INJECT" and frame.rhythm is not None
+        if inject:
             payload: Dict[str, Any] = {
                 "preset_id": best.preset_id,
                 "bpm": float(frame.rhythm.bpm),
@@ -144,7 +216,16 @@ class BridgeRuntime:
                 "perc": frame.rhythm.perc,
                 "provenance_hash": frame.provenance_hash,
             }
-            self.ops.send("COMMIT_PATTERN", payload)
+            self.ops.send_async("COMMIT_PATTERN", payload)
+
+        if stage_nonce is not None or inject:
+            acks = self.ops.flush()
+            if stage_nonce is not None and acks.get(stage_nonce, False):
+                self._current_preset_id = best.preset_id
+            if not all(acks.values()):
+                self._last_content_hash = None  # retry on the next frame
+
+        if inject:
             # also nudge tempo/swing realtime if present in metrics
             self.rt.send_meta("bpm", float(frame.rhythm.bpm))
             if frame.metrics is not None:
@@ -153,8 +234,14 @@ class BridgeRuntime:
 
         # PARAM_NUDGE
         if frame.metrics is not None:
-            macros = _metrics_to_macros(frame.metrics)
-            # Only send macros that exist in this preset's contract (if defined)
-            if best.macros:
-                macros = {k: _safe01(v) for k, v in macros.items() if k in set(best.macros)}
-            self.rt.send_macros(best.preset_id, macros)
+            names, idx = self._macro_selection(best)
+            self.rt.send_macro_values(best.preset_id, names, _metrics_to_macros(frame.metrics)[idx])
+
+    def _macro_selection(self, preset: PresetBank) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """MACRO_NAMES (and their column indices) within this preset's contract, if defined."""
+        sel = self._macro_selections.get(preset.preset_id)
+        if sel is None:
+            idx = [i for i, k in enumerate(MACRO_NAMES) if not preset.macros or k in preset.macro_set]
+            sel = (tuple(MACRO_NAMES[i] for i in idx), np.array(idx, dtype=np.intp))
+            self._macro_selections[preset.preset_id] = sel
+        return sel
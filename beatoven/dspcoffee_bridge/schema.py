@@ -1,45 +1,128 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
 import time
 import hashlib
-import json
+import secrets
+import struct
+
+import numpy as np
+
+from beatoven._stable_json import stable_json as _stable_json
 
 SourceKind = Literal["abraxas_stream", "abraxas_struct", "beatoven_render"]
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
-def _stable_hash(obj: Any) -> str:
-    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+_OPT_NONE = b"\x00"
+_OPT_SOME = b"\x01"
+_OPT_JSON = b"\x02"
+
+def _update_packed(h: Any, fmt: str, *values: Any) -> None:
+    """struct-pack values; any the format rejects (float ts, odd meter) go through JSON."""
+    try:
+        raw = struct.pack(fmt, *values)
+    except (struct.error, TypeError):
+        raw = _stable_json(list(values))
+        h.update(_OPT_JSON + struct.pack("<I", len(raw)))
+    else:
+        h.update(_OPT_SOME)
+    h.update(raw)
+
+def _update_str(h: Any, value: Optional[str]) -> None:
+    if value is None:
+        h.update(_OPT_NONE)
+        return
+    raw = value.encode("utf-8")
+    h.update(_OPT_SOME + struct.pack("<I", len(raw)))
+    h.update(raw)
+
+def _update_steps(h: Any, steps: Optional[List[float]]) -> None:
+    if steps is None:
+        h.update(_OPT_NONE)
+        return
+    _update_packed(h, f"<I{len(steps)}d", len(steps), *steps)
+
+def _metric_field(i: int) -> property:
+    return property(lambda self: self._arr.item(i))
 
-@dataclass(frozen=True)
 class ResonanceMetrics:
+    """
+    Immutable metric vector, stored as one float64 array in KEYS order so
+    scoring can use it directly (see as_ndarray). Fields read back as floats.
+    """
     # All normalized to [0, 1] unless specified.
-    complexity: float
-    emotional_intensity: float
-    groove: float
-    energy: float
-    density: float
-    swing: float
-    brightness: float
-    tension: float
+    KEYS: Tuple[str, ...] = (
+        "complexity", "emotional_intensity", "groove", "energy",
+        "density", "swing", "brightness", "tension",
+    )
+    KEY_INDEX: Dict[str, int] = {k: i for i, k in enumerate(KEYS)}
 
-    def clamp01(self) -> "ResonanceMetrics":
-        def c(x: float) -> float:
-            return 0.0 if x < 0.0 else 1.0 if x > 1.0 else float(x)
-        return ResonanceMetrics(
-            complexity=c(self.complexity),
-            emotional_intensity=c(self.emotional_intensity),
-            groove=c(self.groove),
-            energy=c(self.energy),
-            density=c(self.density),
-            swing=c(self.swing),
-            brightness=c(self.brightness),
-            tension=c(self.tension),
+    __slots__ = ("_arr",)
+
+    def __init__(
+        self,
+        complexity: float,
+        emotional_intensity: float,
+        groove: float,
+        energy: float,
+        density: float,
+        swing: float,
+        brightness: float,
+        tension: float,
+    ) -> None:
+        arr = np.array(
+            (complexity, emotional_intensity, groove, energy, density, swing, brightness, tension),
+            dtype=np.float64,
         )
+        arr.flags.writeable = False
+        self._arr = arr
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "ResonanceMetrics":
+        arr = np.array(values, dtype=np.float64)
+        if arr.shape != (len(cls.KEYS),):
+            raise ValueError(f"Expected {len(cls.KEYS)} metric values, got shape {arr.shape}")
+        arr.flags.writeable = False
+        m = cls.__new__(cls)
+        m._arr = arr
+        return m
+
+    complexity = _metric_field(0)
+    emotional_intensity = _metric_field(1)
+    groove = _metric_field(2)
+    energy = _metric_field(3)
+    density = _metric_field(4)
+    swing = _metric_field(5)
+    brightness = _metric_field(6)
+    tension = _metric_field(7)
+
+    def as_ndarray(self) -> np.ndarray:
+        """Read-only float64 view in KEYS order."""
+        return self._arr
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(self.KEYS, self._arr.tolist()))
+
+    def clamp01(self) -> "ResonanceMetrics":
+        return ResonanceMetrics.from_array(np.clip(self._arr, 0.0, 1.0))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResonanceMetrics):
+            return NotImplemented
+        return self._arr.tolist() == other._arr.tolist()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._arr.tolist()))
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"ResonanceMetrics({body})"
+
+    def __reduce__(self) -> Any:
+        return (ResonanceMetrics, tuple(self._arr.tolist()))
 
 @dataclass(frozen=True)
 class RhythmTokens:
@@ -71,34 +154,70 @@ class ResonanceFrame:
     abraxas_version: Optional[str] = None
     beatoven_version: Optional[str] = None
     provenance_hash: Optional[str] = None
+    # Same digest minus id/ts_ms: equal for frames that differ only in timing.
+    content_hash: Optional[str] = field(default=None, compare=False, repr=False)
+
+    def _content_digest(self) -> bytes:
+        # Length-prefixed binary packing of every hashed field except id and
+        # ts_ms; only a non-empty extras dict still goes through JSON (sorted keys).
+        h = hashlib.blake2b(digest_size=16)
+        _update_str(h, self.source)
+        _update_str(h, self.genre)
+        _update_str(h, self.subgenre)
+
+        m = self.metrics
+        if m is None:
+            h.update(_OPT_NONE)
+        else:
+            h.update(_OPT_SOME)
+            h.update(m.as_ndarray().astype("<f8", copy=False).tobytes())
+
+        r = self.rhythm
+        if r is None:
+            h.update(_OPT_NONE)
+        else:
+            _update_packed(h, "<d2i", r.bpm, *r.meter)
+            for steps in (r.kick, r.snare, r.hat, r.perc):
+                _update_steps(h, steps)
+
+        if self.extras:
+            h.update(_OPT_SOME)
+            h.update(_stable_json(self.extras))
+        else:
+            h.update(_OPT_NONE)
+
+        _update_str(h, self.abraxas_version)
+        _update_str(h, self.beatoven_version)
+        return h.digest()
 
     def with_provenance_hash(self) -> "ResonanceFrame":
-        core = {
-            "id": self.id,
-            "ts_ms": self.ts_ms,
-            "source": self.source,
-            "genre": self.genre,
-            "subgenre": self.subgenre,
-            "metrics": None if self.metrics is None else self.metrics.__dict__,
-            "rhythm": None if self.rhythm is None else {
-                "bpm": self.rhythm.bpm,
-                "meter": self.rhythm.meter,
-                "kick": self.rhythm.kick,
-                "snare": self.rhythm.snare,
-                "hat": self.rhythm.hat,
-                "perc": self.rhythm.perc,
-            },
-            "extras": self.extras,
-            "abraxas_version": self.abraxas_version,
-            "beatoven_version": self.beatoven_version,
-        }
-        ph = _stable_hash(core)
-        return ResonanceFrame(**{**self.__dict__, "provenance_hash": ph})
+        """
+        Frame with provenance_hash (and content_hash) computed.
+
+        A frame that has never been hashed (provenance_hash is None) is
+        filled in place, exactly once, and returned; freshly built frames
+        skip a second construction that way. An already-hashed frame may
+        carry stale hashes (e.g. after dataclasses.replace), so it gets a
+        recomputed copy instead and is never mutated.
+        """
+        content = self._content_digest()
+        h = hashlib.blake2b(content, digest_size=16)
+        _update_str(h, self.id)
+        _update_packed(h, "<q", self.ts_ms)
+        if self.provenance_hash is None:
+            object.__setattr__(self, "content_hash", content.hex())
+            object.__setattr__(self, "provenance_hash", h.hexdigest())
+            return self
+        return ResonanceFrame(**{
+            **self.__dict__,
+            "provenance_hash": h.hexdigest(),
+            "content_hash": content.hex(),
+        })
 
     @staticmethod
     def new(source: SourceKind, **kwargs: Any) -> "ResonanceFrame":
         base = {
-            "id": kwargs.pop("id", _stable_hash({"t": _now_ms(), "r": time.perf_counter_ns()})),
+            "id": kwargs.pop("id", None) or secrets.token_hex(16),
             "ts_ms": kwargs.pop("ts_ms", _now_ms()),
             "source": source,
         }
@@ -122,6 +241,19 @@ class PresetSelector:
     targets: Dict[str, Tuple[float, float]] = field(default_factory=dict)
     weights: Dict[str, float] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Lowercased gate labels, computed once; not dataclass fields.
+        object.__setattr__(self, "_genre_key", self.genre.lower() if self.genre else None)
+        object.__setattr__(self, "_subgenre_key", self.subgenre.lower() if self.subgenre else None)
+
+    @property
+    def genre_key(self) -> Optional[str]:
+        return self._genre_key
+
+    @property
+    def subgenre_key(self) -> Optional[str]:
+        return self._subgenre_key
+
 @dataclass(frozen=True)
 class PresetBank:
     preset_id: str
@@ -139,6 +271,15 @@ class PresetBank:
     scene_change_quantize: Literal["bar", "beat", "immediate"] = "bar"
     crossfade_ms: int = 150
 
+    def __post_init__(self) -> None:
+        # Not a dataclass field: stays out of eq/hash/asdict.
+        object.__setattr__(self, "_macro_set", frozenset(self.macros))
+
+    @property
+    def macro_set(self) -> FrozenSet[str]:
+        """Macro names as a frozenset, fixed at construction."""
+        return self._macro_set
+
 @dataclass(frozen=True)
 class MacroUpdate:
     preset_id: str
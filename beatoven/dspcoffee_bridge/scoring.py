@@ -1,25 +1,35 @@
 from __future__ import annotations
 
-from typing import Dict, Literal, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, Literal, Optional, Sequence, Tuple
 
-from .schema import PresetBank, ResonanceFrame
+import numpy as np
+
+from .schema import PresetBank, ResonanceFrame, ResonanceMetrics
+
+# Column order for the vectorized preset table.
+METRIC_KEYS: Tuple[str, ...] = ResonanceMetrics.KEYS
 
 def _metric(frame: ResonanceFrame, key: str) -> Optional[float]:
     if frame.metrics is None:
         return None
-    return getattr(frame.metrics, key, None)
+    i = ResonanceMetrics.KEY_INDEX.get(key)
+    return None if i is None else frame.metrics.as_ndarray().item(i)
 
 def score_preset_fit(frame: ResonanceFrame, preset: PresetBank) -> float:
     """
     Deterministic fit score in [0,1].
     - Genre/subgenre are hard gates if set in selector.
     - Metrics contribute weighted overlap with target ranges.
+
+    Scalar reference for a single preset; BridgeRuntime scores a whole
+    registry at once through score_all, which must stay in agreement.
     """
     sel = preset.selector
 
-    if sel.genre and frame.genre and sel.genre.lower() != frame.genre.lower():
+    if sel.genre_key and frame.genre and sel.genre_key != frame.genre.lower():
         return 0.0
-    if sel.subgenre and frame.subgenre and sel.subgenre.lower() != frame.subgenre.lower():
+    if sel.subgenre_key and frame.subgenre and sel.subgenre_key != frame.subgenre.lower():
         return 0.0
 
     if not sel.targets:
@@ -47,6 +57,105 @@ def score_preset_fit(frame: ResonanceFrame, preset: PresetBank) -> float:
         return 0.2
     return max(0.0, min(1.0, accum / total_w))
 
+@dataclass(frozen=True)
+class PresetTable:
+    """
+    Structure-of-arrays view of a preset list, one row per preset and one
+    column per METRIC_KEYS entry. Built once per registry change so a frame
+    can be scored against every preset in a single NumPy pass.
+    """
+    lo: np.ndarray            # (N, M) target range minimum
+    hi: np.ndarray            # (N, M) target range maximum
+    w: np.ndarray             # (N, M) weights
+    has_target: np.ndarray    # (N, M) bool, metric has a target range
+    any_target: np.ndarray    # (N,) bool, selector defines any target at all
+    genre_ids: np.ndarray     # (N,) int, -1 when the selector has no genre gate
+    subgenre_ids: np.ndarray  # (N,) int, -1 when the selector has no subgenre gate
+    genre_index: Dict[str, int]
+    subgenre_index: Dict[str, int]
+
+    @staticmethod
+    def from_presets(presets: Sequence[PresetBank]) -> "PresetTable":
+        n, m = len(presets), len(METRIC_KEYS)
+        lo = np.zeros((n, m))
+        hi = np.zeros((n, m))
+        w = np.zeros((n, m))
+        has_target = np.zeros((n, m), dtype=bool)
+        any_target = np.zeros(n, dtype=bool)
+        genre_ids = np.full(n, -1, dtype=np.int64)
+        subgenre_ids = np.full(n, -1, dtype=np.int64)
+        genre_index: Dict[str, int] = {}
+        subgenre_index: Dict[str, int] = {}
+
+        for i, p in enumerate(presets):
+            sel = p.selector
+            if sel.genre_key:
+                genre_ids[i] = genre_index.setdefault(sel.genre_key, len(genre_index))
+            if sel.subgenre_key:
+                subgenre_ids[i] = subgenre_index.setdefault(sel.subgenre_key, len(subgenre_index))
+            any_target[i] = bool(sel.targets)
+            for j, k in enumerate(METRIC_KEYS):
+                if k in sel.targets:
+                    lo[i, j], hi[i, j] = sel.targets[k]
+                    w[i, j] = float(sel.weights.get(k, 1.0))
+                    has_target[i, j] = True
+
+        return PresetTable(
+            lo=lo, hi=hi, w=w, has_target=has_target, any_target=any_target,
+            genre_ids=genre_ids, subgenre_ids=subgenre_ids,
+            genre_index=genre_index, subgenre_index=subgenre_index,
+        )
+
+def _gate_id(index: Dict[str, int], key: Optional[str]) -> int:
+    # -1: frame carries no label (gate passes); -2: label unknown to every preset
+    if not key:
+        return -1
+    return index.get(key, -2)
+
+def frame_gate_keys(frame: ResonanceFrame) -> Tuple[Optional[str], Optional[str]]:
+    """Lowercased (genre, subgenre) of a frame, as compared against selectors."""
+    return (
+        frame.genre.lower() if frame.genre else None,
+        frame.subgenre.lower() if frame.subgenre else None,
+    )
+
+def score_all(
+    frame: ResonanceFrame,
+    table: PresetTable,
+    gate_keys: Optional[Tuple[Optional[str], Optional[str]]] = None,
+) -> np.ndarray:
+    """
+    Vectorized score_preset_fit over every row of a PresetTable.
+    Returns float64 scores of shape (N,) in table order. Pass gate_keys
+    (see frame_gate_keys) when the caller has already lowercased them.
+    """
+    if frame.metrics is None:
+        active = np.zeros_like(table.has_target)
+        v = np.zeros(len(METRIC_KEYS))
+    else:
+        v = frame.metrics.as_ndarray()
+        active = table.has_target
+
+    inside = (table.lo <= v) & (v <= table.hi)
+    dist = np.minimum(np.abs(v - table.lo), np.abs(v - table.hi))
+    s = np.where(inside, 1.0, np.maximum(0.0, 1.0 - dist / 0.5))
+
+    w = np.where(active, table.w, 0.0)
+    total_w = w.sum(axis=1)
+    accum = (w * s).sum(axis=1)
+    ratio = np.divide(accum, total_w, out=np.zeros_like(accum), where=total_w > 0.0)
+    scores = np.where(total_w > 0.0, np.clip(ratio, 0.0, 1.0), 0.2)
+    scores[~table.any_target] = 0.25
+
+    genre_key, subgenre_key = gate_keys if gate_keys is not None else frame_gate_keys(frame)
+    g = _gate_id(table.genre_index, genre_key)
+    if g != -1:
+        scores[(table.genre_ids >= 0) & (table.genre_ids != g)] = 0.0
+    sg = _gate_id(table.subgenre_index, subgenre_key)
+    if sg != -1:
+        scores[(table.subgenre_ids >= 0) & (table.subgenre_ids != sg)] = 0.0
+    return scores
+
 ActionKind = Literal["PARAM_NUDGE", "SCENE_CHANGE", "PATTERN_INJECT", "NOOP"]
 
 def choose_action(
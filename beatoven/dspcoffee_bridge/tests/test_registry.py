@@ -0,0 +1,78 @@
+import pytest
+
+from beatoven.dspcoffee_bridge.registry import PresetRegistry
+from beatoven.dspcoffee_bridge.schema import PresetBank, PresetSelector
+
+
+def _preset(pid: str) -> PresetBank:
+    return PresetBank(preset_id=pid, name=pid, selector=PresetSelector(), patch_graph_id=1)
+
+def test_all_snapshot_reused_until_add():
+    reg = PresetRegistry([_preset("a"), _preset("b")])
+    first = reg.all()
+    assert reg.all() is first
+    assert [p.preset_id for p in first] == ["a", "b"]
+
+    reg.add(_preset("c"))
+    assert [p.preset_id for p in reg.all()] == ["a", "b", "c"]
+
+def test_duplicate_rejected():
+    reg = PresetRegistry([_preset("a")])
+    with pytest.raises(ValueError):
+        reg.add(_preset("a"))
+
+def _genre_preset(pid: str, genre=None) -> PresetBank:
+    return PresetBank(
+        preset_id=pid,
+        name=pid,
+        selector=PresetSelector(genre=genre, targets={"energy": (0.0, 1.0)}),
+        patch_graph_id=1,
+    )
+
+def test_candidates_for_genre():
+    reg = PresetRegistry([
+        _genre_preset("any1"),
+        _genre_preset("techno", "Techno"),
+        _genre_preset("house", "house"),
+        _genre_preset("any2"),
+    ])
+    ids = lambda ps: [p.preset_id for p in ps]
+    assert ids(reg.candidates_for("TECHNO")) == ["any1", "techno", "any2"]
+    assert ids(reg.candidates_for("dnb")) == ["any1", "any2"]
+    assert ids(reg.candidates_for(None)) == ["any1", "techno", "house", "any2"]
+
+    reg.add(_genre_preset("dnb", "dnb"))
+    assert ids(reg.candidates_for("dnb")) == ["any1", "any2", "dnb"]
+
+def test_macro_set_not_serialized():
+    p = PresetBank(preset_id="m", name="m", selector=PresetSelector(), patch_graph_id=1, macros=["a", "b"])
+    assert p.macro_set == frozenset({"a", "b"})
+    assert "_macro_set" not in PresetRegistry([p]).to_jsonable()[0]
+
+def test_concurrent_add_and_score():
+    import threading
+
+    from beatoven.dspcoffee_bridge.schema import ResonanceFrame, ResonanceMetrics
+
+    reg = PresetRegistry()
+    frame = ResonanceFrame.new(source="abraxas_struct", genre="techno", metrics=ResonanceMetrics(*[0.5] * 8))
+    errors = []
+
+    def reader():
+        try:
+            for _ in range(500):
+                presets, scores = reg.score_candidates(frame)
+                assert len(presets) == len(scores)
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for i in range(200):
+        reg.add(_genre_preset(f"p{i}", "techno" if i % 2 else None))
+    for t in threads:
+        t.join()
+    assert not errors
+    assert reg.generation == 200
+    assert len(reg.candidates_for("techno")) == 200
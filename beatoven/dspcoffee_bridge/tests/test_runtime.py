@@ -0,0 +1,132 @@
+from beatoven.dspcoffee_bridge.example_preset_pack import PRESETS
+from beatoven.dspcoffee_bridge.registry import PresetRegistry
+from beatoven.dspcoffee_bridge.runtime import BridgeRuntime
+from beatoven.dspcoffee_bridge.schema import (
+    FrameDelta, PresetBank, PresetSelector, ResonanceFrame, ResonanceMetrics,
+)
+
+
+class _Lane:
+    def __init__(self):
+        self.calls = []
+        self._pending = []
+
+    def send(self, kind, payload):
+        self.calls.append((kind, payload))
+        return True
+
+    def send_async(self, kind, payload):
+        self.calls.append((kind, payload))
+        self._pending.append(len(self.calls))
+        return len(self.calls)
+
+    def flush(self):
+        acks = {n: True for n in self._pending}
+        self._pending = []
+        self.calls.append(("flush",))
+        return acks
+
+    def send_macro_values(self, preset_id, names, values):
+        self.calls.append(("macros", preset_id, dict(zip(names, values))))
+
+    def send_meta(self, key, value):
+        self.calls.append(("meta", key, value))
+
+DARK = ResonanceMetrics(
+    complexity=0.5, emotional_intensity=0.5, groove=0.8, energy=0.9,
+    density=0.5, swing=0.5, brightness=0.2, tension=0.9,
+)
+
+def _runtime(registry=None):
+    return BridgeRuntime(registry or PresetRegistry(PRESETS), _Lane(), _Lane())
+
+def test_best_preset_cached_across_timestamps():
+    rt = _runtime()
+    calls = []
+    score_presets = rt._score_presets
+    rt._score_presets = lambda f: calls.append(f) or score_presets(f)
+
+    for ts in range(0, 100, 20):
+        rt.on_delta(FrameDelta(ts_ms=ts, genre="techno", subgenre="dark", metrics=DARK))
+    assert len(calls) == 1
+    assert rt._current_preset_id == "techno_dark_driver"
+
+def test_best_preset_cache_invalidated_on_add():
+    registry = PresetRegistry(PRESETS)
+    rt = _runtime(registry)
+    frame = ResonanceFrame.new(source="abraxas_struct", genre="ambient", metrics=DARK)
+    assert rt._best_preset(frame) == (None, 0.0)
+
+    registry.add(PresetBank(
+        preset_id="ambient_any",
+        name="Ambient",
+        selector=PresetSelector(genre="ambient", targets={"energy": (0.0, 1.0)}),
+        patch_graph_id=9,
+    ))
+    best, score = rt._best_preset(frame)
+    assert best.preset_id == "ambient_any" and score == 1.0
+
+def test_scene_change_then_nudge():
+    rt = _runtime()
+    rt.on_frame(ResonanceFrame.new(source="abraxas_struct", genre="techno", subgenre="dark", metrics=DARK))
+    assert rt.ops.calls[0][0] == "LOAD_PRESET"
+
+    rt.on_frame(ResonanceFrame.new(source="abraxas_struct", genre="techno", subgenre="dark", metrics=DARK))
+    kind, preset_id, macros = rt.rt.calls[-1]
+    assert (kind, preset_id) == ("macros", "techno_dark_driver")
+    assert set(macros) == {"energy", "tension", "groove", "density", "swing", "brightness"}
+
+    # identical content again: nothing left to send
+    sent = len(rt.rt.calls) + len(rt.ops.calls)
+    rt.on_frame(ResonanceFrame.new(source="abraxas_struct", genre="techno", subgenre="dark", metrics=DARK))
+    assert len(rt.rt.calls) + len(rt.ops.calls) == sent
+
+def test_merge_delta_overlays_fields():
+    rt = _runtime()
+    base = ResonanceFrame.new(source="abraxas_stream", id="f", ts_ms=1, genre="house", extras={"a": 1, "b": 2})
+    merged = rt._merge_delta(base, FrameDelta(ts_ms=5, subgenre="deep", metrics=DARK, extras={"b": 3}))
+
+    assert (merged.id, merged.ts_ms, merged.genre, merged.subgenre) == ("f", 5, "house", "deep")
+    assert merged.metrics == DARK
+    assert merged.extras == {"a": 1, "b": 3}
+    assert base.extras == {"a": 1, "b": 2}
+    assert merged.provenance_hash == merged.with_provenance_hash().provenance_hash
+    assert merged.provenance_hash != base.provenance_hash
+
+def test_delta_bursts_debounced():
+    rt = _runtime()
+    processed = []
+    process = rt._process
+    rt._process = lambda f: processed.append(f.ts_ms) or process(f)
+
+    rt.on_delta(FrameDelta(ts_ms=0, genre="techno", subgenre="dark", metrics=DARK))
+    nudged = ResonanceMetrics(**{**DARK.to_dict(), "energy": DARK.energy - 0.01})
+    for ts in range(1, 10):
+        rt.on_delta(FrameDelta(ts_ms=ts, metrics=nudged))
+    assert processed == [0]
+
+    jumped = ResonanceMetrics(**{**DARK.to_dict(), "energy": 0.5})
+    rt.on_delta(FrameDelta(ts_ms=10, metrics=jumped))
+    rt.on_delta(FrameDelta(ts_ms=11, genre="house"))
+    rt.on_delta(FrameDelta(ts_ms=12, extras={"k": 1}))
+    rt.on_delta(FrameDelta(ts_ms=31, extras={"k": 2}))
+    assert processed == [0, 10, 11, 31]
+
+    rt.on_delta(FrameDelta(ts_ms=32, extras={"k": 3}))
+    rt.flush()
+    rt.flush()
+    assert processed == [0, 10, 11, 31, 32]
+
+def test_stage_and_pattern_pipelined():
+    from beatoven.dspcoffee_bridge.schema import RhythmTokens
+
+    rt = _runtime()
+    rt._current_preset_id = "house_swing_chop"
+    mid = ResonanceMetrics(**{**DARK.to_dict(), "energy": 0.6, "tension": 0.55})
+    rt.on_frame(ResonanceFrame.new(
+        source="abraxas_struct", genre="techno", subgenre="dark", metrics=mid,
+        rhythm=RhythmTokens(bpm=130.0, kick=[1.0, 0.0, 1.0, 0.0]),
+    ))
+    assert [c[0] for c in rt.ops.calls] == ["STAGE_NEXT", "COMMIT_PATTERN", "flush"]
+    assert rt._current_preset_id == "techno_dark_driver"
+    assert rt.rt.calls[0] == ("meta", "bpm", 130.0)
@@ -0,0 +1,99 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from beatoven.dspcoffee_bridge.schema import ResonanceFrame, ResonanceMetrics, RhythmTokens
+
+
+def _frame(**kwargs) -> ResonanceFrame:
+    return ResonanceFrame.new(
+        source="abraxas_struct",
+        id="f1",
+        ts_ms=1000,
+        genre="techno",
+        metrics=ResonanceMetrics(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8),
+        rhythm=RhythmTokens(bpm=128.0, kick=[1.0, 0.0, 0.5, 0.0]),
+        **kwargs,
+    )
+
+def test_provenance_hash_stable():
+    a, b = _frame(extras={"b": 1, "a": [1, 2]}), _frame(extras={"a": [1, 2], "b": 1})
+    assert a.provenance_hash == b.provenance_hash
+    assert a.with_provenance_hash().provenance_hash == a.provenance_hash
+
+def test_provenance_hash_numpy_extras():
+    """numpy scalars/arrays in extras hash like their Python values."""
+    py = _frame(extras={"x": 0.5, "n": 3, "small": 1e-05, "big": 1e20, "v": [0.25, 0.75]})
+    npy = _frame(extras={
+        "x": np.float64(0.5), "n": np.int64(3), "small": np.float64(1e-05),
+        "big": np.float64(1e20), "v": np.array([0.25, 0.75]),
+    })
+    assert npy.provenance_hash == py.provenance_hash
+    assert ResonanceFrame.new("beatoven_render", extras={"x": np.float32(0.5)}).provenance_hash
+
+def test_provenance_hash_tracks_content():
+    base = _frame()
+    variants = [
+        replace(base, ts_ms=1001),
+        replace(base, genre=None),
+        replace(base, genre="tech", subgenre="no"),
+        replace(base, metrics=ResonanceMetrics(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.81)),
+        replace(base, rhythm=replace(base.rhythm, kick=[1.0, 0.0, 0.5])),
+        replace(base, rhythm=replace(base.rhythm, kick=None, snare=[1.0, 0.0, 0.5, 0.0])),
+        replace(base, extras={"k": "v"}),
+    ]
+    hashes = {v.with_provenance_hash().provenance_hash for v in variants}
+    hashes.add(base.provenance_hash)
+    assert len(hashes) == len(variants) + 1
+
+def test_provenance_hash_accepts_loose_values():
+    """Values struct packing rejects still hash (via JSON) and stay distinct."""
+    base = _frame()
+    variants = [
+        replace(base, ts_ms=1000.5),
+        replace(base, ts_ms=None),
+        replace(base, rhythm=replace(base.rhythm, meter=(4, None))),
+        replace(base, rhythm=replace(base.rhythm, meter=(7, 8, 2))),
+        replace(base, rhythm=replace(base.rhythm, meter=(4.5, 4))),
+        replace(base, rhythm=replace(base.rhythm, kick=[1.0, None])),
+    ]
+    hashes = {v.with_provenance_hash().provenance_hash for v in variants}
+    hashes.add(base.provenance_hash)
+    assert len(hashes) == len(variants) + 1
+    assert replace(base, ts_ms=np.int64(1000)).with_provenance_hash().provenance_hash == base.provenance_hash
+
+def test_metrics_value_semantics():
+    m = ResonanceMetrics(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 1.8)
+    assert m.tension == 1.8 and isinstance(m.tension, float)
+    assert m == ResonanceMetrics.from_array(m.as_ndarray())
+    assert len({m, ResonanceMetrics(*m.as_ndarray())}) == 1
+    assert m.clamp01().tension == 1.0 and m.tension == 1.8
+    assert m.to_dict()["emotional_intensity"] == 0.2
+    with pytest.raises(AttributeError):
+        m.energy = 0.0
+    with pytest.raises(ValueError):
+        m.as_ndarray()[0] = 1.0
+
+def test_new_generates_unique_ids():
+    ids = {ResonanceFrame.new(source="abraxas_stream").id for _ in range(100)}
+    assert len(ids) == 100
+    assert ResonanceFrame.new(source="abraxas_stream", id="fixed").id == "fixed"
+
+def test_content_hash_ignores_timing():
+    a = _frame()
+    b = replace(a, id="f2", ts_ms=2000).with_provenance_hash()
+    assert a.content_hash == b.content_hash
+    assert a.provenance_hash != b.provenance_hash
+    assert replace(a, genre="house").with_provenance_hash().content_hash != a.content_hash
+
+def test_with_provenance_hash_fills_unhashed_in_place():
+    raw = ResonanceFrame(id="r", ts_ms=1, source="abraxas_stream", genre="techno")
+    hashed = raw.with_provenance_hash()
+    assert hashed is raw and raw.provenance_hash is not None
+
+    stale = replace(raw, genre="house")
+    fresh = stale.with_provenance_hash()
+    assert fresh is not stale
+    assert stale.provenance_hash == raw.provenance_hash
+    assert fresh.provenance_hash != raw.provenance_hash
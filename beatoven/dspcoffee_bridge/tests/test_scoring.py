@@ -33,3 +33,46 @@ def test_score_wrong_genre_zero():
         patch_graph_id=2,
     )
     assert score_preset_fit(f, p) == 0.0
+
+def test_score_all_matches_scalar():
+    import random
+
+    from beatoven.dspcoffee_bridge.scoring import METRIC_KEYS, PresetTable, score_all
+
+    rng = random.Random(7)
+    genres = [None, "techno", "House", "ambient"]
+    presets = []
+    for i in range(40):
+        keys = rng.sample(METRIC_KEYS + ("not_a_metric",), rng.randint(0, 4))
+        targets = {}
+        for k in keys:
+            lo = rng.random()
+            targets[k] = (lo, min(1.0, lo + rng.random() * 0.4))
+        presets.append(PresetBank(
+            preset_id=f"p{i}",
+            name=f"p{i}",
+            selector=PresetSelector(
+                genre=rng.choice(genres),
+                subgenre=rng.choice([None, "dark", "deep"]),
+                targets=targets,
+                weights={k: rng.uniform(0.0, 2.0) for k in keys if rng.random() < 0.5},
+            ),
+            patch_graph_id=i,
+        ))
+    table = PresetTable.from_presets(presets)
+
+    for _ in range(20):
+        metrics = None
+        if rng.random() < 0.8:
+            metrics = ResonanceMetrics(*(rng.uniform(-0.2, 1.2) for _ in METRIC_KEYS))
+        f = ResonanceFrame.new(
+            source="abraxas_struct",
+            genre=rng.choice(genres + ["TECHNO", "dnb"]),
+            subgenre=rng.choice([None, "dark", "minimal"]),
+            metrics=metrics,
+        )
+        expected = [score_preset_fit(f, p) for p in presets]
+        got = score_all(f, table)
+        assert got.shape == (len(presets),)
+        for e, g in zip(expected, got):
+            assert abs(e - g) < 1e-12
@@ -0,0 +1,94 @@
+import struct
+
+import cbor2
+import pytest
+
+from beatoven.dspcoffee_bridge import transport_serial
+from beatoven.dspcoffee_bridge.transport_serial import SerialOpsLane
+
+
+class _FakePort:
+    """Firmware stand-in: acks every frame written, newest first, once asked to read."""
+
+    def __init__(self, drop=()):
+        self.timeout = 0.25
+        self.timeouts = []
+        self.reads = 0
+        self.written = []
+        self.drop = set(drop)
+        self._rx = bytearray()
+        self._unacked = []
+
+    def write(self, data):
+        (n,) = struct.unpack(">I", data[:4])
+        msg = cbor2.loads(bytes(data[4:4 + n]))
+        self.written.append(msg)
+        if msg["nonce"] in self.drop:
+            self.drop.discard(msg["nonce"])
+        else:
+            self._unacked.append(msg["nonce"])
+
+    def _fill(self):
+        while self._unacked:
+            raw = cbor2.dumps({"ack": self._unacked.pop(), "ok": True})
+            self._rx += struct.pack(">I", len(raw)) + raw
+
+    @property
+    def in_waiting(self):
+        self._fill()
+        return len(self._rx)
+
+    def read(self, n):
+        self.timeouts.append(self.timeout)
+        self.reads += 1
+        self._fill()
+        out = bytes(self._rx[:n])
+        del self._rx[:n]
+        return out
+
+@pytest.fixture
+def lane(monkeypatch):
+    ports = []
+    monkeypatch.setattr(
+        transport_serial.serial, "Serial",
+        lambda **kw: ports.append(_FakePort()) or ports[-1],
+    )
+    return SerialOpsLane(port="fake")
+
+def test_pipelined_acks_out_of_order(lane):
+    a = lane.send_async("STAGE_NEXT", {"preset_id": "p"})
+    b = lane.send_async("COMMIT_PATTERN", {"preset_id": "p"})
+    assert [m["kind"] for m in lane.ser.written] == ["STAGE_NEXT", "COMMIT_PATTERN"]
+    assert lane.flush() == {a: True, b: True}
+    assert lane.ser.reads == 1
+    assert lane.flush() == {}
+
+def test_unacked_command_resent(lane):
+    lane.ser.drop = {1}
+    assert lane.send("PING", {}) is True
+    assert [m["nonce"] for m in lane.ser.written] == [1, 1]
+    assert all(0.0 < t <= 0.6 for t in lane.ser.timeouts)
+    assert lane.ser.timeout == 0.25
+
+def test_frame_matches_dict_encoding(lane):
+    payload = {"preset_id": "p", "meter": [4, 4], "kick": [1.0, 0.0], "kit_id": None}
+    for nonce in (1, 300, 2_000_000_000):
+        raw = cbor2.dumps({"kind": "COMMIT_PATTERN", "nonce": nonce, "payload": payload})
+        assert lane._encode_frame("COMMIT_PATTERN", nonce, payload) == struct.pack(">I", len(raw)) + raw
+
+class _ChunkedPort:
+    in_waiting = 0
+    timeout = 0.25
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read(self, n):
+        return self.chunks.pop(0)
+
+def test_partial_frame_kept_across_reads(lane):
+    raw = cbor2.dumps({"ack": 7, "ok": True})
+    data = struct.pack(">I", len(raw)) + raw
+    lane.ser = _ChunkedPort([data[:3], data[3:6], b"", data[6:]])
+    assert lane._read_frame() is None
+    assert lane._read_frame() == {"ack": 7, "ok": True}
@@ -0,0 +1,56 @@
+import socket
+
+import pytest
+
+from beatoven.dspcoffee_bridge.transport_udp import UdpRealtimeLane
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+def _drain(sock):
+    out = []
+    sock.settimeout(0.2)
+    try:
+        while True:
+            out.append(sock.recv(65535))
+    except socket.timeout:
+        return out
+
+def test_send_macros_single_datagram(receiver):
+    lane = UdpRealtimeLane(*receiver.getsockname())
+    lane.send_macros("p1", {"energy": 0.5, "swing": 1.5, "groove": -1.0})
+    packets = _drain(receiver)
+    assert packets == [
+        b"/macro p1 energy 0.500000\n/macro p1 swing 1.000000\n/macro p1 groove 0.000000\n"
+    ]
+
+def test_send_macros_splits_large_batches(receiver):
+    lane = UdpRealtimeLane(*receiver.getsockname())
+    values = {f"macro_{i:03d}": i / 100 for i in range(100)}
+    lane.send_macros("preset", values)
+    packets = _drain(receiver)
+    assert len(packets) > 1
+    assert all(len(p) <= 1200 for p in packets)
+    lines = b"".join(packets).decode().splitlines()
+    assert lines == [f"/macro preset {k} {v:.6f}" for k, v in values.items()]
+
+def test_send_meta(receiver):
+    lane = UdpRealtimeLane(*receiver.getsockname())
+    lane.send_meta("bpm", 128)
+    assert _drain(receiver) == [b"/meta bpm 128.000000\n"]
+
+def test_send_buffer_reused_and_grown(receiver):
+    lane = UdpRealtimeLane(*receiver.getsockname())
+    long_name = "x" * 3000
+    lane.send_macro("p1", long_name, 0.25)
+    lane.send_macro("p1", "energy", 0.75)
+    assert _drain(receiver) == [
+        f"/macro p1 {long_name} 0.250000\n".encode(),
+        b"/macro p1 energy 0.750000\n",
+    ]
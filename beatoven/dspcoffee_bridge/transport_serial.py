@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import struct
 import time
 from typing import Any, Dict, Optional
@@ -7,6 +8,12 @@ from typing import Any, Dict, Optional
 import cbor2
 import serial
 
+# Fixed CBOR fragments of the command map {"kind": ..., "nonce": ..., "payload": ...}
+_CMD_HEAD = b"\xa3" + cbor2.dumps("kind")  # map(3), first key
+_CMD_NONCE = cbor2.dumps("nonce")
+_CMD_PAYLOAD = cbor2.dumps("payload")
+_LEN_PLACEHOLDER = b"\x00\x00\x00\x00"
+
 class SerialOpsLane:
     """
     Reliable lane over serial with ACK.
@@ -19,11 +26,19 @@ class SerialOpsLane:
 
     Firmware must reply:
       {"ack": nonce, "ok": true}   (CBOR framed the same way)
+
+    Commands can be pipelined: send_async() writes a frame and returns its
+    nonce without waiting, flush() then collects ACKs in whatever order they
+    arrive. send() is the one-shot synchronous form.
     """
 
     def __init__(self, port: str, baud: int = 115200, timeout_s: float = 0.25) -> None:
         self.ser = serial.Serial(port=port, baudrate=baud, timeout=timeout_s)
         self._nonce = 1
+        self._pending: Dict[int, bytes] = {}  # nonce -> unacked encoded frame
+        self._tx = io.BytesIO()
+        self._rx = bytearray()  # received bytes not yet parsed into frames
+        self._enc = cbor2.CBOREncoder(self._tx)
 
     def _next_nonce(self) -> int:
         n = self._nonce
@@ -32,37 +47,98 @@ class SerialOpsLane:
             self._nonce = 1
         return n
 
-    def _write_frame(self, obj: Dict[str, Any]) -> None:
-        raw = cbor2.dumps(obj)
-        hdr = struct.pack(">I", len(raw))
-        self.ser.write(hdr + raw)
+    def _encode_frame(self, kind: str, nonce: int, payload: Dict[str, Any]) -> bytes:
+        """
+        Length-prefixed command frame, byte-identical to framing
+        cbor2.dumps({"kind": kind, "nonce": nonce, "payload": payload})
+        but streamed into a reused buffer without building the dict.
+        """
+        tx, enc = self._tx, self._enc
+        tx.seek(0)
+        tx.truncate()
+        tx.write(_LEN_PLACEHOLDER)
+        tx.write(_CMD_HEAD)
+        enc.encode(kind)
+        tx.write(_CMD_NONCE)
+        enc.encode(nonce)
+        tx.write(_CMD_PAYLOAD)
+        enc.encode(payload)
+        with tx.getbuffer() as view:
+            struct.pack_into(">I", view, 0, len(view) - 4)
+            return bytes(view)
 
     def _read_frame(self) -> Optional[Dict[str, Any]]:
-        hdr = self.ser.read(4)
-        if len(hdr) != 4:
-            return None
-        (n,) = struct.unpack(">I", hdr)
-        if n <= 0 or n > 1_000_000:
-            return None
-        raw = self.ser.read(n)
-        if len(raw) != n:
-            return None
-        obj = cbor2.loads(raw)
-        if not isinstance(obj, dict):
-            return None
-        return obj
+        """
+        Next frame from the port, or None on timeout / bad frame.
+        Each read takes everything the driver already holds (at least the
+        missing part of the current frame) into self._rx, so back-to-back
+        ACKs usually cost one read; partial frames stay buffered.
+        """
+        rx = self._rx
+        while True:
+            if len(rx) >= 4:
+                (n,) = struct.unpack_from(">I", rx)
+                if n <= 0 or n > 1_000_000:
+                    del rx[:4]
+                    return None
+                end = 4 + n
+                if len(rx) >= end:
+                    obj = cbor2.loads(rx[4:end])
+                    del rx[:end]
+                    if not isinstance(obj, dict):
+                        return None
+                    return obj
+                need = end - len(rx)
+            else:
+                need = 4 - len(rx)
+            chunk = self.ser.read(max(need, self.ser.in_waiting))
+            if not chunk:
+                return None
+            rx += chunk
 
-    def send(self, kind: str, payload: Dict[str, Any], retries: int = 3) -> bool:
+    def send_async(self, kind: str, payload: Dict[str, Any]) -> int:
         nonce = self._next_nonce()
-        msg = {"kind": kind, "nonce": nonce, "payload": payload}
+        frame = self._encode_frame(kind, nonce, payload)
+        self.ser.write(frame)
+        self._pending[nonce] = frame
+        return nonce
 
-        for _ in range(max(1, retries)):
-            self._write_frame(msg)
-            t0 = time.time()
-            while (time.time() - t0) < 0.6:
-                resp = self._read_frame()
-                if not resp:
-                    continue
-                if resp.get("ack") == nonce:
-                    return bool(resp.get("ok", False))
-        return False
+    def flush(self, retries: int = 3, timeout_s: float = 0.6) -> Dict[int, bool]:
+        """
+        Wait for ACKs of every pending command; returns nonce -> ok.
+        Commands still unacked after a timeout window are resent, up to
+        `retries` windows in total, then reported as False.
+        """
+        results: Dict[int, bool] = {}
+        port_timeout = self.ser.timeout
+        try:
+            for attempt in range(max(1, retries)):
+                if attempt:
+                    for frame in self._pending.values():
+                        self.ser.write(frame)
+                deadline = time.monotonic() + timeout_s
+                while self._pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0:
+                        break
+                    # block in the driver for at most the rest of the window
+                    self.ser.timeout = remaining
+                    resp = self._read_frame()
+                    if not resp:
+                        continue
+                    nonce = resp.get("ack")
+                    if nonce in self._pending:
+                        del self._pending[nonce]
+                        results[nonce] = bool(resp.get("ok", False))
+                if not self._pending:
+                    break
+        finally:
+            self.ser.timeout = port_timeout
+        for nonce in self._pending:
+            results[nonce] = False
+        self._pending.clear()
+        return results
+
+    def send(self, kind: str, payload: Dict[str, Any], retries: int = 3) -> bool:
+        nonce = self.send_async(kind, payload)
+        return self.flush(retries=retries)[nonce]
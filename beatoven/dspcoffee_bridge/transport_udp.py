@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 import socket
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# Stay well under a typical 1500-byte path MTU so batches are never fragmented.
+_MAX_DATAGRAM = 1200
+
+_MACRO = b"/macro "
+_META = b"/meta "
+_SP = b" "
 
 def _clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else float(x)
@@ -16,22 +25,66 @@ class UdpRealtimeLane:
         /meta swing <value>
 
     dsp.coffee firmware can parse these without an OSC library.
+    A datagram may carry several records; send_macros batches a whole macro
+    set into one sendto() where it fits.
     If you want true OSC later, keep the address strings identical and swap encoder.
+
+    Records are assembled in one reusable send buffer, so a lane must only be
+    driven from a single thread (the BridgeRuntime thread).
     """
 
     def __init__(self, host: str, port: int) -> None:
         self.addr: Tuple[str, int] = (host, port)
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._buf = bytearray(2048)
+        self._view = memoryview(self._buf)
+        self._tokens: Dict[str, bytes] = {}
+
+    def _token(self, s: str) -> bytes:
+        # preset ids and macro names repeat every frame; encode each once
+        b = self._tokens.get(s)
+        if b is None:
+            b = self._tokens[s] = s.encode("utf-8")
+        return b
+
+    def _put_record(self, n: int, head: bytes, a: bytes, b: bytes, value: float) -> int:
+        """Write `head a [b ]value\\n` at offset n; returns the new end offset."""
+        num = b"%.6f\n" % value
+        end = n + len(head) + len(a) + len(b) + len(num) + (2 if b else 1)
+        if end > len(self._buf):
+            self._view.release()
+            self._buf.extend(bytes(end - len(self._buf)))
+            self._view = memoryview(self._buf)
+        buf = self._buf
+        for part in (head, a, _SP, b, _SP, num) if b else (head, a, _SP, num):
+            m = n + len(part)
+            buf[n:m] = part
+            n = m
+        return n
 
     def send_macro(self, preset_id: str, name: str, value: float) -> None:
-        v = _clamp01(value)
-        msg = f"/macro {preset_id} {name} {v:.6f}\n".encode("utf-8")
-        self.sock.sendto(msg, self.addr)
+        n = self._put_record(0, _MACRO, self._token(preset_id), self._token(name), _clamp01(value))
+        self.sock.sendto(self._view[:n], self.addr)
 
     def send_meta(self, key: str, value: float) -> None:
-        msg = f"/meta {key} {float(value):.6f}\n".encode("utf-8")
-        self.sock.sendto(msg, self.addr)
+        n = self._put_record(0, _META, self._token(key), b"", float(value))
+        self.sock.sendto(self._view[:n], self.addr)
 
     def send_macros(self, preset_id: str, values: Dict[str, float]) -> None:
-        for k, v in values.items():
-            self.send_macro(preset_id, k, v)
+        self.send_macro_values(preset_id, list(values), list(values.values()))
+
+    def send_macro_values(self, preset_id: str, names: Sequence[str], values: Sequence[float]) -> None:
+        """send_macros for parallel name/value sequences (e.g. a NumPy row); clipped in one pass."""
+        clipped = np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0).tolist()
+        pid = self._token(preset_id)
+        n = 0
+        for k, v in zip(names, clipped):
+            end = self._put_record(n, _MACRO, pid, self._token(k), v)
+            if n and end > _MAX_DATAGRAM:
+                # record overflowed the batch: ship what we had, move it to the front
+                self.sock.sendto(self._view[:n], self.addr)
+                self._buf[:end - n] = self._buf[n:end]
+                end -= n
+            n = end
+        if n:
+            self.sock.sendto(self._view[:n], self.addr)
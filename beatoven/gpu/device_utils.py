@@ -4,9 +4,13 @@ BeatOven Device Utilities
 GPU/CPU device autodetection and management.
 """
 
+import functools
+import importlib.util
 import os
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
 
@@ -18,7 +22,7 @@ class DeviceType(Enum):
     ROCM = "rocm"  # AMD
 
 
-@dataclass
+@dataclass(frozen=True)
 class DeviceInfo:
     """Information about a compute device."""
     device_type: DeviceType
@@ -39,6 +43,72 @@ class DeviceInfo:
         }
 
 
+# (name, total_memory, major, minor) per CUDA device
+_CudaProps = Tuple[str, int, int, int]
+
+
+@functools.lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """Whether a package is installed, without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_torch() -> Optional[Tuple[int, bool]]:
+    """
+    Query torch once per process: (cuda device count, mps available).
+    Returns None if torch is missing or fails to import. Per-device
+    properties are fetched separately, see _cuda_props.
+    """
+    if not _has_module("torch"):
+        return None
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    cuda = 0
+    mps = False
+    try:
+        # An empty CUDA_VISIBLE_DEVICES hides every GPU; skip CUDA init.
+        # Otherwise device_count() already honours the mask.
+        if os.environ.get("CUDA_VISIBLE_DEVICES") != "" and torch.cuda.is_available():
+            cuda = int(torch.cuda.device_count())
+        # MPS only exists on macOS and never alongside CUDA
+        if not cuda and sys.platform == "darwin" and hasattr(torch.backends, 'mps'):
+            mps = torch.backends.mps.is_available()
+    except Exception:
+        pass
+    return cuda, bool(mps)
+
+
+@functools.lru_cache(maxsize=None)
+def _cuda_props(index: int) -> _CudaProps:
+    """
+    Properties of one CUDA device, queried at most once per process and
+    kept as a plain tuple so no CUDA objects outlive the call.
+    """
+    import torch
+    p = torch.cuda.get_device_properties(index)
+    return p.name, int(p.total_memory), int(p.major), int(p.minor)
+
+
+@functools.lru_cache(maxsize=None)
+def _psutil():
+    """psutil module, or None; a failed import is not retried."""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_jax() -> bool:
+    """Whether jax is installed; jax devices are not enumerated yet."""
+    return _has_module("jax")
+
+
 class DeviceManager:
     """
     Manages compute devices for BeatOven.
@@ -58,23 +128,27 @@ class DeviceManager:
         self._current_device: Optional[DeviceInfo] = None
         self._torch_available = False
         self._jax_available = False
+        self._detected = False
+        self._detect_lock = threading.Lock()
+        self._cuda_count = 0
+        self._cuda_listed = 0  # CUDA devices probed into self._devices so far
 
         self._detect_frameworks()
-        self._detect_devices()
+        # Devices (and torch itself) are probed on first use; see _ensure_devices.
+
+    def _ensure_devices(self):
+        """Run device detection once, on first access."""
+        if self._detected:
+            return
+        with self._detect_lock:
+            if not self._detected:
+                self._detect_devices()
+                self._detected = True
 
     def _detect_frameworks(self):
-        """Detect available ML frameworks."""
-        try:
-            import torch
-            self._torch_available = True
-        except ImportError:
-            self._torch_available = False
-
-        try:
-            import jax
-            self._jax_available = True
-        except ImportError:
-            self._jax_available = False
+        """Detect available ML frameworks (cached per process)."""
+        self._torch_available = _has_module("torch")
+        self._jax_available = _probe_jax()
 
     def _detect_devices(self):
         """Detect available compute devices."""
@@ -87,24 +161,19 @@ class DeviceManager:
             memory_available=self._get_available_memory()
         ))
 
-        # Check for CUDA
+        # Check for CUDA / MPS
         if self._torch_available:
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    for i in range(torch.cuda.device_count()):
-                        props = torch.cuda.get_device_properties(i)
-                        self._devices.append(DeviceInfo(
-                            device_type=DeviceType.CUDA,
-                            device_id=i,
-                            name=props.name,
-                            memory_total=props.total_memory,
-                            memory_available=props.total_memory,  # Simplified
-                            compute_capability=f"{props.major}.{props.minor}"
-                        ))
-
-                # Check for MPS (Apple Silicon)
-                if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+            probe = _probe_torch()
+            if probe is None:
+                self._torch_available = False
+            else:
+                self._cuda_count, mps = probe
+                # Only the default GPU is probed up front; the rest are
+                # added when all devices are listed or one is selected.
+                self._add_cuda_devices(min(1, self._cuda_count))
+
+                # Apple Silicon
+                if mps:
                     self._devices.append(DeviceInfo(
                         device_type=DeviceType.MPS,
                         device_id=0,
@@ -112,12 +181,34 @@ class DeviceManager:
                         memory_total=self._get_system_memory(),
                         memory_available=self._get_available_memory()
                     ))
-            except Exception:
-                pass
 
         # Set default device
         self._select_default_device()
 
+    def _add_cuda_devices(self, upto: int):
+        """Append DeviceInfo for CUDA devices [_cuda_listed, upto)."""
+        for i in range(self._cuda_listed, upto):
+            try:
+                name, total_memory, major, minor = _cuda_props(i)
+            except Exception:
+                # Driver/properties error: leave this device out (CPU fallback)
+                continue
+            self._devices.append(DeviceInfo(
+                device_type=DeviceType.CUDA,
+                device_id=i,
+                name=name,
+                memory_total=total_memory,
+                memory_available=total_memory,  # Simplified
+                compute_capability=f"{major}.{minor}"
+            ))
+        self._cuda_listed = max(self._cuda_listed, upto)
+
+    def _ensure_all_cuda(self):
+        self._ensure_devices()
+        if self._cuda_listed < self._cuda_count:
+            with self._detect_lock:
+                self._add_cuda_devices(self._cuda_count)
+
     def _select_default_device(self):
         """Select default device based on preference."""
         if self.prefer_gpu:
@@ -137,26 +228,26 @@ class DeviceManager:
 
     def _get_system_memory(self) -> int:
         """Get total system memory."""
-        try:
-            import psutil
-            return psutil.virtual_memory().total
-        except ImportError:
+        psutil = _psutil()
+        if psutil is None:
             return 8 * 1024 * 1024 * 1024  # Assume 8GB
+        return psutil.virtual_memory().total
 
     def _get_available_memory(self) -> int:
         """Get available system memory."""
-        try:
-            import psutil
-            return psutil.virtual_memory().available
-        except ImportError:
+        psutil = _psutil()
+        if psutil is None:
             return 4 * 1024 * 1024 * 1024  # Assume 4GB
+        return psutil.virtual_memory().available
 
     def get_device(self) -> DeviceInfo:
         """Get current compute device."""
+        self._ensure_devices()
         return self._current_device
 
     def get_device_string(self) -> str:
         """Get device string for PyTorch."""
+        self._ensure_devices()
         if self._current_device.device_type == DeviceType.CUDA:
             return f"cuda:{self._current_device.device_id}"
         elif self._current_device.device_type == DeviceType.MPS:
@@ -165,6 +256,10 @@ class DeviceManager:
 
     def set_device(self, device_type: DeviceType, device_id: int = 0) -> bool:
         """Set current device."""
+        if device_type == DeviceType.CUDA:
+            self._ensure_all_cuda()
+        else:
+            self._ensure_devices()
         for device in self._devices:
             if device.device_type == device_type and device.device_id == device_id:
                 self._current_device = device
@@ -173,10 +268,12 @@ class DeviceManager:
 
     def list_devices(self) -> List[DeviceInfo]:
         """List all available devices."""
+        self._ensure_all_cuda()
         return list(self._devices)
 
     def is_gpu_available(self) -> bool:
         """Check if any GPU is available."""
+        self._ensure_devices()
         return any(
             d.device_type in (DeviceType.CUDA, DeviceType.MPS, DeviceType.ROCM)
             for d in self._devices
@@ -184,6 +281,7 @@ class DeviceManager:
 
     def get_torch_device(self):
         """Get PyTorch device object."""
+        self._ensure_devices()
         if not self._torch_available:
             raise RuntimeError("PyTorch not available")
 
@@ -192,6 +290,7 @@ class DeviceManager:
 
     def to_device(self, tensor):
         """Move tensor to current device."""
+        self._ensure_devices()
         if not self._torch_available:
             return tensor
 
@@ -202,6 +301,7 @@ class DeviceManager:
 
     def synchronize(self):
         """Synchronize device (wait for GPU operations)."""
+        self._ensure_devices()
         if not self._torch_available:
             return
 
@@ -215,13 +315,16 @@ class DeviceManager:
 
 # Global instance
 _device_manager: Optional[DeviceManager] = None
+_device_manager_lock = threading.Lock()
 
 
 def get_device_manager() -> DeviceManager:
-    """Get global device manager instance."""
+    """Get global device manager instance (created once, thread-safe)."""
     global _device_manager
     if _device_manager is None:
-        _device_manager = DeviceManager()
+        with _device_manager_lock:
+            if _device_manager is None:
+                _device_manager = DeviceManager()
     return _device_manager
 
 
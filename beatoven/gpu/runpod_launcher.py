@@ -4,13 +4,20 @@ BeatOven Runpod Launcher
 GPU cloud execution via Runpod infrastructure.
 """
 
+import asyncio
 import os
-import json
 import hashlib
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from enum import Enum
 
+import numpy as np
+
+from beatoven._stable_json import stable_json as _stable_json
+
 
 class RunpodStatus(Enum):
     """Runpod job status."""
@@ -21,15 +28,18 @@ class RunpodStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+_TERMINAL = frozenset({RunpodStatus.COMPLETED, RunpodStatus.FAILED, RunpodStatus.CANCELLED})
+
+
+@dataclass(frozen=True)
 class RunpodConfig:
-    """Configuration for Runpod execution."""
+    """Configuration for Runpod execution (immutable; shared across batch jobs)."""
     gpu_type: str = "NVIDIA RTX A4000"
     gpu_count: int = 1
     container_image: str = "beatoven/runtime:latest"
     volume_size_gb: int = 20
     max_runtime_hours: float = 1.0
-    env_vars: Dict[str, str] = field(default_factory=dict)
+    env_vars: Dict[str, str] = field(default_factory=dict, hash=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -44,7 +54,12 @@ class RunpodConfig:
 
 @dataclass
 class RunpodJob:
-    """Represents a Runpod job."""
+    """
+    Represents a Runpod job.
+
+    Assigning status also updates the owning launcher's status table and
+    wakes completion waiters on terminal states.
+    """
     job_id: str
     status: RunpodStatus
     config: RunpodConfig
@@ -52,6 +67,29 @@ class RunpodJob:
     output_data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     cost_usd: float = 0.0
+    # Set once the job reaches a terminal status; waiters block on it
+    _done: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False, compare=False
+    )
+    # _JobTable holding this job, if any (set by _JobTable.put)
+    _table: Optional["_JobTable"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.status in _TERMINAL:
+            self._done.set()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "status":
+            return
+        table = self.__dict__.get("_table")
+        if table is not None:
+            table._sync(self)
+        done = self.__dict__.get("_done")
+        if done is not None and value in _TERMINAL:
+            done.set()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -65,6 +103,65 @@ class RunpodJob:
         }
 
 
+# uint8 code per status, for the launcher's status column
+_STATUSES: Tuple[RunpodStatus, ...] = tuple(RunpodStatus)
+_STATUS_CODE: Dict[RunpodStatus, int] = {s: i for i, s in enumerate(_STATUSES)}
+
+
+class _JobTable:
+    """
+    Launcher job store with statuses kept as a contiguous uint8 column, so
+    status lookups and counts avoid walking job objects. Job objects are
+    still held (callers get the same instance back); assigning job.status
+    writes through to the column via _sync.
+    """
+    __slots__ = ("ids", "jobs", "statuses", "_index")
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.jobs: List[RunpodJob] = []
+        self.statuses = np.zeros(64, dtype=np.uint8)
+        self._index: Dict[str, int] = {}
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._index
+
+    def put(self, job: RunpodJob) -> None:
+        i = self._index.get(job.job_id)
+        if i is None:
+            i = self._index[job.job_id] = len(self.ids)
+            self.ids.append(job.job_id)
+            self.jobs.append(job)
+            if i == len(self.statuses):
+                self.statuses = np.concatenate([self.statuses, np.zeros_like(self.statuses)])
+        else:
+            # The replaced job no longer owns this row
+            self.jobs[i]._table = None
+            self.jobs[i] = job
+        job._table = self
+        self.statuses[i] = _STATUS_CODE[job.status]
+
+    def _sync(self, job: RunpodJob) -> None:
+        i = self._index.get(job.job_id)
+        if i is not None and self.jobs[i] is job:
+            self.statuses[i] = _STATUS_CODE[job.status]
+
+    def get(self, job_id: str) -> Optional[RunpodJob]:
+        i = self._index.get(job_id)
+        return None if i is None else self.jobs[i]
+
+    def status(self, job_id: str) -> Optional[RunpodStatus]:
+        i = self._index.get(job_id)
+        return None if i is None else _STATUSES[self.statuses[i]]
+
+    def set_status(self, job: RunpodJob, status: RunpodStatus) -> None:
+        job.status = status
+
+    def count(self, status: RunpodStatus) -> int:
+        n = len(self.ids)
+        return int(np.count_nonzero(self.statuses[:n] == _STATUS_CODE[status]))
+
+
 class RunpodLauncher:
     """
     Launches BeatOven jobs on Runpod GPU cloud.
@@ -73,7 +170,7 @@ class RunpodLauncher:
     """
 
     # Available GPU types on Runpod
-    GPU_TYPES = [
+    GPU_TYPES: Tuple[str, ...] = (
         "NVIDIA RTX A4000",
         "NVIDIA RTX A5000",
         "NVIDIA RTX A6000",
@@ -82,10 +179,10 @@ class RunpodLauncher:
         "NVIDIA H100",
         "NVIDIA RTX 3090",
         "NVIDIA RTX 4090"
-    ]
+    )
 
     # Approximate costs per hour (USD)
-    GPU_COSTS = {
+    GPU_COSTS: Mapping[str, float] = types.MappingProxyType({
         "NVIDIA RTX A4000": 0.39,
         "NVIDIA RTX A5000": 0.49,
         "NVIDIA RTX A6000": 0.79,
@@ -94,7 +191,7 @@ class RunpodLauncher:
         "NVIDIA H100": 3.99,
         "NVIDIA RTX 3090": 0.44,
         "NVIDIA RTX 4090": 0.74
-    }
+    })
 
     def __init__(
         self,
@@ -110,7 +207,7 @@ class RunpodLauncher:
         """
         self.api_key = api_key or os.environ.get("RUNPOD_API_KEY")
         self.endpoint = endpoint
-        self._jobs: Dict[str, RunpodJob] = {}
+        self._jobs = _JobTable()
 
     def is_configured(self) -> bool:
         """Check if Runpod is properly configured."""
@@ -152,10 +249,8 @@ class RunpodLauncher:
         if config is None:
             config = RunpodConfig()
 
-        # Generate job ID
-        job_id = hashlib.sha256(
-            json.dumps(input_data, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        # Generate job ID (8-byte digest -> 16 hex chars)
+        job_id = hashlib.blake2b(_stable_json(input_data), digest_size=8).hexdigest()
 
         job = RunpodJob(
             job_id=job_id,
@@ -164,7 +259,7 @@ class RunpodLauncher:
             input_data=input_data
         )
 
-        self._jobs[job_id] = job
+        self._jobs.put(job)
         return job
 
     def submit_job(self, job: RunpodJob) -> bool:
@@ -182,19 +277,21 @@ class RunpodLauncher:
         """
         if not self.is_configured():
             # Simulate local execution
-            job.status = RunpodStatus.RUNNING
+            self._jobs.set_status(job, RunpodStatus.RUNNING)
             return True
 
         # Real API call would go here
         # For now, simulate submission
-        job.status = RunpodStatus.RUNNING
+        self._jobs.set_status(job, RunpodStatus.RUNNING)
         return True
 
     def get_job_status(self, job_id: str) -> Optional[RunpodStatus]:
         """Get job status."""
-        if job_id in self._jobs:
-            return self._jobs[job_id].status
-        return None
+        return self._jobs.status(job_id)
+
+    def count_jobs(self, status: RunpodStatus) -> int:
+        """Number of tracked jobs currently in `status`."""
+        return self._jobs.count(status)
 
     def get_job(self, job_id: str) -> Optional[RunpodJob]:
         """Get job by ID."""
@@ -202,10 +299,11 @@ class RunpodLauncher:
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
-        if job_id in self._jobs:
-            self._jobs[job_id].status = RunpodStatus.CANCELLED
-            return True
-        return False
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        self._jobs.set_status(job, RunpodStatus.CANCELLED)
+        return True
 
     def wait_for_completion(
         self,
@@ -216,35 +314,41 @@ class RunpodLauncher:
         """
         Wait for job completion.
 
+        Blocks on the job's completion event rather than sleeping between
+        status checks; poll_interval is kept for API compatibility.
+
         Args:
             job_id: Job ID to wait for
             timeout_seconds: Maximum wait time
-            poll_interval: Polling interval
+            poll_interval: Unused
 
         Returns:
             Completed job or None if timeout
         """
-        import time
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_seconds:
-            job = self._jobs.get(job_id)
-            if job is None:
-                return None
-
-            if job.status in (RunpodStatus.COMPLETED, RunpodStatus.FAILED, RunpodStatus.CANCELLED):
-                return job
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
 
-            # Simulate completion for local mode
-            if not self.is_configured():
-                job.status = RunpodStatus.COMPLETED
-                job.output_data = {"simulated": True, "input": job.input_data}
-                return job
-
-            time.sleep(poll_interval)
+        # Simulate completion for local mode
+        if not self.is_configured() and not job._done.is_set():
+            job.output_data = {"simulated": True, "input": job.input_data}
+            self._jobs.set_status(job, RunpodStatus.COMPLETED)
 
+        if job._done.wait(timeout_seconds):
+            return job
         return None
 
+    async def await_completion(
+        self,
+        job_id: str,
+        timeout_seconds: float = 3600
+    ) -> Optional[RunpodJob]:
+        """Coroutine form of wait_for_completion (waits in the default executor)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.wait_for_completion, job_id, timeout_seconds
+        )
+
     def run_generation(
         self,
         text_intent: str,
@@ -290,11 +394,14 @@ class RunpodLauncher:
         Returns:
             List of job objects
         """
-        jobs = []
-        for data in jobs_data:
-            job = self.create_job(data, config)
-            self.submit_job(job)
-            jobs.append(job)
+        jobs = [self.create_job(data, config) for data in jobs_data]
+        if self.is_configured() and len(jobs) > 1:
+            # Each real submission is a network round-trip; overlap them
+            with ThreadPoolExecutor(max_workers=min(16, len(jobs))) as ex:
+                list(ex.map(self.submit_job, jobs))
+        else:
+            for job in jobs:
+                self.submit_job(job)
         return jobs
 
     def get_available_gpus(self) -> List[Dict[str, Any]]:
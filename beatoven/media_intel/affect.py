@@ -1,5 +1,101 @@
 from __future__ import annotations
-from typing import Dict, Tuple
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+from beatoven._numba import njit
+
+# Column order of affect_from_features_batch output
+AFFECT_KEYS: Tuple[str, ...] = (
+    "valence", "arousal", "dominance", "awe", "dread", "nostalgia", "tenderness",
+)
+
+# Physical inputs and the value assumed when a feature is missing
+_FEATURE_DEFAULTS: Dict[str, float] = {
+    "luma_mean": 0.5,
+    "luma_var": 0.1,
+    "sat_mean": 0.4,
+    "edge_density": 0.1,
+    "motion_energy": 0.0,
+}
+
+def _clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
+    return lo if x < lo else (hi if x > hi else x)
+
+# The formulas below take floats or (N,) arrays alike, so the scalar and
+# batch paths share them; each group is clamped to [0, 1] by the caller.
+
+def _core(brightness, contrast, sat, edge, motion):
+    """Unclamped (valence, arousal, dominance)."""
+    valence = 0.55 + 0.30*(brightness - 0.5) + 0.15*(sat - 0.4) - 0.10*contrast
+    arousal = 0.25 + 0.35*contrast + 0.25*edge + 0.35*motion
+    dominance = 0.50 + 0.25*(edge - 0.2) + 0.20*(brightness - 0.5)
+    return valence, arousal, dominance
+
+def _blends(valence, arousal, contrast, sat, edge):
+    """Unclamped (awe, dread, nostalgia, tenderness) from clamped core dims."""
+    awe = 0.25 + 0.50*arousal + 0.15*(1.0 - edge)
+    dread = 0.20 + 0.45*arousal + 0.35*(0.55 - valence)
+    nostalgia = 0.20 + 0.35*(0.6 - contrast) + 0.25*(0.55 - sat)
+    tenderness = 0.15 + 0.45*valence + 0.10*(1.0 - arousal)
+    return awe, dread, nostalgia, tenderness
+
+def affect_from_features_batch(physical_soa: Mapping[str, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized affect estimate for N frames.
+
+    physical_soa maps feature name -> array of shape (N,); missing features
+    take their neutral default. Returns float64 (N, 7), columns in AFFECT_KEYS.
+    """
+    n = None
+    for v in physical_soa.values():
+        n = np.shape(v)[0]
+        break
+    if n is None:
+        n = 1
+
+    def col(key: str) -> np.ndarray:
+        v = physical_soa.get(key)
+        if v is None:
+            return np.full(n, _FEATURE_DEFAULTS[key])
+        return np.asarray(v, dtype=np.float64)
+
+    contrast, sat, edge = col("luma_var"), col("sat_mean"), col("edge_density")
+
+    out = np.empty((n, len(AFFECT_KEYS)), dtype=np.float64)
+    core, blends = out[:, :3], out[:, 3:]
+    for i, v in enumerate(_core(col("luma_mean"), contrast, sat, edge, col("motion_energy"))):
+        core[:, i] = v
+    np.clip(core, 0.0, 1.0, out=core)
+    for i, v in enumerate(_blends(core[:, 0], core[:, 1], contrast, sat, edge)):
+        blends[:, i] = v
+    np.clip(blends, 0.0, 1.0, out=blends)
+    return out
+
+# Scalar specializations of the shared formulas. No fastmath: results must
+# match the batch path bit for bit.
+_core_scalar = njit(cache=True)(_core)
+_blends_scalar = njit(cache=True)(_blends)
+_clamp_scalar = njit(cache=True)(_clamp)
+
+@njit(cache=True)
+def _affect_core(brightness, contrast, sat, edge, motion):
+    """7 affect values (AFFECT_KEYS order) plus affect_confidence."""
+    valence, arousal, dominance = _core_scalar(brightness, contrast, sat, edge, motion)
+    valence = _clamp_scalar(valence, 0.0, 1.0)
+    arousal = _clamp_scalar(arousal, 0.0, 1.0)
+    dominance = _clamp_scalar(dominance, 0.0, 1.0)
+    awe, dread, nostalgia, tenderness = _blends_scalar(valence, arousal, contrast, sat, edge)
+    awe = _clamp_scalar(awe, 0.0, 1.0)
+    dread = _clamp_scalar(dread, 0.0, 1.0)
+    nostalgia = _clamp_scalar(nostalgia, 0.0, 1.0)
+    tenderness = _clamp_scalar(tenderness, 0.0, 1.0)
+
+    # Use peakiness of blends to avoid flat "shrug" outputs.
+    total = valence + arousal + dominance + awe + dread + nostalgia + tenderness
+    peak = max(valence, arousal, dominance, awe, dread, nostalgia, tenderness) - total / 7
+    conf = _clamp_scalar(0.25 + 0.8*peak, 0.15, 0.75)
+    return valence, arousal, dominance, awe, dread, nostalgia, tenderness, conf
 
 def affect_from_features(physical: Dict[str, float], semantic: Dict[str, object]) -> Tuple[Dict[str, float], Dict[str, float]]:
     """
@@ -10,36 +106,16 @@ def affect_from_features(physical: Dict[str, float], semantic: Dict[str, object]
       affect: dict (valence/arousal/dominance + blends)
       conf: dict (affect_confidence)
     """
-    # Physical cues
-    brightness = float(physical.get("luma_mean", 0.5))
-    contrast = float(physical.get("luma_var", 0.1))
-    sat = float(physical.get("sat_mean", 0.4))
-    edge = float(physical.get("edge_density", 0.1))
-    motion = float(physical.get("motion_energy", 0.0))
-
-    # Core dimensions
-    arousal = min(1.0, max(0.0, 0.25 + 0.35*contrast + 0.25*edge + 0.35*motion))
-    valence = min(1.0, max(0.0, 0.55 + 0.30*(brightness - 0.5) + 0.15*(sat - 0.4) - 0.10*contrast))
-    dominance = min(1.0, max(0.0, 0.50 + 0.25*(edge - 0.2) + 0.20*(brightness - 0.5)))
-
-    # Blends (examples)
-    awe = min(1.0, max(0.0, 0.25 + 0.50*arousal + 0.15*(1.0 - edge)))
-    dread = min(1.0, max(0.0, 0.20 + 0.45*arousal + 0.35*(0.55 - valence)))
-    nostalgia = min(1.0, max(0.0, 0.20 + 0.35*(0.6 - contrast) + 0.25*(0.55 - sat)))
-    tenderness = min(1.0, max(0.0, 0.15 + 0.45*valence + 0.10*(1.0 - arousal)))
-
-    affect = {
-        "valence": float(valence),
-        "arousal": float(arousal),
-        "dominance": float(dominance),
-        "awe": float(awe),
-        "dread": float(dread),
-        "nostalgia": float(nostalgia),
-        "tenderness": float(tenderness),
-    }
+    d = _FEATURE_DEFAULTS
+    *values, confidence = _affect_core(
+        float(physical.get("luma_mean", d["luma_mean"])),
+        float(physical.get("luma_var", d["luma_var"])),
+        float(physical.get("sat_mean", d["sat_mean"])),
+        float(physical.get("edge_density", d["edge_density"])),
+        float(physical.get("motion_energy", d["motion_energy"])),
+    )
+    affect = dict(zip(AFFECT_KEYS, values))
 
     # Confidence: conservative unless semantics corroborate (placeholder for now)
-    # Use peakiness of blends to avoid flat "shrug" outputs.
-    peak = max(affect.values()) - (sum(affect.values())/len(affect))
-    conf = {"affect_confidence": float(max(0.15, min(0.75, 0.25 + 0.8*peak)))}
+    conf = {"affect_confidence": confidence}
     return affect, conf
@@ -1,14 +1,15 @@
 from __future__ import annotations
 import os
-import cv2
 import numpy as np
 from typing import Optional
 
 from .schema import MediaFrame
-from .physical import analyze_image_physical, analyze_video_motion
-from .affect import affect_from_features
+from .affect import AFFECT_KEYS, affect_from_features, affect_from_features_batch
 from .temporal import summarize_emotion_trajectory, infer_era_from_heuristics
 
+# cv2 (and .physical, which needs it) are imported on first analyze_* call so
+# importing the package stays cheap for affect/temporal/to_resonance users.
+
 # Optional semantic engine
 try:
     from .semantic_engine import SemanticEngine
@@ -17,12 +18,30 @@ except ImportError:
     _SEMANTIC_AVAILABLE = False
     SemanticEngine = None  # type: ignore
 
-def analyze_image(path: str, media_id: str, semantic_engine: Optional["SemanticEngine"] = None) -> MediaFrame:
+def _analysis_scale(width: int, max_analysis_width: Optional[int]) -> float:
+    """Downscale factor so frames are at most max_analysis_width wide (None/0: full res)."""
+    if not max_analysis_width or width <= max_analysis_width:
+        return 1.0
+    return max_analysis_width / width
+
+def _downscale(bgr: np.ndarray, scale: float) -> np.ndarray:
+    if scale >= 1.0:
+        return bgr
+    import cv2
+    return cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+def analyze_image(path: str, media_id: str, semantic_engine: Optional["SemanticEngine"] = None, max_analysis_width: Optional[int] = 512) -> MediaFrame:
+    import cv2
+    from .physical import analyze_image_physical
+
     bgr = cv2.imread(path, cv2.IMREAD_COLOR)
     if bgr is None:
         raise ValueError(f"Could not read image: {path}")
 
-    physical = analyze_image_physical(bgr)
+    # Image statistics converge well below full resolution
+    h, w = bgr.shape[:2]
+    physical = analyze_image_physical(_downscale(bgr, _analysis_scale(w, max_analysis_width)))
+    physical["resolution_mp"] = float((h*w)/1e6)
 
     # Use semantic engine if provided
     if semantic_engine is not None and _SEMANTIC_AVAILABLE:
@@ -52,7 +71,10 @@ def analyze_image(path: str, media_id: str, semantic_engine: Optional["SemanticE
         model_versions={"physical": "v1", "affect": "v1", "era": "v1"},
     )
 
-def analyze_video(path: str, media_id: str, sample_fps: float = 2.0, max_seconds: float = 60.0, semantic_engine: Optional["SemanticEngine"] = None) -> MediaFrame:
+def analyze_video(path: str, media_id: str, sample_fps: float = 2.0, max_seconds: float = 60.0, semantic_engine: Optional["SemanticEngine"] = None, max_analysis_width: Optional[int] = 512) -> MediaFrame:
+    import cv2
+    from .physical import MotionAccumulator, analyze_image_physical
+
     cap = cv2.VideoCapture(path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video: {path}")
@@ -64,42 +86,66 @@ def analyze_video(path: str, media_id: str, sample_fps: float = 2.0, max_seconds
     step = max(1, int(round(fps / sample_fps)))
     max_frames = int(sample_fps * max_seconds)
 
-    frames_gray = []
-    arousal_series = []
-    valence_series = []
+    # Motion is accumulated pairwise, so decoded frames are not retained
+    motion_acc = MotionAccumulator()
+    # Per-frame physical features, scored in one affect batch after the loop
+    soa_keys = ("luma_mean", "luma_var", "sat_mean", "edge_density")
+    soa = {k: np.empty(max_frames, dtype=np.float64) for k in soa_keys}
+
+    # Reuse the middle sampled frame's features for the aggregate instead of
+    # reopening and seeking the container after the loop.
+    n_samples = max_frames
+    if total_frames > 0:
+        n_samples = min(max_frames, (total_frames + step - 1) // step)
+    mid_kept = max(0, (n_samples - 1) // 2)
+    physical_mid: Optional[dict] = None
+    scale: Optional[float] = None  # fixed from the first frame
+    frame_hw = (0, 0)
+
+    # Hoist per-iteration attribute lookups out of the sampling loop
+    grab, read, cvt = cap.grab, cap.read, cv2.cvtColor
+    to_gray, to_hsv = cv2.COLOR_BGR2GRAY, cv2.COLOR_BGR2HSV
+    update_motion = motion_acc.update
+    soa_cols = [(k, soa[k]) for k in soa_keys]
 
-    idx = 0
     kept = 0
     while kept < max_frames:
-        ok, frame = cap.read()
+        if kept:
+            # grab() only demuxes; frames between samples are never decoded
+            for _ in range(step - 1):
+                if not grab():
+                    break
+        ok, frame = read()
         if not ok:
             break
-        if idx % step == 0:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            frames_gray.append(gray)
-
-            physical = analyze_image_physical(frame)
-            # motion computed after loop; here we get affect per sampled frame
-            affect, _conf = affect_from_features(physical, {})
-            arousal_series.append(float(affect["arousal"]))
-            valence_series.append(float(affect["valence"]))
-            kept += 1
-        idx += 1
+        if scale is None:
+            frame_hw = frame.shape[:2]
+            scale = _analysis_scale(frame_hw[1], max_analysis_width)
+        frame = _downscale(frame, scale)
+        gray = cvt(frame, to_gray)
+        hsv = cvt(frame, to_hsv)
+        update_motion(gray)
+
+        physical = analyze_image_physical(frame, gray=gray, hsv=hsv)
+        if kept == mid_kept or physical_mid is None:
+            physical_mid = physical
+        # motion computed after loop; affect is batched below
+        for k, col in soa_cols:
+            col[kept] = physical[k]
+        kept += 1
 
     cap.release()
 
-    motion = analyze_video_motion(frames_gray)
+    frame_affect = affect_from_features_batch({k: v[:kept] for k, v in soa.items()})
+    arousal_series = frame_affect[:, AFFECT_KEYS.index("arousal")]
+    valence_series = frame_affect[:, AFFECT_KEYS.index("valence")]
+
+    motion = motion_acc.result()
     # Aggregate physical from a representative frame (middle) + motion
     physical_agg = {}
-    if frames_gray:
-        # Re-open to grab middle frame for color-based stats
-        cap2 = cv2.VideoCapture(path)
-        mid = max(0, int((total_frames or 0) * 0.5))
-        cap2.set(cv2.CAP_PROP_POS_FRAMES, mid)
-        ok, frame_mid = cap2.read()
-        cap2.release()
-        if ok and frame_mid is not None:
-            physical_agg = analyze_image_physical(frame_mid)
+    if physical_mid is not None:
+        physical_agg = dict(physical_mid)
+        physical_agg["resolution_mp"] = float((frame_hw[0]*frame_hw[1])/1e6)
     physical_agg.update(motion)
 
     # Use semantic engine if provided
@@ -13,6 +13,9 @@ def compute_capabilities(sem: SemanticEngine) -> BeatOvenCapabilities:
     """
     Always show controls; report install/availability truthfully.
     UI can render all options and gray out unavailable ones with reasons.
+
+    Built fresh per call (cheap: provider probes are cached by the
+    providers themselves), so callers may mutate or serialize the result.
     """
     binaural = {
         "available": True,
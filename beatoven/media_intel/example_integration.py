@@ -4,7 +4,15 @@ Example: Media Intelligence + dsp.coffee Bridge Integration
 Shows complete pipeline from image/video upload to hardware control.
 """
 
-from typing import Literal
+import copy
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Literal, Optional, Tuple
 from beatoven.dspcoffee_bridge import (
     BridgeRuntime,
     PresetRegistry,
@@ -12,7 +20,20 @@ from beatoven.dspcoffee_bridge import (
     SerialOpsLane,
 )
 from beatoven.dspcoffee_bridge.example_preset_pack import PRESETS
-from beatoven.media_intel import analyze_image, analyze_video, media_to_resonance
+from beatoven.media_intel import MediaFrame, analyze_image, analyze_video, media_to_resonance
+
+# Bump when analysis output changes so cached MediaFrames are not reused.
+_ANALYSIS_VERSION = "mi-v1"
+_HASH_CHUNK = 1 << 20
+
+
+def _file_digest(path: str) -> str:
+    """Streaming BLAKE2b of a file's bytes."""
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 class MediaDrivenBridge:
@@ -27,6 +48,8 @@ class MediaDrivenBridge:
         hardware_udp_port: int = 9000,
         hardware_serial_port: str = "/dev/ttyACM0",
         hardware_baud: int = 115200,
+        cache_size: int = 256,
+        cache_dir: Optional[str] = None,
     ):
         # Setup preset registry
         self.registry = PresetRegistry(PRESETS)
@@ -43,8 +66,61 @@ class MediaDrivenBridge:
             score_thresholds=(0.72, 0.88),
         )
 
+        # Analysis results keyed by content hash, so re-uploads skip analysis.
+        # cache_dir (optional) persists them across restarts.
+        self.cache_size = cache_size
+        self._analysis_cache: "OrderedDict[Tuple[str, str, str], MediaFrame]" = OrderedDict()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _load_cached(self, disk: Path) -> Optional[MediaFrame]:
+        """Frame pickled at `disk`; an unreadable file is a miss and is removed."""
+        try:
+            with open(disk, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            disk.unlink(missing_ok=True)
+            return None
+
+    def _store_cached(self, disk: Path, frame: MediaFrame) -> None:
+        """Pickle to a temp file in cache_dir, then rename into place atomically."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=disk.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, disk)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _analyze(self, path: str, kind: str, media_id: str) -> MediaFrame:
+        key = (_ANALYSIS_VERSION, kind, _file_digest(path))
+        frame = self._analysis_cache.get(key)
+        disk = None if self.cache_dir is None else self.cache_dir / f"{key[0]}-{key[1]}-{key[2]}.pkl"
+        if frame is None and disk is not None:
+            frame = self._load_cached(disk)
+
+        if frame is None:
+            if kind == "image":
+                frame = analyze_image(path, media_id=media_id)
+            else:
+                frame = analyze_video(path, media_id=media_id, sample_fps=2.0, max_seconds=60.0)
+            if disk is not None:
+                self._store_cached(disk, frame)
+
+        self._analysis_cache[key] = frame
+        self._analysis_cache.move_to_end(key)
+        if len(self._analysis_cache) > self.cache_size:
+            self._analysis_cache.popitem(last=False)
+
+        # Callers get their own copy; the cached frame's dicts stay untouched
+        return dataclasses.replace(copy.deepcopy(frame), media_id=media_id, path=path)
+
     def handle_upload(
-        self, path: str, kind: Literal["image", "video"], media_id: str
+        self, path: str, kind: Literal["image", "video"], media_id: str, verbose: bool = False
     ) -> dict:
         """
         Process uploaded media:
@@ -52,15 +128,13 @@ class MediaDrivenBridge:
         2. Convert to ResonanceFrame
         3. Feed to bridge (preset selection + hardware control)
 
-        Returns analysis summary for logging/debugging.
+        Returns media_id and kind; with verbose=True, the full analysis
+        summary for logging/debugging.
         """
-        # Analyze
-        if kind == "image":
-            media_frame = analyze_image(path, media_id=media_id)
-        elif kind == "video":
-            media_frame = analyze_video(path, media_id=media_id, sample_fps=2.0, max_seconds=60.0)
-        else:
+        # Analyze (or reuse the result for identical content)
+        if kind not in ("image", "video"):
             raise ValueError(f"Invalid kind: {kind}")
+        media_frame = self._analyze(path, kind, media_id)
 
         # Convert to ResonanceFrame
         resonance_frame = media_to_resonance(media_frame)
@@ -68,8 +142,12 @@ class MediaDrivenBridge:
         # Feed to bridge (triggers preset selection + hardware commands)
         self.bridge.on_frame(resonance_frame)
 
+        if not verbose:
+            return {"media_id": media_frame.media_id, "kind": media_frame.kind}
+
         # Return summary for logging
-        summary = {
+        metrics = resonance_frame.metrics
+        return {
             "media_id": media_frame.media_id,
             "kind": media_frame.kind,
             "path": media_frame.path,
@@ -78,19 +156,9 @@ class MediaDrivenBridge:
             "affect_confidence": media_frame.confidence.get("affect_confidence", 0.0),
             "perceived_era": media_frame.perceived_era,
             "era_confidence": media_frame.era_confidence,
-            "resonance_metrics": {
-                "complexity": resonance_frame.metrics.complexity,
-                "emotional_intensity": resonance_frame.metrics.emotional_intensity,
-                "groove": resonance_frame.metrics.groove,
-                "energy": resonance_frame.metrics.energy,
-                "density": resonance_frame.metrics.density,
-                "swing": resonance_frame.metrics.swing,
-                "brightness": resonance_frame.metrics.brightness,
-                "tension": resonance_frame.metrics.tension,
-            } if resonance_frame.metrics else None,
+            "resonance_metrics": metrics.to_dict() if metrics else None,
             "provenance_hash": resonance_frame.provenance_hash,
         }
-        return summary
 
 
 # Example usage
@@ -114,7 +182,7 @@ if __name__ == "__main__":
 
     # Process media
     try:
-        summary = bridge.handle_upload(path, kind=kind, media_id=f"cli_{kind}_001")
+        summary = bridge.handle_upload(path, kind=kind, media_id=f"cli_{kind}_001", verbose=True)
         print(json.dumps(summary, indent=2))
     except Exception as e:
         print(f"Error: {e}")
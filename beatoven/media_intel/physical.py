@@ -1,45 +1,52 @@
 from __future__ import annotations
+import functools
 import numpy as np
 import cv2
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 def _hist_stats(gray: np.ndarray) -> Dict[str, float]:
-    hist = cv2.calcHist([gray],[0],None,[256],[0,256]).flatten()
-    hist = hist / (hist.sum() + 1e-9)
-    idx = np.arange(256, dtype=np.float32)
-    mean = float((hist * idx).sum())
-    var = float((hist * (idx - mean) ** 2).sum())
-    return {"luma_mean": mean/255.0, "luma_var": var/(255.0**2)}
-
-def analyze_image_physical(bgr: np.ndarray) -> Dict[str, Any]:
+    # Mean/variance straight from the pixels in one pass; no histogram needed.
+    mean, std = cv2.meanStdDev(gray)
+    var = float(std[0, 0]) ** 2
+    return {"luma_mean": float(mean[0, 0])/255.0, "luma_var": var/(255.0**2)}
+
+def analyze_image_physical(
+    bgr: np.ndarray,
+    gray: Optional[np.ndarray] = None,
+    hsv: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
     """
     Explainable, deterministic physical features.
+    Pass `gray` / `hsv` when the caller already converted the frame.
     """
     h, w = bgr.shape[:2]
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    if gray is None:
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
 
     # brightness/contrast
     stats = _hist_stats(gray)
 
-    # saturation proxy via HSV
-    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
-    sat = hsv[:,:,1].astype(np.float32) / 255.0
-    stats["sat_mean"] = float(sat.mean())
-    stats["sat_var"] = float(sat.var())
+    # saturation proxy via HSV (per-channel stats in one pass, no S copy)
+    if hsv is None:
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    mean, std = cv2.meanStdDev(hsv)
+    stats["sat_mean"] = float(mean[1, 0]) / 255.0
+    stats["sat_var"] = (float(std[1, 0]) / 255.0) ** 2
 
     # edge density (composition/clutter proxy)
     edges = cv2.Canny(gray, 80, 160)
-    stats["edge_density"] = float((edges > 0).mean())
+    stats["edge_density"] = cv2.countNonZero(edges) / float(h*w)
 
-    # sharpness (Laplacian variance)
-    lap = cv2.Laplacian(gray, cv2.CV_64F)
-    stats["sharpness"] = float(lap.var())
+    # sharpness (Laplacian variance); 16-bit holds the uint8 Laplacian exactly
+    lap = cv2.Laplacian(gray, cv2.CV_16S)
+    _, std = cv2.meanStdDev(lap)
+    stats["sharpness"] = float(std[0, 0]) ** 2
 
     # symmetry proxy: compare left/right halves
     left = gray[:, :w//2]
     right = cv2.flip(gray[:, w - w//2:], 1)
     if left.shape == right.shape:
-        diff = np.abs(left.astype(np.float32) - right.astype(np.float32)).mean() / 255.0
+        diff = cv2.mean(cv2.absdiff(left, right))[0] / 255.0
         stats["symmetry_inv"] = float(1.0 - min(1.0, diff))
     else:
         stats["symmetry_inv"] = 0.0
@@ -47,27 +54,89 @@ def analyze_image_physical(bgr: np.ndarray) -> Dict[str, Any]:
     stats["resolution_mp"] = float((h*w)/1e6)
     return stats
 
-def analyze_video_motion(frames_gray: list[np.ndarray]) -> Dict[str, Any]:
+# Wider frames are downsampled 0.5x before optical flow. Width, like the
+# analyzer's max_analysis_width cap, so flow magnitudes (in pixels) do not
+# depend on orientation.
+_FLOW_MAX_WIDTH = 512
+
+@functools.lru_cache(maxsize=None)
+def _cuda_flow_available() -> bool:
+    """Whether this OpenCV build has CUDA and sees a device (probed once)."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+class MotionAccumulator:
     """
-    Motion descriptors: optical flow energy, jitter proxy.
+    Streaming form of analyze_video_motion: feed gray frames one at a time
+    and only the previous frame is kept alive.
+
+    Dense flow uses DIS (PRESET_FAST) on CPU, or CUDA Farneback when OpenCV
+    was built with CUDA and a device is present. Flow objects are stateful,
+    so each accumulator owns its own.
     """
-    if len(frames_gray) < 2:
-        return {"motion_energy": 0.0, "jitter": 0.0}
 
-    energies = []
-    jitters = []
+    def __init__(self) -> None:
+        self._prev: Optional[np.ndarray] = None
+        self._energies: list[float] = []
+        self._jitters: list[float] = []
+        self._cuda = None
+        self._dis = None
+        if _cuda_flow_available():
+            # Same parameters as the former CPU calcOpticalFlowFarneback call
+            self._cuda = cv2.cuda.FarnebackOpticalFlow_create(2, 0.5, False, 15, 3, 5, 1.2, 0)
+            # prev/cur device buffers, swapped each frame so each frame is uploaded once
+            self._gpu = (cv2.cuda_GpuMat(), cv2.cuda_GpuMat())
+            self._gpu_flow = cv2.cuda_GpuMat()
+        else:
+            self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_FAST)
+
+    def _flow(self, prev: np.ndarray, gray: np.ndarray) -> Optional[np.ndarray]:
+        """Flow prev -> gray, or None for the first frame."""
+        if self._cuda is None:
+            return None if prev is None else self._dis.calc(prev, gray, None)
+        # prev_gpu still holds the last frame; upload only the new one
+        prev_gpu, cur_gpu = self._gpu
+        cur_gpu.upload(gray)
+        self._gpu = (cur_gpu, prev_gpu)
+        if prev is None:
+            return None
+        return self._cuda.calc(prev_gpu, cur_gpu, self._gpu_flow).download()
 
-    prev = frames_gray[0]
-    for cur in frames_gray[1:]:
-        flow = cv2.calcOpticalFlowFarneback(prev, cur, None, 0.5, 2, 15, 3, 5, 1.2, 0)
-        mag = np.sqrt(flow[...,0]**2 + flow[...,1]**2)
-        energies.append(float(np.mean(mag)))
+    def update(self, gray: np.ndarray) -> None:
+        # Flow cost is O(H*W); halve wide frames first
+        if gray.shape[1] > _FLOW_MAX_WIDTH:
+            gray = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        flow = self._flow(self._prev, gray)
+        self._prev = gray
+        if flow is None:
+            return
+        # One magnitude buffer, mean and std in a single pass. Not
+        # cv2.magnitude: its float32 output varies with buffer alignment.
+        mag = np.square(flow[...,0])
+        mag += np.square(flow[...,1])
+        np.sqrt(mag, out=mag)
+        mean, std = cv2.meanStdDev(mag)
+        self._energies.append(float(mean[0, 0]))
 
         # jitter proxy: flow variance (handheld shaky vs smooth)
-        jitters.append(float(np.var(mag)))
-        prev = cur
+        self._jitters.append(float(std[0, 0]) ** 2)
 
-    # Normalize with gentle squashing so it behaves across content
-    me = float(np.tanh(np.mean(energies) / 2.0))
-    ji = float(np.tanh(np.mean(jitters) / 10.0))
-    return {"motion_energy": me, "jitter": ji}
+    def result(self) -> Dict[str, Any]:
+        if not self._energies:
+            return {"motion_energy": 0.0, "jitter": 0.0}
+
+        # Normalize with gentle squashing so it behaves across content
+        me = float(np.tanh(np.mean(self._energies) / 2.0))
+        ji = float(np.tanh(np.mean(self._jitters) / 10.0))
+        return {"motion_energy": me, "jitter": ji}
+
+def analyze_video_motion(frames_gray: list[np.ndarray]) -> Dict[str, Any]:
+    """
+    Motion descriptors: optical flow energy, jitter proxy.
+    """
+    acc = MotionAccumulator()
+    for gray in frames_gray:
+        acc.update(gray)
+    return acc.result()
@@ -14,9 +14,10 @@ Providers:
 - Speech: (Future) Speech detection, transcription, sentiment
 """
 
-from .base import MediaKind, ProviderStatus, SemanticProvider
+from .base import CachedStatus, MediaKind, ProviderStatus, SemanticProvider
 
 __all__ = [
+    "CachedStatus",
     "MediaKind",
     "ProviderStatus",
     "SemanticProvider",
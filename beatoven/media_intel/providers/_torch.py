@@ -0,0 +1,20 @@
+from __future__ import annotations
+import importlib.util
+from typing import Callable, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+def maybe_compile(fn: F, device: str) -> F:
+    """
+    torch.compile `fn` (a module or bound method) for CUDA, else return it
+    unchanged. Inductor needs triton on CUDA and errors only at first call,
+    so without it we stay eager rather than fail mid-analysis.
+
+    Default mode, not "reduce-overhead": providers run on worker threads
+    (SemanticEngine), and CUDA graph replay is tied to the capturing thread.
+    """
+    import torch
+
+    if device != "cuda" or not hasattr(torch, "compile") or importlib.util.find_spec("triton") is None:
+        return fn
+    return torch.compile(fn)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Iterator, List, Sequence
+
+import numpy as np
+
+# Forward gaps up to this many frames are stepped with grab(); longer ones
+# seek. A POS_FRAMES seek lands on a keyframe and decodes forward, so for
+# short gaps stepping is cheaper and for long ones seeking is.
+_MAX_STEP_GAP = 48
+
+def iter_bgr_frames(cap: "cv2.VideoCapture", picks: Sequence[int], max_step_gap: int = _MAX_STEP_GAP) -> Iterator[np.ndarray]:
+    """
+    Yield the decoded BGR frames at `picks` (ascending for best results)
+    from an open capture positioned at frame 0. Unreadable picks are skipped.
+    """
+    import cv2
+
+    pos = 0  # index of the frame the next read() returns
+    last = None  # frame at pos - 1, if it was decoded
+    for idx in picks:
+        gap = idx - pos
+        if gap == -1 and last is not None:
+            # repeated pick (short clips): reuse it rather than seek back
+            yield last
+            continue
+        if 0 <= gap <= max_step_gap:
+            for _ in range(gap):
+                if not cap.grab():
+                    break
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+        ok, bgr = cap.read()
+        pos = idx + 1
+        last = bgr if ok else None
+        if last is not None:
+            yield bgr
+
+def read_rgb_frames(cap: "cv2.VideoCapture", picks: Sequence[int], max_step_gap: int = _MAX_STEP_GAP) -> List[np.ndarray]:
+    """Frames at `picks` as RGB uint8; see iter_bgr_frames."""
+    import cv2
+
+    return [cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB) for bgr in iter_bgr_frames(cap, picks, max_step_gap)]
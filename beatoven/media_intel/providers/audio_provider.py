@@ -2,17 +2,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
-from .base import MediaKind, ProviderStatus, SemanticProvider
+from .base import CachedStatus, MediaKind, ProviderStatus, SemanticProvider
 
 @dataclass
-class AudioMoodProvider(SemanticProvider):
+class AudioMoodProvider(CachedStatus, SemanticProvider):
     """
     Audio-derived mood + tempo-ish features (for videos with sound, or uploaded audio).
     Requires: librosa, numpy, soundfile
     """
     name: str = "audio_mood"
 
-    def status(self) -> ProviderStatus:
+    def _probe(self) -> ProviderStatus:
         try:
             import librosa  # noqa
             import soundfile  # noqa
@@ -31,10 +31,16 @@ class AudioMoodProvider(SemanticProvider):
         if y.size < sr * 0.5:
             return {}
 
-        tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+        # One STFT (librosa's default n_fft/hop) shared by every spectral
+        # feature; each of them would otherwise recompute it from y.
+        S = np.abs(librosa.stft(y))
+        # beat_track's default onset envelope: dB mel power of the same STFT
+        mel_db = librosa.power_to_db(librosa.feature.melspectrogram(S=S**2, sr=sr))
+        onset_env = librosa.onset.onset_strength(S=mel_db, sr=sr)
+        tempo, _ = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
         rms = float(np.sqrt(np.mean(y**2)))
-        centroid = float(np.mean(librosa.feature.spectral_centroid(y=y, sr=sr)))
-        rolloff = float(np.mean(librosa.feature.spectral_rolloff(y=y, sr=sr)))
+        centroid = float(np.mean(librosa.feature.spectral_centroid(S=S, sr=sr)))
+        rolloff = float(np.mean(librosa.feature.spectral_rolloff(S=S, sr=sr)))
         zcr = float(np.mean(librosa.feature.zero_crossing_rate(y)))
 
         # Simple normalized proxies (not "truth", but useful control signals)
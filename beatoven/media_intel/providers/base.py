@@ -17,3 +17,22 @@ class SemanticProvider(Protocol):
 
     def status(self) -> ProviderStatus: ...
     def analyze(self, *, kind: MediaKind, path: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
+
+class CachedStatus:
+    """
+    Mixin for providers whose availability check imports heavy libraries:
+    status() runs _probe() once per instance and reuses the result.
+    Call refresh_status() after installing a dependency at runtime.
+    """
+
+    def _probe(self) -> ProviderStatus:
+        raise NotImplementedError
+
+    def status(self) -> ProviderStatus:
+        st = self.__dict__.get("_status")
+        if st is None:
+            st = self.__dict__["_status"] = self._probe()
+        return st
+
+    def refresh_status(self) -> None:
+        self.__dict__.pop("_status", None)
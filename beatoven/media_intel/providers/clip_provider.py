@@ -1,11 +1,68 @@
 from __future__ import annotations
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base import MediaKind, ProviderStatus, SemanticProvider
+from ._torch import maybe_compile
+from ._video import read_rgb_frames
+from .base import CachedStatus, MediaKind, ProviderStatus, SemanticProvider
+
+_CLIP_MODEL_ID = "openai/clip-vit-base-patch32"
+
+# (model id, device) -> (model, processor); loaded once per process
+_clip_state: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_clip_lock = threading.Lock()
+
+def _get_clip(device: str) -> Tuple[Any, Any]:
+    key = (_CLIP_MODEL_ID, device)
+    state = _clip_state.get(key)
+    if state is None:
+        with _clip_lock:
+            state = _clip_state.get(key)
+            if state is None:
+                from transformers import CLIPProcessor, CLIPModel
+                model = CLIPModel.from_pretrained(_CLIP_MODEL_ID).to(device).eval()
+                # Only the image tower runs per call (text features are cached)
+                model.get_image_features = maybe_compile(model.get_image_features, device)
+                proc = CLIPProcessor.from_pretrained(_CLIP_MODEL_ID)
+                state = _clip_state[key] = (model, proc)
+    return state
+
+# Prompts tuned for music-control semantics (edit freely)
+_PROMPTS: Tuple[str, ...] = (
+    "a dark nightclub scene", "a bright sunny outdoor scene", "a tense dramatic scene",
+    "a nostalgic vintage photo", "a futuristic cyberpunk scene", "a calm meditative scene",
+    "a chaotic crowded scene", "an intimate portrait", "a lonely empty street at night",
+    "a 1990s aesthetic", "a 2000s aesthetic", "a 2010s aesthetic", "a 2020s aesthetic",
+)
+
+_ERA_NAMES: Tuple[str, ...] = ("1990s", "2000s", "2010s", "2020s")
+# Position of each era's prompt in _PROMPTS (None if edited out)
+_ERA_IDX: Tuple[Optional[int], ...] = tuple(
+    _PROMPTS.index(f"a {e} aesthetic") if f"a {e} aesthetic" in _PROMPTS else None
+    for e in _ERA_NAMES
+)
+
+# (model id, device, prompts) -> L2-normalized text embeddings (P, D)
+_text_features: Dict[Tuple[str, str, Tuple[str, ...]], Any] = {}
+
+def _get_text_features(model: Any, proc: Any, prompts: Tuple[str, ...], device: str) -> Any:
+    """Text-tower output for a prompt list, computed once per model/device."""
+    key = (_CLIP_MODEL_ID, device, prompts)
+    feats = _text_features.get(key)
+    if feats is None:
+        import torch
+        with _clip_lock:
+            feats = _text_features.get(key)
+            if feats is None:
+                inputs = proc(text=list(prompts), return_tensors="pt", padding=True).to(device)
+                with torch.inference_mode():
+                    feats = model.get_text_features(**inputs)
+                feats = _text_features[key] = feats / feats.norm(dim=-1, keepdim=True)
+    return feats
 
 @dataclass
-class ClipProvider(SemanticProvider):
+class ClipProvider(CachedStatus, SemanticProvider):
     """
     CLIP-based tags: scene/object vibes + time-era cues when possible.
     Requires: torch, transformers, pillow
@@ -13,7 +70,7 @@ class ClipProvider(SemanticProvider):
     """
     name: str = "clip"
 
-    def status(self) -> ProviderStatus:
+    def _probe(self) -> ProviderStatus:
         try:
             import torch  # noqa
             import transformers  # noqa
@@ -27,65 +84,47 @@ class ClipProvider(SemanticProvider):
             return {}
         import torch
         from PIL import Image
-        from transformers import CLIPProcessor, CLIPModel
-        import numpy as np
         import cv2
 
         device = "cuda" if torch.cuda.is_available() else "cpu"
-        model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32").to(device)
-        proc = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
-
-        # Prompts tuned for music-control semantics (edit freely)
-        prompts = [
-            "a dark nightclub scene", "a bright sunny outdoor scene", "a tense dramatic scene",
-            "a nostalgic vintage photo", "a futuristic cyberpunk scene", "a calm meditative scene",
-            "a chaotic crowded scene", "an intimate portrait", "a lonely empty street at night",
-            "a 1990s aesthetic", "a 2000s aesthetic", "a 2010s aesthetic", "a 2020s aesthetic",
-        ]
-
-        def score_image(img: Image.Image) -> Dict[str, float]:
-            inputs = proc(text=prompts, images=img, return_tensors="pt", padding=True).to(device)
-            with torch.no_grad():
-                logits = model(**inputs).logits_per_image[0]
-            probs = torch.softmax(logits, dim=0).detach().cpu().numpy()
-            return {prompts[i]: float(probs[i]) for i in range(len(prompts))}
+        model, proc = _get_clip(device)
+
+        prompts = _PROMPTS
+        text_feats = _get_text_features(model, proc, prompts, device)
+
+        def score_images(imgs: List[Image.Image]) -> List[float]:
+            # Image tower only, all frames in one batch; same similarity as
+            # CLIPModel.forward's logits_per_image. Per-frame softmax, then mean.
+            # fp16 on CUDA is plenty for a softmax ranking over 13 prompts
+            pixel_values = proc(images=imgs, return_tensors="pt").pixel_values.to(device)
+            with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16, enabled=device == "cuda"):
+                img_feats = model.get_image_features(pixel_values=pixel_values)
+                img_feats = img_feats / img_feats.norm(dim=-1, keepdim=True)
+                logits = model.logit_scale.exp() * img_feats @ text_feats.T
+                # the only device -> host transfer: one float per prompt
+                return torch.softmax(logits.float(), dim=1).mean(dim=0).tolist()
 
         if kind == "image":
             img = Image.open(path).convert("RGB")
-            scores = score_image(img)
+            probs = score_images([img])
         else:
             # video: sample N frames
             cap = cv2.VideoCapture(path)
             if not cap.isOpened():
                 return {}
-            frames = []
             total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
             picks = [int(total * r) for r in (0.2, 0.5, 0.8)] if total > 0 else [0, 30, 60]
-            for idx in picks:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-                ok, bgr = cap.read()
-                if ok and bgr is not None:
-                    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-                    frames.append(Image.fromarray(rgb))
+            frames = [Image.fromarray(rgb) for rgb in read_rgb_frames(cap, picks)]
             cap.release()
             if not frames:
                 return {}
-            agg: Dict[str, float] = {p: 0.0 for p in prompts}
-            for f in frames:
-                s = score_image(f)
-                for k, v in s.items():
-                    agg[k] += v
-            scores = {k: v / len(frames) for k, v in agg.items()}
-
-        # Extract "era" distribution if present
-        era = {
-            "1990s": scores.get("a 1990s aesthetic", 0.0),
-            "2000s": scores.get("a 2000s aesthetic", 0.0),
-            "2010s": scores.get("a 2010s aesthetic", 0.0),
-            "2020s": scores.get("a 2020s aesthetic", 0.0),
-        }
-        s = sum(era.values())
-        era = {k: (v / s if s > 1e-9 else 0.0) for k, v in era.items()}
-
-        top = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:6]
-        return {"top_tags": top, "era_dist": era, "raw": scores}
+            probs = score_images(frames)
+
+        # Extract "era" distribution if present (by prompt position)
+        era_vals = [probs[i] if i is not None else 0.0 for i in _ERA_IDX]
+        s = sum(era_vals)
+        era = dict(zip(_ERA_NAMES, [v / s if s > 1e-9 else 0.0 for v in era_vals]))
+
+        order = sorted(range(len(prompts)), key=probs.__getitem__, reverse=True)[:6]
+        top = [(prompts[i], probs[i]) for i in order]
+        return {"top_tags": top, "era_dist": era, "raw": dict(zip(prompts, probs))}
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
 from .providers.base import MediaKind, ProviderStatus, SemanticProvider
@@ -15,7 +16,7 @@ class SemanticEngine:
     providers: List[SemanticProvider] = field(default_factory=list)
 
     def capabilities(self) -> Dict[str, Any]:
-        sts = [p.status().__dict__ for p in self.providers]
+        sts = [asdict(p.status()) for p in self.providers]
         return {
             "providers": sts,
             "available": [s["name"] for s in sts if s["available"]],
@@ -23,16 +24,28 @@ class SemanticEngine:
         }
 
     def analyze(self, *, kind: MediaKind, path: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        out: Dict[str, Any] = {}
-        for p in self.providers:
-            st = p.status()
-            if not st.available:
-                continue
+        """
+        Providers are independent and spend their time in native code
+        (decode, torch, librosa), so they run on a thread pool; results are
+        merged in provider order.
+        """
+        active = [p for p in self.providers if p.status().available]
+
+        def run(p: SemanticProvider) -> Dict[str, Any]:
             try:
-                result = p.analyze(kind=kind, path=path, context=context)
-                if result:
-                    out[p.name] = result
+                return p.analyze(kind=kind, path=path, context=context)
             except Exception as e:
                 # Log but don't crash entire analysis
-                out[p.name] = {"error": str(e)}
+                return {"error": str(e)}
+
+        if len(active) > 1:
+            with ThreadPoolExecutor(max_workers=len(active)) as ex:
+                results = list(ex.map(run, active))
+        else:
+            results = [run(p) for p in active]
+
+        out: Dict[str, Any] = {}
+        for p, result in zip(active, results):
+            if result:
+                out[p.name] = result
         return out
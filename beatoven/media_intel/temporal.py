@@ -1,32 +1,52 @@
 from __future__ import annotations
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple, Union
 import numpy as np
 
-def summarize_emotion_trajectory(arousal_series: list[float], valence_series: list[float]) -> Dict[str, float]:
+from beatoven._numba import njit
+
+@njit(cache=True)
+def _pack_kernel(x):
+    """(drift, volatility, peakiness) of one series."""
+    return x[-1] - x[0], np.std(np.diff(x)), np.max(x) - np.mean(x)
+
+def summarize_emotion_trajectory(
+    arousal_series: Union[Sequence[float], np.ndarray],
+    valence_series: Union[Sequence[float], np.ndarray],
+) -> Dict[str, float]:
     """
     Turns time series into stable descriptors:
     - drift
     - volatility
     - peakiness
+    Series may be lists or 1-D arrays (e.g. columns of a batched affect array).
     """
     if len(arousal_series) < 2:
         return {"arousal_drift": 0.0, "arousal_vol": 0.0, "arousal_peak": 0.0,
                 "valence_drift": 0.0, "valence_vol": 0.0, "valence_peak": 0.0}
 
-    a = np.array(arousal_series, dtype=np.float32)
-    v = np.array(valence_series, dtype=np.float32)
-
-    def pack(x: np.ndarray, name: str) -> Dict[str, float]:
-        drift = float(x[-1] - x[0])
-        vol = float(np.std(np.diff(x)))
-        peak = float(np.max(x) - np.mean(x))
-        return {f"{name}_drift": drift, f"{name}_vol": vol, f"{name}_peak": peak}
+    a = np.asarray(arousal_series, dtype=np.float32)
+    v = np.asarray(valence_series, dtype=np.float32)
 
     out = {}
-    out.update(pack(a, "arousal"))
-    out.update(pack(v, "valence"))
+    for name, x in (("arousal", a), ("valence", v)):
+        drift, vol, peak = _pack_kernel(x)
+        out[f"{name}_drift"] = float(drift)
+        out[f"{name}_vol"] = float(vol)
+        out[f"{name}_peak"] = float(peak)
     return out
 
+_ERAS = ("1990s", "2000s", "2010s", "2020s")
+
+@njit(cache=True)
+def _era_kernel(sharp):
+    """Unnormalized era weights, in _ERAS order."""
+    # Film-ish look: lower sharpness + moderate saturation -> older vibe (very weak)
+    p_1990s = max(0.0, (0.6 - sharp)) * 0.6
+    p_2000s = max(0.0, (0.5 - sharp)) * 0.4
+    p_2010s = max(0.0, sharp - 0.4) * 0.6
+    p_2020s = max(0.0, sharp - 0.6) * 0.7
+    return p_1990s, p_2000s, p_2010s, p_2020s
+
 def infer_era_from_heuristics(physical: Dict[str, float], semantic: Dict[str, object]) -> Tuple[Dict[str, float], float]:
     """
     Deterministic era prior.
@@ -37,19 +57,14 @@ def infer_era_from_heuristics(physical: Dict[str, float], semantic: Dict[str, ob
     sharp = float(physical.get("sharpness", 0.0))
     sat = float(physical.get("sat_mean", 0.0))
 
-    # Film-ish look: lower sharpness + moderate saturation -> older vibe (very weak)
-    p_1990s = max(0.0, (0.6 - sharp)) * 0.6
-    p_2000s = max(0.0, (0.5 - sharp)) * 0.4
-    p_2010s = max(0.0, sharp - 0.4) * 0.6
-    p_2020s = max(0.0, sharp - 0.6) * 0.7
-
-    vec = {"1990s": p_1990s, "2000s": p_2000s, "2010s": p_2010s, "2020s": p_2020s}
-    s = sum(vec.values())
+    probs = _era_kernel(sharp)
+    p_1990s, p_2000s, p_2010s, p_2020s = probs
+    s = p_1990s + p_2000s + p_2010s + p_2020s
     if s <= 1e-9:
         return {"unknown": 1.0}, 0.05
-    vec = {k: v/s for k, v in vec.items()}
+    vec = {k: p/s for k, p in zip(_ERAS, probs)}
 
     # confidence rises if distribution is peaky
-    conf = float(max(vec.values()))
+    conf = max(probs) / s
     conf = max(0.05, min(0.65, conf))
     return vec, conf
@@ -67,3 +67,18 @@ def test_affect_dark_low_valence():
 
     # Expect lower valence
     assert affect["valence"] < 0.55
+
+
+def test_affect_batch_matches_scalar():
+    """Batch rows equal the per-frame scalar results, defaults included."""
+    import numpy as np
+    from beatoven.media_intel.affect import AFFECT_KEYS, affect_from_features_batch
+
+    rng = np.random.default_rng(0)
+    soa = {k: rng.uniform(0.0, 1.0, 16) for k in ("luma_mean", "luma_var", "sat_mean", "edge_density")}
+    batch = affect_from_features_batch(soa)
+    assert batch.shape == (16, len(AFFECT_KEYS))
+
+    for i in range(16):
+        affect, _ = affect_from_features({k: float(v[i]) for k, v in soa.items()}, {})
+        assert batch[i].tolist() == [affect[k] for k in AFFECT_KEYS]
@@ -0,0 +1,31 @@
+import json
+
+from beatoven.media_intel.capabilities import compute_capabilities
+from beatoven.media_intel.semantic_engine import SemanticEngine
+from beatoven.media_intel.tests.test_semantic_engine import MockProvider
+
+
+def test_capabilities_track_provider_list():
+    """Results reflect the engine's current providers."""
+    engine = SemanticEngine(providers=[MockProvider(available=False)])
+    caps = compute_capabilities(engine)
+    assert caps.semantic["available"] == []
+    assert caps.binaural["available"] is True
+    assert caps.binaural["modes"] == ["render_fx", "stream_fx"]
+
+    engine.providers.append(MockProvider(available=True))
+    assert compute_capabilities(engine).semantic["available"] == ["mock"]
+
+
+def test_capabilities_are_plain_private_copies():
+    """Results serialize as JSON, and mutating one never leaks into the next."""
+    engine = SemanticEngine(providers=[MockProvider(available=True)])
+    caps = compute_capabilities(engine)
+    json.dumps({"semantic": caps.semantic, "binaural": caps.binaural})
+
+    caps.semantic["available"].append("bogus")
+    caps.binaural["safety"]["max_beat_hz"] = 1e6
+
+    fresh = compute_capabilities(engine)
+    assert fresh.semantic["available"] == ["mock"]
+    assert fresh.binaural["safety"]["max_beat_hz"] == 40.0
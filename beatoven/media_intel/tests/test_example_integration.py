@@ -0,0 +1,65 @@
+import pytest
+
+from beatoven.dspcoffee_bridge import transport_serial
+from beatoven.media_intel import example_integration
+from beatoven.media_intel.example_integration import MediaDrivenBridge
+from beatoven.media_intel.schema import MediaFrame
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Offline bridge: fake serial port, analysis stubbed and counted."""
+    monkeypatch.setattr(transport_serial.serial, "Serial", lambda **kw: object())
+    calls = []
+
+    def fake_analyze_image(path, media_id):
+        calls.append(path)
+        return MediaFrame(media_id=media_id, kind="image", path=path,
+                          physical={"luma_mean": 0.5}, affect={"valence": 0.6})
+
+    monkeypatch.setattr(example_integration, "analyze_image", fake_analyze_image)
+    return calls
+
+
+@pytest.fixture
+def media(tmp_path):
+    p = tmp_path / "a.png"
+    p.write_bytes(b"same bytes")
+    return str(p)
+
+
+def test_memory_hit_returns_private_copy(calls, media):
+    bridge = MediaDrivenBridge()
+    first = bridge._analyze(media, "image", "m1")
+    first.affect["valence"] = -1.0  # caller mutation must not reach the cache
+
+    second = bridge._analyze(media, "image", "m2")
+    assert len(calls) == 1
+    assert second.media_id == "m2"
+    assert second.affect["valence"] == 0.6
+
+
+def test_disk_hit_from_second_bridge(calls, media, tmp_path):
+    cache_dir = tmp_path / "cache"
+    MediaDrivenBridge(cache_dir=str(cache_dir))._analyze(media, "image", "m1")
+    assert [p.suffix for p in cache_dir.iterdir()] == [".pkl"]
+
+    frame = MediaDrivenBridge(cache_dir=str(cache_dir))._analyze(media, "image", "m2")
+    assert len(calls) == 1
+    assert frame.media_id == "m2"
+    assert frame.physical == {"luma_mean": 0.5}
+
+
+def test_corrupt_disk_entry_is_a_miss(calls, media, tmp_path):
+    cache_dir = tmp_path / "cache"
+    MediaDrivenBridge(cache_dir=str(cache_dir))._analyze(media, "image", "m1")
+    (pkl,) = cache_dir.iterdir()
+    pkl.write_bytes(pkl.read_bytes()[:10])  # truncated write
+
+    frame = MediaDrivenBridge(cache_dir=str(cache_dir))._analyze(media, "image", "m2")
+    assert len(calls) == 2
+    assert frame.media_id == "m2"
+    # re-analysis rewrote a loadable entry, with no temp files left behind
+    assert [p.name for p in cache_dir.iterdir()] == [pkl.name]
+    MediaDrivenBridge(cache_dir=str(cache_dir))._analyze(media, "image", "m3")
+    assert len(calls) == 2
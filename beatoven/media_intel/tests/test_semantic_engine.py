@@ -81,3 +81,78 @@ def test_semantic_engine_skip_unavailable():
 
     assert "available" in result
     assert "unavailable" not in result
+
+
+def test_semantic_engine_concurrent_providers():
+    """Providers run side by side; results keep provider order and errors stay per provider."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class WaitingProvider(MockProvider):
+        def analyze(self, *, kind, path, context=None):
+            barrier.wait()  # only passes if both providers run at once
+            return {"kind": kind}
+
+    class FailingProvider(MockProvider):
+        def analyze(self, *, kind, path, context=None):
+            raise RuntimeError("boom")
+
+    a, b, bad = WaitingProvider(), WaitingProvider(), FailingProvider()
+    a.name, b.name, bad.name = "a", "b", "bad"
+    engine = SemanticEngine(providers=[a, bad, b])
+
+    result = engine.analyze(kind="video", path="/fake/path.mp4")
+
+    assert list(result) == ["a", "bad", "b"]
+    assert result["a"] == {"kind": "video"}
+    assert result["bad"] == {"error": "boom"}
+
+
+def test_cached_status_probes_once():
+    """CachedStatus providers probe availability once until refreshed."""
+    from beatoven.media_intel.providers.base import CachedStatus
+
+    class CountingProvider(CachedStatus):
+        name = "counting"
+        probes = 0
+
+        def _probe(self) -> ProviderStatus:
+            self.probes += 1
+            return ProviderStatus(name=self.name, available=True)
+
+        def analyze(self, *, kind, path, context=None):
+            return {"ok": True}
+
+    provider = CountingProvider()
+    engine = SemanticEngine(providers=[provider])
+    engine.analyze(kind="image", path="/fake/path.jpg")
+    engine.analyze(kind="image", path="/fake/path.jpg")
+    engine.capabilities()
+    assert provider.probes == 1
+
+    provider.refresh_status()
+    assert provider.status().available
+    assert provider.probes == 2
+
+
+def test_capabilities_do_not_alias_cached_status():
+    """Editing the capabilities dict leaves a provider's cached status intact."""
+    from beatoven.media_intel.providers.base import CachedStatus
+
+    class MissingDepProvider(CachedStatus):
+        name = "missing"
+
+        def _probe(self) -> ProviderStatus:
+            return ProviderStatus(name=self.name, available=False, reason="No module named 'x'")
+
+        def analyze(self, *, kind, path, context=None):
+            raise AssertionError("unavailable provider was run")
+
+    provider = MissingDepProvider()
+    engine = SemanticEngine(providers=[provider])
+    caps = engine.capabilities()
+    caps["providers"][0]["available"] = True
+
+    assert provider.status().available is False
+    assert engine.analyze(kind="image", path="/fake/path.jpg") == {}
@@ -31,6 +31,14 @@ def test_emotion_trajectory_drift():
     assert traj["arousal_vol"] > 0.0
 
 
+
+def test_emotion_trajectory_accepts_arrays():
+    """Array columns give the same descriptors as lists."""
+    import numpy as np
+    affect = np.array([[0.2, 0.3], [0.4, 0.3], [0.7, 0.2], [0.5, 0.3]])
+    traj = summarize_emotion_trajectory(affect[:, 0], affect[:, 1])
+    assert traj == summarize_emotion_trajectory(affect[:, 0].tolist(), affect[:, 1].tolist())
+
 def test_infer_era_basic():
     """Era inference should return distribution and confidence."""
     physical = {"sharpness": 0.5, "sat_mean": 0.4}
@@ -9,17 +9,26 @@ def media_to_resonance(m: MediaFrame) -> ResonanceFrame:
     Converts MediaFrame → ResonanceFrame.
     Rhythm tokens may be absent; BeatOven can later generate patterns from affect.
     """
-    a = m.affect
+    # Each input is looked up once
+    a, phys = m.affect, m.physical
+    arousal = a.get("arousal", 0.5)
+    dominance = a.get("dominance", 0.5)
+    dread = a.get("dread", 0.2)
+    edge = phys.get("edge_density", 0.1)
+    luma_var = phys.get("luma_var", 0.1)
+    jitter = phys.get("jitter", 0.0)
+    motion = phys.get("motion_energy", 0.0)
+
     # Map affect → resonance metrics (deterministic)
     metrics = ResonanceMetrics(
-        complexity=float(min(1.0, 0.25 + 0.5*m.physical.get("edge_density", 0.1) + 0.3*m.physical.get("luma_var", 0.1))),
-        emotional_intensity=float(a.get("arousal", 0.5)),
-        groove=float(min(1.0, 0.35 + 0.45*a.get("dominance", 0.5) + 0.20*(1.0 - m.physical.get("jitter", 0.0)))),
-        energy=float(min(1.0, 0.40 + 0.60*a.get("arousal", 0.5))),
-        density=float(min(1.0, 0.30 + 0.45*m.physical.get("edge_density", 0.1) + 0.25*m.physical.get("motion_energy", 0.0))),
-        swing=float(min(1.0, 0.25 + 0.65*m.physical.get("jitter", 0.0))),  # shaky cam → swing bias (tunable)
-        brightness=float(m.physical.get("luma_mean", 0.5)),
-        tension=float(min(1.0, 0.20 + 0.65*a.get("dread", 0.2) + 0.15*m.physical.get("luma_var", 0.1))),
+        complexity=float(min(1.0, 0.25 + 0.5*edge + 0.3*luma_var)),
+        emotional_intensity=float(arousal),
+        groove=float(min(1.0, 0.35 + 0.45*dominance + 0.20*(1.0 - jitter))),
+        energy=float(min(1.0, 0.40 + 0.60*arousal)),
+        density=float(min(1.0, 0.30 + 0.45*edge + 0.25*motion)),
+        swing=float(min(1.0, 0.25 + 0.65*jitter)),  # shaky cam → swing bias (tunable)
+        brightness=float(phys.get("luma_mean", 0.5)),
+        tension=float(min(1.0, 0.20 + 0.65*dread + 0.15*luma_var)),
     ).clamp01()
 
     extras = {
@@ -0,0 +1,36 @@
+"""Tests for DeviceManager device detection."""
+
+import pytest
+
+from beatoven.gpu import device_utils
+from beatoven.gpu.device_utils import DeviceManager, DeviceType
+
+
+@pytest.fixture
+def two_gpus(monkeypatch):
+    """Two CUDA devices reported; properties of device 0 fail to load."""
+    monkeypatch.setattr(device_utils, "_has_module", lambda name: name == "torch")
+    monkeypatch.setattr(device_utils, "_probe_torch", lambda: (2, False))
+
+    def props(i):
+        if i == 0:
+            raise RuntimeError("CUDA driver error")
+        return ("Fake GPU", 8 << 30, 8, 6)
+
+    monkeypatch.setattr(device_utils, "_cuda_props", props)
+
+
+def test_failed_cuda_probe_falls_back_to_cpu(two_gpus):
+    dm = DeviceManager()
+    assert dm.get_device().device_type == DeviceType.CPU
+    assert dm.get_device_string() == "cpu"
+    assert not dm.is_gpu_available()
+
+
+def test_failed_cuda_device_is_skipped_in_listing(two_gpus):
+    dm = DeviceManager()
+    cuda = [d for d in dm.list_devices() if d.device_type == DeviceType.CUDA]
+    assert [d.device_id for d in cuda] == [1]
+    assert not dm.set_device(DeviceType.CUDA, 0)
+    assert dm.set_device(DeviceType.CUDA, 1)
+    assert dm.get_device_string() == "cuda:1"
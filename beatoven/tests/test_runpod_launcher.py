@@ -0,0 +1,131 @@
+"""Tests for RunpodLauncher."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from beatoven.gpu.runpod_launcher import (
+    RunpodConfig, RunpodJob, RunpodLauncher, RunpodStatus, _JobTable
+)
+
+
+@pytest.fixture
+def launcher(monkeypatch):
+    monkeypatch.delenv("RUNPOD_API_KEY", raising=False)
+    return RunpodLauncher()
+
+
+class TestJobIds:
+    """Job ids are a canonical hash of the input."""
+
+    def test_key_order_does_not_matter(self, launcher):
+        a = launcher.create_job({"seed": "s", "bpm": 120})
+        b = launcher.create_job({"bpm": 120, "seed": "s"})
+        assert a.job_id == b.job_id
+        assert len(a.job_id) == 16
+
+    def test_numpy_values_hash_like_python(self, launcher):
+        py = launcher.create_job({"gain": 0.5, "steps": [1, 2], "n": 3})
+        npy = launcher.create_job({"gain": np.float32(0.5), "steps": np.array([1, 2]), "n": np.int64(3)})
+        assert py.job_id == npy.job_id
+
+
+class TestJobTable:
+    """Statuses live in the launcher's table and stay in step with jobs."""
+
+    def test_assigning_status_updates_table(self, launcher):
+        job = launcher.create_job({"seed": "s"})
+        job.status = RunpodStatus.RUNNING
+        assert launcher.get_job_status(job.job_id) is RunpodStatus.RUNNING
+        assert launcher.count_jobs(RunpodStatus.RUNNING) == 1
+
+        job.status = RunpodStatus.COMPLETED
+        assert launcher.get_job_status(job.job_id) is RunpodStatus.COMPLETED
+        assert launcher.wait_for_completion(job.job_id, timeout_seconds=0) is job
+
+    def test_constructor_takes_status(self):
+        job = RunpodJob(
+            job_id="a", status=RunpodStatus.FAILED, config=RunpodConfig(), input_data={}
+        )
+        assert job.status is RunpodStatus.FAILED
+        assert job._done.is_set()
+        assert job.to_dict()["status"] == "failed"
+
+    def test_put_overwrites_existing_id(self):
+        table = _JobTable()
+        first = RunpodJob(
+            job_id="a", status=RunpodStatus.PENDING, config=RunpodConfig(), input_data={}
+        )
+        table.put(first)
+        table.set_status(first, RunpodStatus.RUNNING)
+
+        second = RunpodJob(
+            job_id="a", status=RunpodStatus.PENDING, config=RunpodConfig(), input_data={}
+        )
+        table.put(second)
+        assert table.get("a") is second
+        assert table.status("a") is RunpodStatus.PENDING
+        assert len(table.ids) == 1
+
+        # The replaced job no longer writes to the row
+        first.status = RunpodStatus.FAILED
+        assert table.status("a") is RunpodStatus.PENDING
+
+    def test_grows_past_initial_capacity(self, launcher):
+        jobs = [launcher.create_job({"i": i}) for i in range(150)]
+        for job in jobs[::3]:
+            launcher.submit_job(job)
+
+        assert launcher.count_jobs(RunpodStatus.RUNNING) == 50
+        assert launcher.count_jobs(RunpodStatus.PENDING) == 100
+        for job in jobs:
+            assert launcher.get_job(job.job_id) is job
+            assert launcher.get_job_status(job.job_id) is job.status
+
+    def test_set_status_updates_job_and_counts(self, launcher):
+        job = launcher.create_job({"seed": "s"})
+        launcher.submit_job(job)
+        assert job.status is RunpodStatus.RUNNING
+        assert not job._done.is_set()
+
+        assert launcher.cancel_job(job.job_id)
+        assert job.status is RunpodStatus.CANCELLED
+        assert launcher.get_job_status(job.job_id) is RunpodStatus.CANCELLED
+        assert launcher.count_jobs(RunpodStatus.RUNNING) == 0
+        assert launcher.count_jobs(RunpodStatus.CANCELLED) == 1
+        assert job._done.is_set()
+
+
+class TestWaitForCompletion:
+    """wait_for_completion blocks on the job's completion event."""
+
+    def test_local_mode_completes(self, launcher):
+        job = launcher.create_job({"seed": "s"})
+        done = launcher.wait_for_completion(job.job_id, timeout_seconds=1)
+        assert done is job
+        assert job.status is RunpodStatus.COMPLETED
+        assert job.output_data == {"simulated": True, "input": {"seed": "s"}}
+
+    def test_unknown_job(self, launcher):
+        assert launcher.wait_for_completion("missing", timeout_seconds=0) is None
+
+    def test_times_out_when_not_finished(self):
+        launcher = RunpodLauncher(api_key="key")
+        job = launcher.create_job({"seed": "s"})
+        launcher.submit_job(job)
+        assert launcher.wait_for_completion(job.job_id, timeout_seconds=0.05) is None
+        assert job.status is RunpodStatus.RUNNING
+
+    def test_wakes_when_finished_from_another_thread(self):
+        launcher = RunpodLauncher(api_key="key")
+        job = launcher.create_job({"seed": "s"})
+        launcher.submit_job(job)
+
+        timer = threading.Timer(0.05, launcher._jobs.set_status, (job, RunpodStatus.FAILED))
+        timer.start()
+        try:
+            assert launcher.wait_for_completion(job.job_id, timeout_seconds=5) is job
+        finally:
+            timer.join()
+        assert job.status is RunpodStatus.FAILED
@@ -89,6 +89,19 @@ class TestStemGenerator:
                     stems2[stem_type].samples
                 )
 
+    def test_time_base_cache_bounded_and_read_only(self):
+        from beatoven.core.stems import _time_base
+
+        _time_base.cache_clear()
+        gen = StemGenerator()
+        for duration in (0.5, 1.0, 1.5, 2.0, 2.5, 3.0):
+            gen.generate_stems(duration=duration)
+
+        assert _time_base.cache_info().currsize <= 4
+        t, two_pi_t = _time_base(gen.sample_rate, gen.sample_rate)
+        assert not t.flags.writeable
+        assert not two_pi_t.flags.writeable
+
     def test_wav_export(self):
         generator = StemGenerator(seed=42)
         stems = generator.generate_stems(
@@ -118,6 +131,25 @@ class TestStemGenerator:
                 expected_file = Path(tmpdir) / f"test_{stem_type.value}.wav"
                 assert expected_file.exists()
 
+    def test_flac_export(self):
+        sf = pytest.importorskip("soundfile")
+        generator = StemGenerator(seed=42)
+        stems = generator.generate_stems(
+            duration=1.0,
+            stem_types=[StemType.BASS, StemType.LEADS]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hashes = generator.export_all(
+                stems, Path(tmpdir), prefix="test", fmt=ExportFormat.FLAC
+            )
+
+            assert len(hashes) == len(stems)
+            path = Path(tmpdir) / "test_bass.flac"
+            data, sample_rate = sf.read(str(path))
+            assert sample_rate == 44100
+            assert data.shape == (44100, 2)
+
 
 class TestMelSpectrogram:
     """Tests for MelSpectrogram computation."""
@@ -152,6 +184,22 @@ class TestMelSpectrogram:
         assert mel.n_fft == 1024
         assert mel.data.shape[0] == 64
 
+    def test_torch_backend_matches_numpy(self):
+        pytest.importorskip("torch")
+        numpy_gen = StemGenerator(seed=42, backend="numpy")
+        torch_gen = StemGenerator(seed=42, backend="torch")
+        stems = numpy_gen.generate_stems(
+            duration=1.0,
+            stem_types=[StemType.BASS]
+        )
+
+        expected = numpy_gen.compute_mel_spectrogram(stems[StemType.BASS]).data
+        actual = torch_gen.compute_mel_spectrogram(stems[StemType.BASS]).data
+
+        assert actual.shape == expected.shape
+        audible = expected > expected.max() - 80
+        np.testing.assert_allclose(actual[audible], expected[audible], atol=1e-2)
+
 
 class TestStemType:
     """Tests for StemType enum."""
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from beatoven.core.timbre import (
     TimbreEngine, TimbrePatch, AudioBuffer,
-    Oscillator, Filter, Reverb, Delay,
+    Oscillator, Filter, GranularSynth, Reverb, Delay,
     WaveShape, FilterType
 )
 
@@ -32,6 +32,14 @@ class TestAudioBuffer:
         stereo = buffer.to_stereo()
 
         assert stereo.channels == 2
+        assert stereo.samples.shape == (2, 100)
+        assert stereo.duration == buffer.duration
+
+    def test_samples_are_float32(self):
+        buffer = AudioBuffer(np.zeros(16, dtype=np.float64))
+
+        assert buffer.samples.dtype == np.float32
+        assert buffer.samples.flags.c_contiguous
 
 
 class TestOscillator:
@@ -59,6 +67,50 @@ class TestOscillator:
 
         assert output.samples.max() <= 0.5
 
+    def test_sine_matches_reference(self):
+        osc = Oscillator(shape=WaveShape.SINE, frequency=440.0, phase=0.25)
+        buffer = AudioBuffer(np.zeros(4096, dtype=np.float32), 44100)
+        output = osc.process(buffer)
+
+        t = np.arange(4096) / 44100
+        expected = np.sin(2 * np.pi * 440.0 * t + 0.25)
+        np.testing.assert_allclose(output.samples, expected, atol=1e-4)
+
+    @pytest.mark.parametrize("frequency", [-440.0, 30000.0, 50000.0, 97000.0])
+    def test_sine_out_of_range_frequency_matches_reference(self, frequency):
+        """Negative and above-Nyquist frequencies alias like np.sin does."""
+        osc = Oscillator(shape=WaveShape.SINE, frequency=frequency, phase=0.25)
+        buffer = AudioBuffer(np.zeros(4096, dtype=np.float32), 44100)
+        output = osc.process(buffer)
+
+        t = np.arange(4096) / 44100
+        expected = np.sin(2 * np.pi * frequency * t + 0.25)
+        np.testing.assert_allclose(output.samples, expected, atol=1e-4)
+
+    def test_phase_continues_across_blocks(self):
+        buffer = AudioBuffer(np.zeros(1000, dtype=np.float32), 44100)
+        osc = Oscillator(shape=WaveShape.SINE, frequency=330.0)
+        blocks = np.concatenate([
+            osc.process(buffer).samples, osc.process(buffer).samples
+        ])
+
+        whole = Oscillator(shape=WaveShape.SINE, frequency=330.0).process(
+            AudioBuffer(np.zeros(2000, dtype=np.float32), 44100)
+        )
+        np.testing.assert_allclose(blocks, whole.samples, atol=1e-4)
+
+    @pytest.mark.parametrize("shape", [WaveShape.SAW, WaveShape.SQUARE, WaveShape.PULSE])
+    def test_integer_phase_exact_across_blocks(self, shape):
+        """Block-by-block output of the non-sine shapes matches one long block."""
+        buffer = AudioBuffer(np.zeros(333, dtype=np.float32), 44100)
+        osc = Oscillator(shape=shape, frequency=317.0, pulse_width=0.3)
+        blocks = np.concatenate([osc.process(buffer).samples for _ in range(30)])
+
+        whole = Oscillator(shape=shape, frequency=317.0, pulse_width=0.3).process(
+            AudioBuffer(np.zeros(333 * 30, dtype=np.float32), 44100)
+        )
+        np.testing.assert_array_equal(blocks, whole.samples)
+
 
 class TestFilter:
     """Tests for Filter."""
@@ -87,6 +139,82 @@ class TestFilter:
 
         assert output.samples.shape == (1024,)
 
+    def test_coefficients_cached_until_params_change(self):
+        filt = Filter(cutoff=800.0)
+        buffer = AudioBuffer(np.zeros(64, dtype=np.float32), 44100)
+
+        filt.process(buffer)
+        coefs = filt._coefs
+        filt.process(buffer)
+        assert filt._coefs is coefs
+
+        filt.process(buffer, cutoff=1200.0)
+        assert filt._coefs != coefs
+
+    def test_state_carries_across_blocks(self):
+        samples = np.random.uniform(-1, 1, 2048).astype(np.float32)
+
+        whole = Filter(cutoff=800.0).process(AudioBuffer(samples, 44100))
+
+        blocked = Filter(cutoff=800.0)
+        first = blocked.process(AudioBuffer(samples[:1024], 44100))
+        second = blocked.process(AudioBuffer(samples[1024:], 44100))
+
+        np.testing.assert_allclose(
+            np.concatenate([first.samples, second.samples]),
+            whole.samples,
+            atol=1e-5
+        )
+
+
+class TestGranularSynth:
+    """Tests for GranularSynth."""
+
+    def test_default_source(self):
+        gran = GranularSynth(grain_size_ms=20.0, grain_density=20.0)
+        buffer = AudioBuffer(np.zeros(44100, dtype=np.float32), 44100)
+        output = gran.process(buffer)
+
+        assert output.samples.shape == (44100,)
+        assert output.samples.dtype == np.float32
+        assert np.abs(output.samples).max() == pytest.approx(0.8)
+
+    def test_deterministic(self):
+        source = np.random.uniform(-1, 1, 8000).astype(np.float32)
+        buffer = AudioBuffer(np.zeros(22050, dtype=np.float32), 44100)
+
+        outputs = []
+        for _ in range(2):
+            gran = GranularSynth(position=0.5, randomness=0.3)
+            gran.set_source(source)
+            outputs.append(gran.process(buffer).samples)
+
+        np.testing.assert_array_equal(outputs[0], outputs[1])
+
+
+class TestStereoEffects:
+    """Effects process (channels, n) buffers channel by channel."""
+
+    @pytest.mark.parametrize("make_fx", [
+        lambda: Filter(cutoff=800.0),
+        lambda: Reverb(room_size=0.5),
+        lambda: Delay(time_ms=5.0),
+    ])
+    def test_matches_mono(self, make_fx):
+        left = np.random.uniform(-1, 1, 2048).astype(np.float32)
+        right = np.random.uniform(-1, 1, 2048).astype(np.float32)
+        stereo = AudioBuffer(np.stack([left, right]), 44100, channels=2)
+
+        output = make_fx().process(stereo)
+
+        assert output.channels == 2
+        assert output.samples.shape == (2, 2048)
+        for ch, mono in enumerate((left, right)):
+            expected = make_fx().process(AudioBuffer(mono, 44100))
+            np.testing.assert_allclose(
+                output.samples[ch], expected.samples, atol=1e-6
+            )
+
 
 class TestReverb:
     """Tests for Reverb effect."""
@@ -122,6 +250,29 @@ class TestDelay:
 
         assert output.samples.shape == (44100,)
 
+    def test_delayed_signal_appears_after_delay_time(self):
+        dly = Delay(time_ms=10.0, feedback=0.0, wet=1.0)
+        samples = np.zeros(1000, dtype=np.float32)
+        samples[0] = 1.0
+        output = dly.process(AudioBuffer(samples, 44100))
+
+        assert output.samples[441] == pytest.approx(1.0)
+        assert np.count_nonzero(output.samples) == 1
+
+    def test_state_carries_across_blocks(self):
+        samples = np.random.uniform(-1, 1, 8000).astype(np.float32)
+        whole = Delay(time_ms=50.0).process(AudioBuffer(samples, 44100))
+
+        blocked = Delay(time_ms=50.0)
+        first = blocked.process(AudioBuffer(samples[:3000], 44100))
+        second = blocked.process(AudioBuffer(samples[3000:], 44100))
+
+        np.testing.assert_allclose(
+            np.concatenate([first.samples, second.samples]),
+            whole.samples,
+            atol=1e-6
+        )
+
 
 class TestTimbreEngine:
     """Tests for TimbreEngine."""
@@ -171,6 +322,24 @@ class TestTimbreEngine:
 
         assert len(patch.provenance_hash) == 64
 
+    @pytest.mark.parametrize("frequency", [440.0, -440.0, 50000.0])
+    def test_fused_sine_path_matches_module_chain(self, monkeypatch, frequency):
+        import beatoven.core.timbre as timbre
+        if not timbre._HAS_NUMBA:
+            pytest.skip("fused path requires numba")
+
+        engine = TimbreEngine(seed=42)
+        fused, _ = engine.generate(
+            frequency=frequency, resonance=0.3, density=0.1, tension=0.6
+        )
+
+        monkeypatch.setattr(timbre, "_HAS_NUMBA", False)
+        chained, _ = engine.generate(
+            frequency=frequency, resonance=0.3, density=0.1, tension=0.6
+        )
+
+        np.testing.assert_allclose(fused.samples, chained.samples, atol=1e-4)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
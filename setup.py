@@ -42,6 +42,8 @@ setup(
         "audio": [
             "scipy>=1.10.0",
             "soundfile>=0.12.0",
+            "numba>=0.57.0",
+            "numexpr>=2.8.0",
         ],
         "hardware": [
             "pyserial>=3.5",
@@ -64,6 +66,8 @@ setup(
             "torchvision>=0.15.0",
             "scipy>=1.10.0",
             "soundfile>=0.12.0",
+            "numba>=0.57.0",
+            "numexpr>=2.8.0",
             "pytest>=7.0.0",
             "httpx>=0.24.0",
             "pyserial>=3.5",